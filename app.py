@@ -12,7 +12,9 @@ from flask import Flask, jsonify, request, send_from_directory
 from flask_cors import CORS
 from loguru import logger
 
-from config import LOG_DIR, STATIC_DIR, ALIGN_DIR, N8N_WEBHOOK_URL, N8N_ASSET_WEBHOOK_URL
+from config import (
+    LOG_DIR, STATIC_DIR, ALIGN_DIR, N8N_WEBHOOK_URL, N8N_ASSET_WEBHOOK_URL, STUDIO_PRELOAD,
+)
 
 # ---------------------------------------------------------------------------
 # Loguru configuration
@@ -93,15 +95,29 @@ def serve_app_assets(filename):
 @app.route("/api/health")
 def health():
     from studio.timing.routes import _check_alignment_available, _find_ffmpeg
-    from studio.tts.routes import _model_files_present
+    from studio.tts import routes as tts_routes
+    block_cache = tts_routes.get_block_cache()
     return jsonify({
         "status": "ok",
         "alignment": _check_alignment_available(),
         "ffmpeg": _find_ffmpeg() is not None,
-        "tts_model": _model_files_present(),
+        "tts_model": tts_routes._model_files_present(),
+        "tts_pool": tts_routes.kokoro_pool.stats() if tts_routes.kokoro_pool else None,
+        "phoneme_cache": tts_routes.get_phoneme_cache().stats(),
+        "tts_block_cache": block_cache.stats() if block_cache else None,
+        "tts_blend_cache": tts_routes.blend_cache_stats(),
+        "tts_stream": tts_routes.stream_stats.stats(),
     })
 
 
+@app.route("/api/ready")
+def ready():
+    """Per-model readiness; 503 while a preload is still in progress."""
+    from studio import warmup
+    status = warmup.readiness()
+    return jsonify(status), 200 if status["ready"] else 503
+
+
 @app.route("/api/open-folder", methods=["POST"])
 def open_folder():
     data = request.get_json(silent=True) or {}
@@ -136,6 +152,8 @@ def find_available_port(start=5050):
 if __name__ == "__main__":
     parser = argparse.ArgumentParser(description="ScriptToScene Studio")
     parser.add_argument("--port", type=int, default=None)
+    parser.add_argument("--preload", action="store_true",
+                        help="load and warm up the TTS and alignment models at startup")
     args = parser.parse_args()
     port = args.port if args.port else find_available_port(5050)
 
@@ -153,5 +171,9 @@ if __name__ == "__main__":
     print(f"  \033[90m-\033[0m Asset webhook: {N8N_ASSET_WEBHOOK_URL}")
     print()
 
+    if args.preload or STUDIO_PRELOAD:
+        from studio import warmup
+        warmup.start()
+
     threading.Timer(1.0, lambda: webbrowser.open(url)).start()
     app.run(host="0.0.0.0", port=port, debug=False, threaded=True)
@@ -0,0 +1,103 @@
+"""Benchmark: breathing block splitters (greedy vs optimal) on long scripts.
+
+Builds a seeded narration-like script (~50k characters by default, mixed
+sentence lengths, clauses and Kokoro links), splits it with every
+splitter and reports run time, block count, block length spread and the
+boundaries blocks end on. Each run checks that no words are lost or
+reordered and that optimal blocks stay within max_chars.
+
+    python benchmarks/bench_blocks.py --chars 50000 --repeat 5
+"""
+
+import argparse
+import os
+import random
+import statistics
+import sys
+import time
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, ROOT)
+
+from studio.tts.normalize import BLOCK_SPLITTERS, tts_breathing_blocks  # noqa: E402
+
+_WORDS = (
+    "the ocean floor hides a ridge of volcanoes that runs for thousands of miles "
+    "most of it has never been seen by human eyes scientists dropped a small "
+    "submarine into the dark and found hot water pouring out of vents where giant "
+    "worms pale crabs and clams lived without any sunlight at all bacteria turned "
+    "chemicals into food and everything else fed on them"
+).split()
+_LINKS = ["[Kokoro](/kˈOkəɹO/)", "[read](-1)", "[live](+2)"]
+
+
+def _script(chars, seed=11):
+    rng = random.Random(seed)
+    sentences, total = [], 0
+    while total < chars:
+        clauses = []
+        for _ in range(rng.choice([1, 1, 1, 2, 2, 3, 5])):
+            words = [rng.choice(_WORDS) for _ in range(rng.randint(3, 22))]
+            if rng.random() < 0.05:
+                words.insert(rng.randrange(len(words)), rng.choice(_LINKS))
+            clauses.append(" ".join(words))
+        sep = rng.choice([", ", "; ", ": "])
+        sentence = sep.join(clauses)
+        sentence = sentence[0].upper() + sentence[1:] + rng.choice([".", ".", ".", "?", "!", "…"])
+        sentences.append(sentence)
+        total += len(sentence) + 1
+    return " ".join(sentences)
+
+
+def _ends_on(block):
+    if block.endswith(("…", ".", "!", "?", "—")):
+        return "sentence"
+    if block.endswith((",", ";", ":")):
+        return "clause"
+    return "word"
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--chars', type=int, default=50000)
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--min-chars', type=int, default=150)
+    parser.add_argument('--max-chars', type=int, default=200)
+    args = parser.parse_args()
+
+    text = _script(args.chars)
+    print(f'script: {len(text):,} chars, {len(text.split()):,} words')
+    failed = False
+    for algorithm in BLOCK_SPLITTERS:
+        times = []
+        for _ in range(args.repeat):
+            start = time.perf_counter()
+            blocks = tts_breathing_blocks(text, args.min_chars, args.max_chars, algorithm)
+            times.append(time.perf_counter() - start)
+
+        lengths = [len(b) for b in blocks]
+        in_range = sum(args.min_chars <= n <= args.max_chars for n in lengths)
+        ends = [_ends_on(b) for b in blocks[:-1]]
+        print(f'\n{algorithm}')
+        print(f'  time      median {statistics.median(times) * 1000:.1f} ms, '
+              f'best {min(times) * 1000:.1f} ms')
+        print(f'  blocks    {len(blocks)}, {in_range / len(blocks):.0%} within '
+              f'{args.min_chars}-{args.max_chars} chars')
+        print(f'  length    min {min(lengths)}, mean {statistics.mean(lengths):.0f}, '
+              f'max {max(lengths)}, stdev {statistics.pstdev(lengths):.1f}')
+        print('  ends on   ' + ', '.join(f'{kind} {ends.count(kind)}'
+                                         for kind in ('sentence', 'clause', 'word')))
+
+        if " ".join(blocks).split() != text.split():
+            print('  FAIL: blocks do not reproduce the script word for word')
+            failed = True
+        if algorithm == 'optimal' and max(lengths) > args.max_chars:
+            print(f'  FAIL: a block exceeds {args.max_chars} chars')
+            failed = True
+
+    if failed:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,110 @@
+"""Benchmark: peak memory of long-form assembly, in memory vs ChunkWriter.
+
+Assembles a long narration-length track from synthetic ~10 s blocks two
+ways and reports wall time and peak Python allocation (tracemalloc):
+
+* memory — ChunkAssembler, pad_audio, normalize_loudness, one sf.write
+  (the whole track held several times over);
+* file   — ChunkWriter into a scratch WAV, then normalize_loudness_file
+  (about two blocks held at any time).
+
+Both outputs are compared sample for sample; a difference of more than
+one 16-bit step exits non-zero.
+
+    python benchmarks/bench_chunk_writer.py --minutes 10 60
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, ROOT)
+
+import numpy as np  # noqa: E402
+import soundfile as sf  # noqa: E402
+
+from studio.tts.audio import (  # noqa: E402
+    ChunkAssembler, ChunkWriter, normalize_loudness, normalize_loudness_file, pad_audio, scratch_wav,
+)
+from studio.tts.loudness import LoudnessMeter  # noqa: E402
+
+SR = 24000
+
+
+def _blocks(minutes, seed=3):
+    """Harmonic ~8-14 s blocks with a slow level drift, *minutes* long in total."""
+    rng = np.random.default_rng(seed)
+    total = 0.0
+    while total < minutes * 60:
+        seconds = rng.uniform(8, 14)
+        t = np.arange(int(SR * seconds)) / SR
+        f0 = rng.uniform(100, 220)
+        tone = sum(np.sin(2 * np.pi * f0 * k * t) / k for k in range(1, 6))
+        level = rng.uniform(0.1, 0.35) * (1 + 0.5 * np.sin(2 * np.pi * 3 * t))
+        total += seconds
+        yield (tone * level).astype(np.float32)
+
+
+def _in_memory(minutes, path):
+    meter = LoudnessMeter(SR)
+    assembler = ChunkAssembler(SR, 80, 20, on_audio=meter.add)
+    for block in _blocks(minutes):
+        assembler.add(block)
+    audio, _ = normalize_loudness(pad_audio(assembler.finish(), SR), SR, meter)
+    sf.write(path, audio, SR)
+
+
+def _to_file(minutes, path):
+    with scratch_wav() as raw_path:
+        meter = LoudnessMeter(SR)
+        with sf.SoundFile(raw_path, "w", SR, 1, subtype="FLOAT") as raw:
+            writer = ChunkWriter(raw, SR, 80, 20, on_audio=meter.add)
+            for block in _blocks(minutes):
+                writer.add(block)
+            writer.finish()
+        normalize_loudness_file(raw_path, path, meter, SR)
+
+
+def _measure(fn, minutes, path):
+    tracemalloc.start()
+    start = time.perf_counter()
+    fn(minutes, path)
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--minutes', type=float, nargs='+', default=[10, 60])
+    args = parser.parse_args()
+
+    from loguru import logger
+    logger.remove()
+    logger.add(sys.stderr, level='WARNING')
+
+    failed = False
+    with tempfile.TemporaryDirectory() as tmp:
+        for minutes in args.minutes:
+            paths = {mode: os.path.join(tmp, f'{mode}.wav') for mode in ('memory', 'file')}
+            print(f'\n{minutes:g} min')
+            for mode, fn in (('memory', _in_memory), ('file', _to_file)):
+                elapsed, peak = _measure(fn, minutes, paths[mode])
+                print(f'  {mode:<7} {elapsed:6.1f} s   peak {peak / 2**20:8.1f} MiB')
+            a, _ = sf.read(paths['memory'], dtype='int16')
+            b, _ = sf.read(paths['file'], dtype='int16')
+            diff = int(np.abs(a.astype(np.int32) - b).max()) if len(a) == len(b) else None
+            print(f'  output  {"length differs" if diff is None else f"max difference {diff} LSB"}')
+            failed |= diff is None or diff > 1
+
+    if failed:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,137 @@
+"""Benchmark: multi-pass vs single-graph video export.
+
+Builds a synthetic project (gradient images, a tone as narration, optional
+captions), exports it with both VideoProcessor modes and reports wall time
+and output size.
+
+    python benchmarks/bench_export_modes.py --scenes 12 --duration 4
+"""
+
+import argparse
+import os
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.join(ROOT, 'timeline-editor', 'backend'))
+
+from PIL import Image, ImageDraw  # noqa: E402
+
+from video_processor import FFMPEG_BIN, VideoProcessor  # noqa: E402
+
+EFFECTS = ['static', 'zoom_in', 'fade', 'pan_left', 'zoom_out', 'pan_right']
+
+
+def _has_drawtext():
+    out = subprocess.run([FFMPEG_BIN, '-hide_banner', '-filters'], capture_output=True, text=True).stdout
+    return ' drawtext ' in out
+
+
+def _make_assets(work_dir, n_scenes, total_duration):
+    images = []
+    for i in range(n_scenes):
+        img = Image.new('RGB', (1600, 1200))
+        draw = ImageDraw.Draw(img)
+        for y in range(0, 1200, 8):
+            shade = (y * 255 // 1200 + i * 40) % 256
+            draw.rectangle([0, y, 1600, y + 8], fill=(shade, 255 - shade, (i * 70) % 256))
+        path = os.path.join(work_dir, f'scene_{i}.jpg')
+        img.save(path, quality=90)
+        images.append(path)
+
+    narration = os.path.join(work_dir, 'narration.wav')
+    subprocess.run([FFMPEG_BIN, '-y', '-loglevel', 'error', '-f', 'lavfi',
+                    '-i', f'sine=frequency=220:duration={total_duration}', narration], check=True)
+    return images, narration
+
+
+def _export_data(mode, images, narration, duration, width, height, with_captions):
+    total = duration * len(images)
+    scenes = [{
+        'id': i + 1,
+        'duration': duration,
+        'media': {'type': 'image', 'path': path},
+        'effect': {'type': EFFECTS[i % len(EFFECTS)]},
+    } for i, path in enumerate(images)]
+
+    captions = {}
+    if with_captions:
+        entries = []
+        t = 0.0
+        while t < total:
+            words = ['this', 'is', 'a', 'benchmark', 'caption']
+            entries.append({
+                'text': ' '.join(words), 'start': t, 'end': t + 2,
+                'words': [{'word': w, 'begin': t + k * 0.4, 'end': t + (k + 1) * 0.4}
+                          for k, w in enumerate(words)],
+            })
+            t += 2
+        captions = {'entries': entries, 'style': {'fontSize': 48, 'highlight': True}}
+
+    return {
+        'project_id': 'bench',
+        'scenes': scenes,
+        'audio': {'path': narration, 'volume': 1.0},
+        'captions': captions,
+        'timeline': {'total_duration': total},
+        'output': {
+            'resolution': {'width': width, 'height': height},
+            'fps': 30,
+            'export_mode': mode,
+            'use_cache': False,
+        },
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--scenes', type=int, default=8)
+    parser.add_argument('--duration', type=float, default=4.0, help='seconds per scene')
+    parser.add_argument('--width', type=int, default=1080)
+    parser.add_argument('--height', type=int, default=1920)
+    parser.add_argument('--repeat', type=int, default=2)
+    parser.add_argument('--no-captions', action='store_true')
+    args = parser.parse_args()
+
+    from loguru import logger
+    logger.remove()
+    logger.add(sys.stderr, level='WARNING')
+
+    with_captions = not args.no_captions
+    if with_captions and not _has_drawtext():
+        print('ffmpeg build has no drawtext filter — benchmarking without captions')
+        with_captions = False
+
+    work_dir = tempfile.mkdtemp(prefix='bench_export_')
+    try:
+        images, narration = _make_assets(work_dir, args.scenes, args.duration * args.scenes)
+        print(f"{args.scenes} scenes x {args.duration}s @ {args.width}x{args.height}, "
+              f"captions={'on' if with_captions else 'off'}, repeat={args.repeat}")
+        print(f"{'mode':<14}{'median s':>10}{'min s':>10}{'size MB':>10}")
+
+        results = {}
+        for mode in ('multi_pass', 'single_graph'):
+            times = []
+            out = os.path.join(work_dir, f'{mode}.mp4')
+            for _ in range(args.repeat):
+                data = _export_data(mode, images, narration, args.duration,
+                                    args.width, args.height, with_captions)
+                t0 = time.perf_counter()
+                VideoProcessor(export_data=data).process(out)
+                times.append(time.perf_counter() - t0)
+            size_mb = os.path.getsize(out) / (1024 * 1024)
+            results[mode] = statistics.median(times)
+            print(f"{mode:<14}{statistics.median(times):>10.2f}{min(times):>10.2f}{size_mb:>10.2f}")
+
+        print(f"single_graph speedup: {results['multi_pass'] / results['single_graph']:.2f}x")
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+
+if __name__ == '__main__':
+    main()
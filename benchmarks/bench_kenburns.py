@@ -0,0 +1,101 @@
+"""Benchmark: Ken Burns engines (Pillow sub-pixel frames vs ffmpeg zoompan).
+
+Renders one scene clip per effect type with each engine from a large
+synthetic source image (Midjourney-sized PNG by default) and reports wall
+time per clip and the speedup of the Pillow engine over zoompan.
+
+    python benchmarks/bench_kenburns.py --width 1080 --height 1920 --duration 4
+"""
+
+import argparse
+import os
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.join(ROOT, 'timeline-editor', 'backend'))
+
+import numpy as np  # noqa: E402
+from PIL import Image, ImageFilter  # noqa: E402
+
+from video_processor import KENBURNS_EFFECTS, KENBURNS_ENGINES, VideoProcessor  # noqa: E402
+
+
+def _make_source(work_dir, width, height):
+    """Photo-like PNG: gradients plus blurred texture (pure noise would make any
+    sub-pixel resampler look bad to the encoder and no real image behaves so)."""
+    y, x = np.mgrid[0:height, 0:width]
+    rng = np.random.default_rng(0)
+    img = np.stack([(x * 255 // width), (y * 255 // height), ((x + y) * 255 // (width + height))], axis=-1)
+    texture = Image.fromarray(rng.integers(0, 256, size=(height, width, 3), dtype=np.uint8))
+    texture = np.asarray(texture.filter(ImageFilter.GaussianBlur(6)), dtype=np.int32) - 128
+    img = (img + texture * 2).clip(0, 255).astype(np.uint8)
+    path = os.path.join(work_dir, 'source.png')
+    Image.fromarray(img).save(path)
+    return path
+
+
+def _processor(engine, width, height, fps):
+    return VideoProcessor(export_data={
+        'project_id': 'bench',
+        'scenes': [],
+        'output': {
+            'resolution': {'width': width, 'height': height},
+            'fps': fps,
+            'kenburns_engine': engine,
+            'use_cache': False,
+        },
+    })
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--width', type=int, default=1080)
+    parser.add_argument('--height', type=int, default=1920)
+    parser.add_argument('--fps', type=int, default=30)
+    parser.add_argument('--duration', type=float, default=4.0, help='seconds per clip')
+    parser.add_argument('--source', default='2912x1632', help='source image size WxH')
+    parser.add_argument('--repeat', type=int, default=2)
+    parser.add_argument('--effects', nargs='+', default=list(KENBURNS_EFFECTS), choices=KENBURNS_EFFECTS)
+    args = parser.parse_args()
+
+    from loguru import logger
+    logger.remove()
+    logger.add(sys.stderr, level='WARNING')
+
+    src_w, src_h = (int(v) for v in args.source.lower().split('x'))
+    work_dir = tempfile.mkdtemp(prefix='bench_kenburns_')
+    try:
+        source = _make_source(work_dir, src_w, src_h)
+        print(f"{args.width}x{args.height} @ {args.fps} fps, {args.duration}s clips, "
+              f"source {src_w}x{src_h}, repeat={args.repeat}, cpus={os.cpu_count()}")
+        print(f"{'effect':<12}" + ''.join(f"{e + ' s':>12}" for e in KENBURNS_ENGINES) + f"{'speedup':>10}")
+
+        totals = {engine: 0.0 for engine in KENBURNS_ENGINES}
+        for effect_type in args.effects:
+            medians = {}
+            for engine in KENBURNS_ENGINES:
+                proc = _processor(engine, args.width, args.height, args.fps)
+                out = os.path.join(work_dir, f'{effect_type}_{engine}.mp4')
+                times = []
+                for _ in range(args.repeat):
+                    t0 = time.perf_counter()
+                    proc._create_effect_scene(source, out, args.duration, {'type': effect_type})
+                    times.append(time.perf_counter() - t0)
+                medians[engine] = statistics.median(times)
+                totals[engine] += medians[engine]
+            print(f"{effect_type:<12}" + ''.join(f"{medians[e]:>12.2f}" for e in KENBURNS_ENGINES)
+                  + f"{medians['zoompan'] / medians['pillow']:>9.2f}x")
+
+        print(f"{'total':<12}" + ''.join(f"{totals[e]:>12.2f}" for e in KENBURNS_ENGINES)
+              + f"{totals['zoompan'] / totals['pillow']:>9.2f}x")
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+
+if __name__ == '__main__':
+    main()
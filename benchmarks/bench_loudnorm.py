@@ -0,0 +1,151 @@
+"""Benchmark: in-process loudness normalisation vs the ffmpeg loudnorm round-trip.
+
+For narration-like test signals (or your own WAVs) this reports:
+
+* time of the old path (write WAV, ffmpeg single-pass loudnorm, re-read)
+  against the in-process path (BS.1770 meter + gain + true-peak limiter,
+  one write);
+* accuracy: the meter's input measurement against ffmpeg ebur128, and the
+  loudness / true peak of both outputs as ffmpeg measures them.
+
+With --check it exits non-zero when the in-process path misses the targets
+(|I - (-16)| > 0.3 LU or true peak above -1.5 dBTP + tolerance), or the
+meter disagrees with ffmpeg by more than 0.2 LU.
+
+    python benchmarks/bench_loudnorm.py --durations 30 120 --check
+"""
+
+import argparse
+import os
+import re
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, ROOT)
+
+import numpy as np  # noqa: E402
+import soundfile as sf  # noqa: E402
+
+from studio.tts import loudness  # noqa: E402
+from studio.tts.audio import _find_ffmpeg, run_loudnorm  # noqa: E402
+
+SR = 24000
+
+
+def _narration(seconds, level_db, seed):
+    """Voiced harmonics with drifting pitch, syllable envelope and pauses."""
+    rng = np.random.default_rng(seed)
+    t = np.arange(int(seconds * SR)) / SR
+    f0 = 140 + 30 * np.sin(2 * np.pi * 0.3 * t) + 10 * rng.standard_normal() * np.sin(2 * np.pi * 0.05 * t)
+    phase = 2 * np.pi * np.cumsum(f0) / SR
+    voiced = sum(np.sin(k * phase) / k for k in range(1, 30))
+    syllables = np.clip(np.sin(2 * np.pi * 4.2 * t + rng.uniform(0, 6)), 0, None) ** 2
+    pauses = (np.sin(2 * np.pi * 0.15 * t + rng.uniform(0, 6)) > -0.7).astype(float)
+    hiss = rng.standard_normal(len(t)) * 0.02
+    audio = (voiced * syllables + hiss) * pauses
+    audio *= 10 ** (level_db / 20) / (np.sqrt(np.mean(audio ** 2)) + 1e-12)
+    return np.clip(audio, -1, 1).astype(np.float32)
+
+
+def _ebur128(path):
+    ffmpeg = _find_ffmpeg()
+    out = subprocess.run([ffmpeg, '-hide_banner', '-nostdin', '-i', path,
+                          '-af', 'ebur128=peak=true', '-f', 'null', '-'],
+                         capture_output=True, text=True).stderr
+    summary = out[out.rindex('Summary:'):]
+
+    def _value(label):
+        return float(re.search(label + r':\s+(-?[\d.]+|-inf)', summary).group(1))
+    return {'i': _value('I'), 'lra': _value('LRA'), 'tp': _value('Peak')}
+
+
+def _ffmpeg_path(audio, work):
+    path = os.path.join(work, 'ffmpeg.wav')
+    t0 = time.perf_counter()
+    sf.write(path, audio, SR)
+    run_loudnorm(path)
+    sf.info(path)
+    return time.perf_counter() - t0, path
+
+
+def _numpy_path(audio, work):
+    path = os.path.join(work, 'numpy.wav')
+    t0 = time.perf_counter()
+    meter = loudness.LoudnessMeter(SR)
+    meter.add(audio)
+    out, _ = loudness.normalize(audio, SR, meter)
+    sf.write(path, out, SR)
+    return time.perf_counter() - t0, path, meter
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--durations', type=float, nargs='+', default=[30, 120])
+    parser.add_argument('--levels', type=float, nargs='+', default=[-30, -20, -8],
+                        help='RMS level of the synthetic signals (dBFS)')
+    parser.add_argument('--wav', nargs='*', default=[], help='extra mono WAVs to include')
+    parser.add_argument('--tp-tolerance', type=float, default=0.5,
+                        help='dB ffmpeg may read above -1.5 dBTP (its 24 kHz true-peak '
+                             'estimator reads high)')
+    parser.add_argument('--check', action='store_true')
+    args = parser.parse_args()
+
+    from loguru import logger
+    logger.remove()
+    logger.add(sys.stderr, level='WARNING')
+
+    if not _find_ffmpeg():
+        sys.exit('ffmpeg not found')
+
+    cases = [(f'synth {d:.0f}s @ {lv:.0f} dB', _narration(d, lv, i))
+             for i, (d, lv) in enumerate((d, lv) for d in args.durations for lv in args.levels)]
+    for path in args.wav:
+        audio, sr = sf.read(path, dtype='float32', always_2d=True)
+        if sr != SR:
+            sys.exit(f'{path}: expected {SR} Hz, got {sr}')
+        cases.append((os.path.basename(path), audio.mean(axis=1)))
+
+    print(f"{'case':<22}{'ffmpeg s':>9}{'numpy s':>9}{'speedup':>9} | "
+          f"{'in I':>7}{'ref I':>7}{'in LRA':>7}{'ref LRA':>8} | "
+          f"{'out I ff':>9}{'out I np':>9}{'TP ff':>7}{'TP np':>7}")
+    failures = []
+    work = tempfile.mkdtemp(prefix='bench_loudnorm_')
+    try:
+        _numpy_path(cases[0][1][:SR], work)  # warm-up (scipy import, kernels)
+        for name, audio in cases:
+            src = os.path.join(work, 'src.wav')
+            sf.write(src, audio, SR)
+            ref = _ebur128(src)
+
+            ff_time, ff_path = _ffmpeg_path(audio, work)
+            np_time, np_path, meter = _numpy_path(audio, work)
+            ff_out, np_out = _ebur128(ff_path), _ebur128(np_path)
+            stats = meter.stats()
+
+            print(f"{name:<22}{ff_time:>9.2f}{np_time:>9.2f}{ff_time / np_time:>8.1f}x | "
+                  f"{stats['input_i']:>7.1f}{ref['i']:>7.1f}{stats['input_lra']:>7.1f}{ref['lra']:>8.1f} | "
+                  f"{ff_out['i']:>9.1f}{np_out['i']:>9.1f}{ff_out['tp']:>7.1f}{np_out['tp']:>7.1f}")
+
+            if abs(stats['input_i'] - ref['i']) > 0.2:
+                failures.append(f"{name}: meter {stats['input_i']} vs ffmpeg {ref['i']} LUFS")
+            if abs(np_out['i'] - loudness.TARGET_I) > 0.3:
+                failures.append(f"{name}: output {np_out['i']} LUFS")
+            if np_out['tp'] > loudness.TARGET_TP + args.tp_tolerance:
+                failures.append(f"{name}: output true peak {np_out['tp']} dBTP")
+    finally:
+        shutil.rmtree(work, ignore_errors=True)
+
+    for failure in failures:
+        print('FAIL', failure)
+    if args.check:
+        if failures:
+            sys.exit(1)
+        print('OK: in-process loudnorm matches the targets and ffmpeg measurements')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,141 @@
+"""Benchmark + golden check for the TTS text normaliser (normalize_for_tts).
+
+The golden file holds narration-style inputs that exercise every table
+(contractions, abbreviations, currency, units, dates, times, ordinals,
+numbers, symbols, Kokoro links) and the output the normaliser produced
+for them. Every run first checks the current output against it, then
+reports throughput in characters per second.
+
+    python benchmarks/bench_normalize.py            # check + benchmark
+    python benchmarks/bench_normalize.py --update   # rewrite the golden file
+
+Only use --update for an intended change of normaliser output.
+"""
+
+import argparse
+import json
+import os
+import random
+import sys
+import time
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, ROOT)
+
+from studio.tts.normalize import normalize_for_tts  # noqa: E402
+
+GOLDEN = os.path.join(os.path.dirname(__file__), 'data', 'normalize_golden.jsonl')
+
+_FIXED = [
+    "You'd think it's easy, but it isn't. She's sure they'll come; he's not.",
+    "I'm here, you're there, we've met, THEY'RE gone and who's left? Let's see.",
+    "Don't, doesn't, didn't, can't, couldn't, shouldn't, won't, wouldn't.",
+    "It's 5 o'clock somewhere. There's a place where's nobody, here's why.",
+    "Dr. Smith met Mr. Jones and Mrs. Brown at St. Mary's on Main Ave. today.",
+    "Dr.Smith and Prof.Lee wrote e.g.this and i.e.that, etc.so on, vs.them.",
+    "The API returns a URL over HTTP; the HTML, CSS and SQL live in a PDF.",
+    "Your PIN and OTP arrive by SMS with an ID from RBQ.",
+    "It costs $5, €20, £300 or ¥1000 — or HTG 250 in Haiti.",
+    "Run 5km, lift 20 kg, add 3mm and 250mg; it weighs 2 lb or 16 oz.",
+    "Drive 60 mph (100 kph) at 25°C or 77°F with 50% battery left.",
+    "The file is 700MB, the disk 2 TB, RAM 16GB, latency 30ms at 60fps.",
+    "It measured 10m by 4 cm, then 2m again.",
+    "Released 2024-03-15 at 5:30pm, patched 2024-12-01 at 9am.",
+    "She came 1st, he was 2nd, they were 3rd, we were 21st and 22nd.",
+    "The 4th, 5th, 10th, 12th, 15th, 20th, 23rd, 30th and 31st of May.",
+    "Pi is 3.14, e is 2.718 and the answer is 42 out of 1000.",
+    "A & B @ home #1 = best > rest < none | maybe \\ not.",
+    "“Quoted” and ‘single’ – with an en dash… and an em dash—yes.",
+    "Say [Kokoro](/kˈOkəɹO/) and [read](-1) it's [live](+2) at 5pm.",
+    "Multiple   spaces\tand\nnewlines   collapse.",
+    "",
+    "   ",
+    "No changes needed here.",
+]
+
+_TOKENS = [
+    "you'd", "You'll", "I'm", "i've", "he's", "She'd", "it'll", "we're", "They've",
+    "that's", "who'd", "What'll", "where's", "how's", "isn't", "AREN'T", "wasn't",
+    "won't", "doesn't", "can't", "hadn't", "mustn't", "needn't", "let's", "there's",
+    "Here's", "o'clock", "Dr.", "Mr.", "Prof.", "St.", "Blvd.", "Dept.", "Est.",
+    "etc.", "e.g.", "i.e.", "vs.", "approx.", "min.", "max.", "no.", "API", "url",
+    "HTTP", "sql", "ID", "pin", "SMS", "PDF", "$12", "€7", "£4", "¥99",
+    "HTG5", "3km", "7 m", "12cm", "4mm", "9kg", "5 g", "20mg", "6lb", "8oz", "55mph",
+    "90 kph", "21°C", "70°F", "15%", "300MB", "2GB", "1TB", "250ms", "24fps",
+    "1999-01-31", "2030-07-04", "7:45am", "11pm", "1st", "2ND", "3rd", "13th", "31st",
+    "0.5", "12.75", "7", "2048", "&", "@", "#", "=", ">", "<", "|", "–",
+    "“so”", "’tis", "—", "…", "[word](/wɜːd/)",
+    "[stress](+1)", "narration", "the", "quick", "voice", "script", "scene",
+]
+_GLUE = [" ", " ", " ", ", ", ". ", "; ", " - ", "\n", "  "]
+
+# Tokens run together, where one rule's output is the next rule's context:
+# the per-rule passes never let an expansion create (or remove) a boundary
+_RUN_TOGETHER = [
+    "DR.API;", "Mr.i.e.", "etc.Pin", "Dr.Smith.Prof.HTTP", "i.e.g.x", "e.g.i.e.so",
+    "it'sn't", "it'she's", "isn'they're", "5kmph", "12kg%", "1st2nd", "ſhe's", "İt's",
+]
+_RUN_GLUE = ["", "", "", ".", ";", " "]
+
+
+def _corpus(n=400, seed=7, run_together=100):
+    """Fixed edge cases plus seeded random narration-like and run-together lines."""
+    rng = random.Random(seed)
+    lines = list(_FIXED)
+    for _ in range(n):
+        words = [rng.choice(_TOKENS) for _ in range(rng.randint(4, 30))]
+        line = "".join(w + rng.choice(_GLUE) for w in words)
+        lines.append(line[0].upper() + line[1:] if line else line)
+    lines += _RUN_TOGETHER
+    rng = random.Random(seed + 1)
+    for _ in range(run_together):
+        words = [rng.choice(_TOKENS + _RUN_TOGETHER) for _ in range(rng.randint(2, 6))]
+        lines.append("".join(w + rng.choice(_RUN_GLUE) for w in words))
+    return lines
+
+
+def _load_golden():
+    with open(GOLDEN, encoding='utf-8') as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--update', action='store_true', help='rewrite the golden file')
+    parser.add_argument('--repeat', type=int, default=20, help='passes over the corpus')
+    args = parser.parse_args()
+
+    if args.update:
+        os.makedirs(os.path.dirname(GOLDEN), exist_ok=True)
+        with open(GOLDEN, 'w', encoding='utf-8') as f:
+            for text in _corpus():
+                f.write(json.dumps({'input': text, 'output': normalize_for_tts(text)},
+                                   ensure_ascii=False) + '\n')
+        print(f'Wrote {GOLDEN}')
+        return
+
+    golden = _load_golden()
+    mismatches = [g for g in golden if normalize_for_tts(g['input']) != g['output']]
+    for g in mismatches[:5]:
+        print('MISMATCH')
+        print('  input   ', repr(g['input']))
+        print('  expected', repr(g['output']))
+        print('  got     ', repr(normalize_for_tts(g['input'])))
+    print(f'golden: {len(golden) - len(mismatches)}/{len(golden)} identical')
+
+    texts = [g['input'] for g in golden]
+    chars = sum(len(t) for t in texts) * args.repeat
+    start = time.perf_counter()
+    for _ in range(args.repeat):
+        for text in texts:
+            normalize_for_tts(text)
+    elapsed = time.perf_counter() - start
+    print(f'normalize_for_tts: {chars / elapsed:,.0f} chars/s '
+          f'({chars:,} chars in {elapsed:.2f}s)')
+
+    if mismatches:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,135 @@
+"""Benchmark: alignment audio loading — np.interp vs polyphase vs 16 kHz sidecar.
+
+For 24 kHz TTS-like audio of each duration this reports the time to get
+16 kHz float32 samples for Whisper three ways:
+
+* interp  — the old path: sf.read + linear interpolation (np.interp);
+* poly    — sf.read + studio.resample.resample (windowed-sinc polyphase);
+* sidecar — memory-map the .16k.f32 written at TTS time (load_sidecar,
+  then one pass over the samples so the pages are actually read).
+
+It also measures how much of a 10 kHz tone (above the 8 kHz output
+Nyquist) aliases back into the output, and the level error of a 1 kHz
+tone. With --check it exits non-zero when the polyphase aliasing is above
+-50 dB, the passband error above 0.05 dB, the streaming resampler differs
+from the one-shot one, or (with scipy installed) the output differs from
+scipy.signal.resample_poly by more than 1e-5.
+
+    python benchmarks/bench_resample.py --durations 60 600 --check
+"""
+
+import argparse
+import math
+import os
+import sys
+import tempfile
+import time
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, ROOT)
+
+import numpy as np  # noqa: E402
+import soundfile as sf  # noqa: E402
+
+from studio.resample import load_sidecar, resample, resample_stream, write_sidecar  # noqa: E402
+
+SR = 24000
+OUT = 16000
+
+
+def _interp(audio):
+    target_len = int(len(audio) * OUT / SR)
+    return np.interp(np.linspace(0, len(audio), target_len, endpoint=False),
+                     np.arange(len(audio), dtype=np.float32), audio).astype(np.float32)
+
+
+def _tone(freq, seconds=2.0):
+    t = np.arange(int(SR * seconds)) / SR
+    return (0.5 * np.sin(2 * np.pi * freq * t)).astype(np.float32)
+
+
+def _rms_db(x):
+    return 20 * math.log10(max(float(np.sqrt(np.mean(np.square(x, dtype=np.float64)))), 1e-12))
+
+
+def _quality():
+    inner = slice(OUT // 10, -OUT // 10)      # ignore the filter's edge transients
+    alias = {name: _rms_db(fn(_tone(10000))[inner]) - _rms_db(_tone(10000))
+             for name, fn in (('interp', _interp), ('poly', lambda a: resample(a, SR, OUT)))}
+    passband = {name: _rms_db(fn(_tone(1000))[inner]) - _rms_db(_tone(1000))
+                for name, fn in (('interp', _interp), ('poly', lambda a: resample(a, SR, OUT)))}
+    return alias, passband
+
+
+def _narration(seconds, seed=5):
+    rng = np.random.default_rng(seed)
+    t = np.arange(int(SR * seconds)) / SR
+    f0 = 140 + 30 * np.sin(2 * np.pi * 0.3 * t)
+    phase = 2 * np.pi * np.cumsum(f0) / SR
+    voiced = sum(np.sin(k * phase) / k for k in range(1, 30))
+    noise = rng.standard_normal(len(t)) * 0.02
+    return (0.15 * voiced * (0.6 + 0.4 * np.sin(2 * np.pi * 2.5 * t)) + noise).astype(np.float32)
+
+
+def _timed(fn):
+    start = time.perf_counter()
+    out = fn()
+    return time.perf_counter() - start, out
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--durations', type=float, nargs='+', default=[60, 600])
+    parser.add_argument('--check', action='store_true')
+    args = parser.parse_args()
+
+    failures = []
+    alias, passband = _quality()
+    print('10 kHz tone aliased into output:  '
+          + ', '.join(f'{k} {v:.1f} dB' for k, v in alias.items()))
+    print('1 kHz tone level error:           '
+          + ', '.join(f'{k} {v:+.3f} dB' for k, v in passband.items()))
+    if alias["poly"] > -50:
+        failures.append(f'aliasing {alias["poly"]:.1f} dB')
+    if abs(passband['poly']) > 0.05:
+        failures.append(f'passband error {passband["poly"]:+.3f} dB')
+
+    with tempfile.TemporaryDirectory() as tmp:
+        for seconds in args.durations:
+            wav = os.path.join(tmp, f'{seconds:g}.wav')
+            sf.write(wav, _narration(seconds), SR)
+
+            t_interp, _ = _timed(lambda: _interp(sf.read(wav, dtype='float32')[0]))
+            t_poly, poly = _timed(lambda: resample(sf.read(wav, dtype='float32')[0], SR, OUT))
+            t_write, _ = _timed(lambda: write_sidecar(wav))
+            t_side, side = _timed(lambda: (lambda m: (float(m.sum()), m))(load_sidecar(wav))[1])
+            print(f'\n{seconds:g} s of audio')
+            print(f'  interp   {t_interp * 1000:8.1f} ms')
+            print(f'  poly     {t_poly * 1000:8.1f} ms')
+            print(f'  sidecar  {t_side * 1000:8.1f} ms   (written at TTS time in {t_write * 1000:.0f} ms)')
+
+            audio = sf.read(wav, dtype='float32')[0]
+            streamed = np.concatenate(list(resample_stream(
+                (audio[i:i + SR * 7] for i in range(0, len(audio), SR * 7)), SR, OUT)))
+            if len(streamed) != len(poly) or not np.array_equal(streamed, poly):
+                failures.append(f'{seconds:g} s: streaming resampler differs')
+            if len(side) != len(poly) or not np.array_equal(np.asarray(side), poly):
+                failures.append(f'{seconds:g} s: sidecar differs from resample()')
+            try:
+                from scipy.signal import resample_poly
+            except ImportError:
+                continue
+            diff = float(np.abs(resample_poly(audio, 2, 3) - poly).max())
+            print(f'  max difference from scipy resample_poly: {diff:.1e}')
+            if diff > 1e-5:
+                failures.append(f'{seconds:g} s: differs from resample_poly by {diff:.1e}')
+            del side
+
+    if failures:
+        print('\nFAILED: ' + '; '.join(failures))
+        if args.check:
+            sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
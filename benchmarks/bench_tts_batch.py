@@ -0,0 +1,134 @@
+"""Benchmark: batched Kokoro inference RTF by batch size.
+
+Splits a narration script into breathing blocks, synthesizes all of them
+with batch sizes 1/2/4/8 and reports inference time, audio length and
+real-time factor (inference seconds per second of audio; lower is better).
+``--check`` also compares every batched row with the same block synthesized
+alone (length and waveform); TTS_BATCH_SIZE should only go above 1 once
+that passes. Needs the Kokoro model files in models/ (download them from
+the TTS page).
+
+    python benchmarks/bench_tts_batch.py --batch-sizes 1 2 4 8 --repeat 3 --check
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import time
+
+import numpy as np
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, ROOT)
+
+SCRIPT = (
+    "Deep beneath the Pacific, a ridge of volcanoes runs for thousands of miles. "
+    "Most of it has never been seen by human eyes. In 1977, a small submarine "
+    "named Alvin dropped into the dark near the Galapagos Islands. What its crew "
+    "found there rewrote the textbooks. Hot water was pouring out of the sea floor, "
+    "and around the vents lived giant tube worms, pale crabs and clams the size of "
+    "dinner plates. There was no sunlight at all. Instead, bacteria turned chemicals "
+    "from the vents into food, and everything else fed on the bacteria. Scientists "
+    "had assumed that all life on Earth ultimately depended on the sun. The vents "
+    "proved them wrong. Since then, hundreds of vent fields have been found, each "
+    "with its own strange community. Some researchers now think life itself may have "
+    "begun in places like these, long before the first plant ever reached for the light. "
+    "If they are right, the oceans of distant moons like Europa and Enceladus might "
+    "hide vents of their own, and perhaps something living beside them."
+)
+
+
+# Batched rows must match per-block output this closely
+MAX_LENGTH_DIFF_MS = 20
+MIN_CORRELATION = 0.98
+
+
+def _similarity(a, b):
+    """Length difference (ms) and peak normalised cross-correlation of two takes."""
+    from studio.tts.batching import SAMPLE_RATE
+
+    diff_ms = abs(len(a) - len(b)) * 1000 / SAMPLE_RATE
+    n = min(len(a), len(b))
+    a, b = np.asarray(a[:n], dtype=np.float64), np.asarray(b[:n], dtype=np.float64)
+    denom = np.linalg.norm(a) * np.linalg.norm(b)
+    if not denom:
+        return diff_ms, 1.0 if not a.any() and not b.any() else 0.0
+    # Allow a few ms of alignment slack either side
+    lag = SAMPLE_RATE // 200
+    corr = max(np.dot(a[max(0, k):n + min(0, k)], b[max(0, -k):n - max(0, k)])
+               for k in range(-lag, lag + 1, 8))
+    return diff_ms, corr / denom
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--batch-sizes', type=int, nargs='+', default=[1, 2, 4, 8])
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--voice', default='af_heart')
+    parser.add_argument('--speed', type=float, default=1.0)
+    parser.add_argument('--text-file', help='narration script to use instead of the built-in one')
+    parser.add_argument('--check', action='store_true',
+                        help='compare batched rows with per-block synthesis; exit 1 on mismatch')
+    args = parser.parse_args()
+
+    from loguru import logger
+    logger.remove()
+    logger.add(sys.stderr, level='WARNING')
+
+    from studio.tts.batching import SAMPLE_RATE, plan_batches, prepare_blocks, run_batch
+    from studio.tts.normalize import clean_for_tts, tts_breathing_blocks
+    from studio.tts.routes import _model_files_present, _phonemize_with_misaki, _voice_to_lang, load_model
+
+    if not _model_files_present():
+        sys.exit('Kokoro model files not found in models/ - download them first')
+
+    text = open(args.text_file, encoding='utf-8').read() if args.text_file else SCRIPT
+    blocks = tts_breathing_blocks(clean_for_tts(text))
+    lang = _voice_to_lang(args.voice)
+
+    kokoro = load_model()
+    prepared = prepare_blocks(kokoro, [_phonemize_with_misaki(b, lang) for b in blocks], lang)
+    print(f"{len(text)} chars, {len(blocks)} blocks, voice={args.voice}, "
+          f"repeat={args.repeat}, cpus={os.cpu_count()}")
+
+    # Warm-up: first session run allocates arenas and is not representative
+    run_batch(kokoro, prepared[:1], args.voice, speed=args.speed, lang=lang)
+
+    singles = None
+    if args.check:
+        singles = {p["index"]: run_batch(kokoro, [p], args.voice, speed=args.speed, lang=lang)[0]
+                   for p in prepared}
+
+    print(f"{'batch':>6}{'runs':>6}{'infer s':>10}{'audio s':>10}{'RTF':>8}{'speedup':>9}"
+          + (f"{'max dlen ms':>13}{'min corr':>10}" if args.check else ""))
+    baseline = None
+    failed = False
+    for size in args.batch_sizes:
+        buckets = plan_batches(kokoro, prepared, size)
+        times, audio_s = [], 0.0
+        for _ in range(args.repeat):
+            t0 = time.perf_counter()
+            audios = [a for bucket in buckets
+                      for a in run_batch(kokoro, bucket, args.voice, speed=args.speed, lang=lang)]
+            times.append(time.perf_counter() - t0)
+            audio_s = sum(len(a) for a in audios) / SAMPLE_RATE
+        infer = statistics.median(times)
+        rtf = infer / audio_s if audio_s else 0.0
+        baseline = baseline or rtf
+        line = (f"{size:>6}{len(buckets):>6}{infer:>10.2f}{audio_s:>10.1f}{rtf:>8.3f}"
+                f"{baseline / rtf if rtf else 0:>8.2f}x")
+        if singles is not None:
+            ordered = [p["index"] for bucket in buckets for p in bucket]
+            scores = [_similarity(audio, singles[i]) for i, audio in zip(ordered, audios)]
+            worst_len = max(d for d, _ in scores)
+            worst_corr = min(c for _, c in scores)
+            ok = worst_len <= MAX_LENGTH_DIFF_MS and worst_corr >= MIN_CORRELATION
+            failed = failed or not ok
+            line += f"{worst_len:>13.1f}{worst_corr:>10.3f}" + ("" if ok else "  MISMATCH")
+        print(line)
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
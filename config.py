@@ -36,13 +36,14 @@ FONTS_DIR = os.path.join(ROOT_DIR, "assets", "fonts")
 DNA_DIR = os.path.join(OUTPUT_DIR, "dna")
 APP_ASSETS_DIR = os.path.join(ROOT_DIR, "assets")
 NICHE_INPUT_DIR = os.path.join(ROOT_DIR, "assets", "niche-analyzer")
+CACHE_DIR = os.path.join(OUTPUT_DIR, "cache")
 
 # ---------------------------------------------------------------------------
 # Ensure output directories exist
 # ---------------------------------------------------------------------------
 for _d in (LOG_DIR, ALIGN_DIR, ALIGN_TRASH_DIR, SCENES_DIR, ASSETS_DIR,
            SEGMENTER_DIR, CAPTIONS_DIR, MUSIC_DIR, TTS_DIR, TTS_TRASH_DIR, MODELS_DIR,
-           DNA_DIR):
+           DNA_DIR, CACHE_DIR):
     os.makedirs(_d, exist_ok=True)
 
 # ---------------------------------------------------------------------------
@@ -55,6 +56,74 @@ N8N_ASSET_WEBHOOK_URL = os.environ.get(
     "N8N_ASSET_WEBHOOK_URL", "http://localhost:5678/webhook/image-generator"
 )
 
+# ---------------------------------------------------------------------------
+# Video export (env-overridable)
+# ---------------------------------------------------------------------------
+# Parallel ffmpeg scene renders per export (0 = auto: half the cores, max 4)
+EXPORT_MAX_WORKERS = int(os.environ.get("EXPORT_MAX_WORKERS", "0"))
+# Rendered scene clips are reused across exports (0 = cache disabled)
+EXPORT_CLIP_CACHE_DIR = os.path.join(CACHE_DIR, "clips")
+EXPORT_CLIP_CACHE_MAX_MB = int(os.environ.get("EXPORT_CLIP_CACHE_MAX_MB", "2048"))
+# Exports run through a persistent queue with this many concurrent renders
+EXPORT_QUEUE_WORKERS = int(os.environ.get("EXPORT_QUEUE_WORKERS", "1"))
+EXPORT_QUEUE_DB = os.path.join(OUTPUT_DIR, "export_queue.db")
+# Finished/failed/cancelled jobs are pruned after this long, or beyond this many
+EXPORT_QUEUE_KEEP_HOURS = float(os.environ.get("EXPORT_QUEUE_KEEP_HOURS", "72"))
+EXPORT_QUEUE_KEEP_JOBS = int(os.environ.get("EXPORT_QUEUE_KEEP_JOBS", "200"))
+
+# ---------------------------------------------------------------------------
+# Scene assets (env-overridable)
+# ---------------------------------------------------------------------------
+# Export sizes grabbed images get an export-ready derivative for (comma-separated WxH)
+ASSET_DERIVATIVE_SIZES = os.environ.get("ASSET_DERIVATIVE_SIZES", "1080x1920")
+
+# ---------------------------------------------------------------------------
+# Text-to-speech (env-overridable)
+# ---------------------------------------------------------------------------
+# Breathing blocks synthesized per Kokoro session run (1 = one run per block).
+# Padded batches are opt-in until benchmarks/bench_tts_batch.py --check shows
+# batched rows matching per-block output on the shipped model
+TTS_BATCH_SIZE = int(os.environ.get("TTS_BATCH_SIZE", "1"))
+# Kokoro ONNX sessions serving requests concurrently (each holds its own copy
+# of the ~310MB model) and ONNX threads per session (0 = cores / sessions)
+TTS_POOL_SIZE = int(os.environ.get("TTS_POOL_SIZE", "1"))
+TTS_SESSION_THREADS = int(os.environ.get("TTS_SESSION_THREADS", "0"))
+# misaki G2P results, cached in memory (entries) and on disk
+PHONEME_CACHE_DB = os.path.join(CACHE_DIR, "phonemes.db")
+PHONEME_CACHE_MEMORY = int(os.environ.get("PHONEME_CACHE_MEMORY", "4096"))
+# Loudness normalisation: "numpy" (in process, BS.1770 + true-peak limiter)
+# or "ffmpeg" (loudnorm filter on the written file)
+TTS_LOUDNORM = os.environ.get("TTS_LOUDNORM", "numpy")
+# Synthesized audio per breathing block, reused on re-generation (0 = disabled)
+TTS_BLOCK_CACHE_DIR = os.path.join(CACHE_DIR, "tts_blocks")
+TTS_BLOCK_CACHE_MAX_MB = int(os.environ.get("TTS_BLOCK_CACHE_MAX_MB", "512"))
+# Pipeline TTS also writes its audio as 16 kHz float32 (<name>.16k.f32, ~230MB
+# per hour) so alignment memory-maps it instead of decoding and resampling
+TTS_ALIGN_SIDECAR = os.environ.get("TTS_ALIGN_SIDECAR", "1") == "1"
+# How scripts are split into breathing blocks: "greedy" (pack sentences, merge
+# short blocks) or "optimal" (minimum-cost partition, better balanced blocks)
+TTS_BLOCK_SPLITTER = os.environ.get("TTS_BLOCK_SPLITTER", "greedy")
+# Target time from a /api/tts/stream request to its first synthesized chunk;
+# the first breathing block is shortened so its G2P + inference fits
+TTS_STREAM_FIRST_CHUNK_MS = int(os.environ.get("TTS_STREAM_FIRST_CHUNK_MS", "500"))
+# Blended voice embeddings kept in memory (~0.5MB each), and saved named blends
+TTS_BLEND_CACHE_SIZE = int(os.environ.get("TTS_BLEND_CACHE_SIZE", "32"))
+VOICE_BLENDS_FILE = os.path.join(TTS_DIR, "voice_blends.json")
+
+# ---------------------------------------------------------------------------
+# Forced alignment (env-overridable)
+# ---------------------------------------------------------------------------
+# Whisper model stable-ts aligns with (batches may pick another per run)
+ALIGN_MODEL = os.environ.get("ALIGN_MODEL", "tiny.en")
+# Batch alignment threads; they overlap decode and I/O, inference is one at a time per model
+ALIGN_BATCH_WORKERS = int(os.environ.get("ALIGN_BATCH_WORKERS", "1"))
+
+# ---------------------------------------------------------------------------
+# Startup (env-overridable)
+# ---------------------------------------------------------------------------
+# Load Kokoro, misaki and the aligner in the background at boot (same as --preload)
+STUDIO_PRELOAD = os.environ.get("STUDIO_PRELOAD", "0") == "1"
+
 # ---------------------------------------------------------------------------
 # Project ID generator
 # ---------------------------------------------------------------------------
@@ -886,7 +886,8 @@ async function ttsStreamChunkedProgress(jobId, totalChunks) {
     es.onmessage = (e) => {
       const d = JSON.parse(e.data);
       if (d.phase === 'generating') {
-        ttsSetProgress(`Generating chunk ${d.chunk}/${d.total}...`);
+        const reused = d.cached ? ` (${d.cached} cached)` : '';
+        ttsSetProgress(`Generating chunk ${d.chunk}/${d.total}${reused}...`);
       } else if (d.phase === 'concatenating') {
         ttsSetProgress('Concatenating audio...');
       } else if (d.phase === 'normalizing') {
@@ -981,53 +982,93 @@ async function ttsHandleStream() {
     const ctrl = new AbortController();
     _ttsState.streamAbortController = ctrl;
 
+    // Raw big-endian int16 (audio/L16): no base64/JSON per chunk
+    payload.format = 'l16';
     const resp = await fetch('/api/tts/stream', {
       method: 'POST',
-      headers: { 'Content-Type': 'application/json' },
+      headers: { 'Content-Type': 'application/json', 'Accept': 'audio/L16' },
       body: JSON.stringify(payload),
       signal: ctrl.signal,
     });
+    if (!resp.ok) {
+      const err = await resp.json().catch(() => ({}));
+      throw new Error(err.error || `Stream failed (${resp.status})`);
+    }
 
+    const sampleRate = parseInt(resp.headers.get('X-Sample-Rate') || '24000');
     const reader = resp.body.getReader();
-    const decoder = new TextDecoder();
-    const audioCtx = new (window.AudioContext || window.webkitAudioContext)({ sampleRate: 24000 });
+    const audioCtx = new (window.AudioContext || window.webkitAudioContext)({ sampleRate });
     _ttsState.streamAudioCtx = audioCtx;
     let nextPlayTime = audioCtx.currentTime;
-    let buffer = '';
-    let chunks = 0;
+    let pending = new Uint8Array(0);
+    let played = 0;
+    const minBytes = sampleRate / 10 * 2;  // schedule >= 100 ms at a time
+
+    const schedule = (bytes) => {
+      const view = new DataView(bytes.buffer, bytes.byteOffset, bytes.byteLength);
+      const n = bytes.byteLength >> 1;
+      const audioBuf = audioCtx.createBuffer(1, n, sampleRate);
+      const out = audioBuf.getChannelData(0);
+      for (let i = 0; i < n; i++) out[i] = view.getInt16(i * 2, false) / 32768;
+      const source = audioCtx.createBufferSource();
+      source.buffer = audioBuf;
+      source.connect(audioCtx.destination);
+      if (nextPlayTime < audioCtx.currentTime) nextPlayTime = audioCtx.currentTime;
+      source.start(nextPlayTime);
+      nextPlayTime += audioBuf.duration;
+      played += audioBuf.duration;
+      ttsSetProgress(`Streaming ${played.toFixed(1)}s...`);
+    };
+
+    // A failure after the headers ends the body with this marker + message
+    const errMarker = new Uint8Array([0x7f, 0xff, ...new TextEncoder().encode('L16-STREAM-ERR')]);
+    const findMarker = (bytes) => {
+      outer: for (let i = 0; i + errMarker.length <= bytes.length; i += 2) {
+        for (let j = 0; j < errMarker.length; j++) {
+          if (bytes[i + j] !== errMarker[j]) continue outer;
+        }
+        return i;
+      }
+      return -1;
+    };
+    let streamError = null;
 
     while (true) {
       const { done, value } = await reader.read();
-      if (done) break;
-
-      buffer += decoder.decode(value, { stream: true });
-      const lines = buffer.split('\n');
-      buffer = lines.pop() || '';
-
-      for (const line of lines) {
-        if (!line.startsWith('data: ')) continue;
-        const d = JSON.parse(line.slice(6));
-
-        if (d.phase === 'audio') {
-          chunks++;
-          const pcm = Uint8Array.from(atob(d.samples), c => c.charCodeAt(0));
-          const float32 = new Float32Array(pcm.buffer);
-          const audioBuf = audioCtx.createBuffer(1, float32.length, d.sample_rate);
-          audioBuf.getChannelData(0).set(float32);
-          const source = audioCtx.createBufferSource();
-          source.buffer = audioBuf;
-          source.connect(audioCtx.destination);
-          if (nextPlayTime < audioCtx.currentTime) nextPlayTime = audioCtx.currentTime;
-          source.start(nextPlayTime);
-          nextPlayTime += audioBuf.duration;
-          ttsSetProgress(`Streaming chunk ${chunks}...`);
-        } else if (d.phase === 'done') {
-          ttsSetProgress('Stream complete');
-        } else if (d.phase === 'error') {
-          throw new Error(d.message);
+      if (value) {
+        const merged = new Uint8Array(pending.length + value.length);
+        merged.set(pending);
+        merged.set(value, pending.length);
+        pending = merged;
+      }
+      const marker = findMarker(pending);
+      if (marker >= 0) {
+        if (marker) schedule(pending.subarray(0, marker));
+        // The message follows the marker up to the end of the body
+        const tail = [pending.slice(marker + errMarker.length)];
+        while (!done) {
+          const next = await reader.read();
+          if (next.done) break;
+          tail.push(next.value);
         }
+        streamError = new TextDecoder().decode(await new Blob(tail).arrayBuffer()) || 'Stream failed';
+        break;
       }
+      // Keep whole samples only, and hold back enough to spot a marker split across reads
+      const usable = done ? pending.length : pending.length - (errMarker.length - 1);
+      const ready = usable >= (done ? 1 : minBytes) ? usable & ~1 : 0;
+      if (ready) {
+        schedule(pending.subarray(0, ready));
+        pending = pending.slice(ready);
+      }
+      if (done) break;
+    }
+    if (streamError) {
+      audioCtx.close();
+      _ttsState.streamAudioCtx = null;
+      throw new Error(streamError);
     }
+    ttsSetProgress('Stream complete');
 
     const remaining = nextPlayTime - audioCtx.currentTime;
     if (remaining > 0) {
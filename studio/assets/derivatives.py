@@ -0,0 +1,123 @@
+"""Asset Derivatives — export-ready copies of grabbed scene images.
+
+Grabbed originals are often 2048px+ PNGs that every export would decode and
+rescale again. Right after download each image gets a derivative per target
+export size: cover-fitted (same framing as the exporter's scale+crop) with
+headroom for Ken Burns zooms, saved as baseline JPEG in a hidden folder next
+to the original:
+
+  output/assets/{project_id}/{scene_num}/
+    0.png
+    .derived/
+      0.1080x1920.jpg
+"""
+
+import math
+import os
+import re
+
+from loguru import logger
+from PIL import Image, ImageOps
+
+from config import ASSET_DERIVATIVE_SIZES
+
+DERIVED_DIRNAME = ".derived"
+IMAGE_EXTS = (".png", ".jpg", ".jpeg", ".webp")
+
+# Derivatives are this much larger than the target so zoom effects (up to
+# 1.2x by default) still sample real detail instead of upscaling
+HEADROOM = 1.25
+JPEG_QUALITY = 92
+
+_NAME_RE = re.compile(r"^(?P<stem>.+)\.(?P<w>\d+)x(?P<h>\d+)\.jpg$")
+
+
+def parse_sizes(spec):
+    """'1080x1920,1920x1080' -> [(1080, 1920), (1920, 1080)]"""
+    sizes = []
+    for part in (spec or "").split(","):
+        w, _, h = part.strip().lower().partition("x")
+        if w.isdigit() and h.isdigit():
+            sizes.append((int(w), int(h)))
+    return sizes
+
+
+def derivative_path(src_path, width, height):
+    """Where the derivative of *src_path* for a width x height export lives."""
+    folder, name = os.path.split(src_path)
+    stem = os.path.splitext(name)[0]
+    return os.path.join(folder, DERIVED_DIRNAME, f"{stem}.{width}x{height}.jpg")
+
+
+def _is_fresh(derived, src_path):
+    try:
+        return os.path.getmtime(derived) >= os.path.getmtime(src_path)
+    except OSError:
+        return False
+
+
+def make_derivative(src_path, width, height):
+    """Create (or refresh) one derivative; returns its path, or None for non-images."""
+    if not src_path.lower().endswith(IMAGE_EXTS):
+        return None
+    out = derivative_path(src_path, width, height)
+    if _is_fresh(out, src_path):
+        return out
+
+    with Image.open(src_path) as img:
+        # Headroom only as far as the source has real pixels for it (never below 1x)
+        native = min(img.size[0] / width, img.size[1] / height)
+        scale = min(HEADROOM, max(1.0, native))
+        size = (math.ceil(width * scale), math.ceil(height * scale))
+        img.draft("RGB", size)
+        fitted = ImageOps.fit(img.convert("RGB"), size, Image.LANCZOS)
+
+    os.makedirs(os.path.dirname(out), exist_ok=True)
+    tmp = out + ".tmp"
+    fitted.save(tmp, "JPEG", quality=JPEG_QUALITY, optimize=True)
+    os.replace(tmp, out)
+    logger.debug("Derivative {}x{} -> {} ({:.0f} KB)", width, height, out, os.path.getsize(out) / 1024)
+    return out
+
+
+def prepare_derivatives(src_paths, sizes=None):
+    """Build derivatives for every image in *src_paths* at each target size.
+
+    Never raises: a failed derivative only means exports read the original.
+    """
+    sizes = sizes or parse_sizes(ASSET_DERIVATIVE_SIZES)
+    made = 0
+    for src in src_paths:
+        for width, height in sizes:
+            try:
+                if make_derivative(src, width, height):
+                    made += 1
+            except Exception as e:
+                logger.warning("Derivative {}x{} failed for {}: {}", width, height, src, e)
+    return made
+
+
+def find_derivative(src_path, width, height):
+    """Fresh derivative usable for a width x height export, or None.
+
+    Usable means same aspect ratio (identical framing) and at least the
+    export size; the smallest such derivative wins.
+    """
+    folder, name = os.path.split(src_path)
+    derived_dir = os.path.join(folder, DERIVED_DIRNAME)
+    if not os.path.isdir(derived_dir):
+        return None
+
+    stem = os.path.splitext(name)[0]
+    best = None
+    for fname in os.listdir(derived_dir):
+        m = _NAME_RE.match(fname)
+        if not m or m.group("stem") != stem:
+            continue
+        w, h = int(m.group("w")), int(m.group("h"))
+        if w * height != h * width or w < width:
+            continue
+        path = os.path.join(derived_dir, fname)
+        if _is_fresh(path, src_path) and (best is None or w < best[0]):
+            best = (w, path)
+    return best[1] if best else None
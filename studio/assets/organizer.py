@@ -6,6 +6,7 @@ Directory structure (grabber mode):
       0.png
       1.png
       ...
+      .derived/        export-ready copies (see derivatives.py)
     metadata.json
 """
 
@@ -18,6 +19,8 @@ from urllib.parse import urlparse
 import requests as http_requests
 from loguru import logger
 
+from .derivatives import prepare_derivatives
+
 # Midjourney CDN blocks bare requests — mimic a real browser
 _DL_HEADERS = {
     "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
@@ -40,6 +43,7 @@ def organize_grabber_assets(project_id, scene_num, urls, assets_dir):
     os.makedirs(scene_dir, exist_ok=True)
 
     local_files = []
+    saved_paths = []
     for i, url in enumerate(urls):
         filepath = None
         for attempt in range(1, MAX_RETRIES + 1):
@@ -59,6 +63,7 @@ def organize_grabber_assets(project_id, scene_num, urls, assets_dir):
 
                 local_url = f"/output/assets/{project_id}/{scene_num}/{filename}"
                 local_files.append(local_url)
+                saved_paths.append(filepath)
                 size_kb = os.path.getsize(filepath) / 1024
                 logger.info(
                     "Scene {}/{} downloaded ({:.0f} KB): {}",
@@ -77,6 +82,8 @@ def organize_grabber_assets(project_id, scene_num, urls, assets_dir):
                 else:
                     logger.error("Gave up downloading scene {}, file {}: {}", scene_num, i, _truncate(url, 60))
 
+    prepare_derivatives(saved_paths)
+
     # Update metadata
     _update_project_metadata(assets_dir, project_id, scene_num, urls, local_files)
 
@@ -97,6 +104,7 @@ def save_base64_assets(project_id, scene_num, images, assets_dir):
 
     local_files = []
     source_urls = []
+    saved_paths = []
 
     for i, img in enumerate(images):
         raw = img.get("data", "")
@@ -124,10 +132,13 @@ def save_base64_assets(project_id, scene_num, images, assets_dir):
 
         local_url = f"/output/assets/{project_id}/{scene_num}/{filename}"
         local_files.append(local_url)
+        saved_paths.append(filepath)
         source_urls.append(img.get("source_url", f"base64:{i}"))
         size_kb = len(data) / 1024
         logger.info("Scene {}/{} saved ({:.0f} KB)", scene_num, filename, size_kb)
 
+    prepare_derivatives(saved_paths)
+
     _update_project_metadata(assets_dir, project_id, scene_num, source_urls, local_files)
     return local_files
 
@@ -0,0 +1,212 @@
+"""Disk Cache — size-bounded, content-addressed LRU file cache.
+
+Entries are plain files named ``<key><suffix>`` inside the cache directory.
+Recency is kept in the file mtime (touched on every hit), so LRU order
+survives restarts without a separate index file.
+"""
+
+import hashlib
+import os
+import shutil
+import threading
+import uuid
+from collections import OrderedDict
+
+from loguru import logger
+
+
+def hash_key(*parts):
+    """Stable sha256 hex digest over the repr of *parts*."""
+    h = hashlib.sha256()
+    for part in parts:
+        h.update(repr(part).encode("utf-8"))
+        h.update(b"\0")
+    return h.hexdigest()
+
+
+# Content hashes memoised by (path, size, mtime) so unchanged media is only read once
+_file_hashes = {}
+_file_hashes_lock = threading.Lock()
+
+
+def file_digest(path):
+    """sha256 of a file's contents, memoised on (path, size, mtime_ns)."""
+    path = os.path.abspath(path)
+    st = os.stat(path)
+    sig = (path, st.st_size, st.st_mtime_ns)
+    with _file_hashes_lock:
+        cached = _file_hashes.get(sig)
+    if cached:
+        return cached
+
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            h.update(block)
+    digest = h.hexdigest()
+    with _file_hashes_lock:
+        _file_hashes[sig] = digest
+    return digest
+
+
+class DiskLRUCache:
+    """Thread-safe LRU cache of files on disk, bounded by total size.
+
+    ``put`` moves a finished file into the cache; ``get`` returns the cached
+    path (or None). Keys handed out via ``pin`` are never evicted until
+    ``unpin`` so a running consumer cannot lose a file mid-read.
+    """
+
+    def __init__(self, root, max_bytes, suffix="", name="cache"):
+        self.root = root
+        self.max_bytes = int(max_bytes)
+        self.suffix = suffix
+        self.name = name
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()   # key -> size, oldest first
+        self._pins = {}
+        self._bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+        os.makedirs(root, exist_ok=True)
+        self._load()
+
+    # -- index ------------------------------------------------------------
+
+    def _load(self):
+        found = []
+        for fname in os.listdir(self.root):
+            fpath = os.path.join(self.root, fname)
+            if fname.endswith(".tmp"):
+                # Leftover from an interrupted put()
+                try:
+                    os.remove(fpath)
+                except OSError:
+                    pass
+                continue
+            if not fname.endswith(self.suffix) or not os.path.isfile(fpath):
+                continue
+            st = os.stat(fpath)
+            key = fname[:len(fname) - len(self.suffix)] if self.suffix else fname
+            found.append((st.st_mtime, key, st.st_size))
+
+        for _, key, size in sorted(found):
+            self._entries[key] = size
+            self._bytes += size
+
+        logger.info("{} cache: {} entries ({:.1f} MB / {:.0f} MB) in {}",
+                    self.name, len(self._entries), self._bytes / (1024 * 1024),
+                    self.max_bytes / (1024 * 1024), self.root)
+        with self._lock:
+            self._evict()
+
+    def path_for(self, key):
+        return os.path.join(self.root, key + self.suffix)
+
+    # -- public API -------------------------------------------------------
+
+    def get(self, key):
+        """Return the cached path for *key* and mark it recently used, or None."""
+        path = self.path_for(key)
+        with self._lock:
+            if key not in self._entries:
+                self.misses += 1
+                return None
+            if not os.path.exists(path):
+                # Removed behind our back
+                self._bytes -= self._entries.pop(key)
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        return path
+
+    def put(self, key, src_path):
+        """Move *src_path* into the cache under *key*; returns the cached path.
+
+        Files larger than the whole cache are left where they are.
+        """
+        size = os.path.getsize(src_path)
+        if size > self.max_bytes:
+            logger.debug("{} cache: {} too large to cache ({:.1f} MB)",
+                         self.name, key[:12], size / (1024 * 1024))
+            return src_path
+
+        path = self.path_for(key)
+        tmp = os.path.join(self.root, f"{key}.{uuid.uuid4().hex[:8]}.tmp")
+        shutil.move(src_path, tmp)
+        os.replace(tmp, path)
+
+        with self._lock:
+            if key in self._entries:
+                self._bytes -= self._entries.pop(key)
+            self._entries[key] = size
+            self._bytes += size
+            self._evict()
+        return path
+
+    def pin(self, key):
+        with self._lock:
+            self._pins[key] = self._pins.get(key, 0) + 1
+
+    def unpin(self, key):
+        with self._lock:
+            count = self._pins.get(key, 0) - 1
+            if count > 0:
+                self._pins[key] = count
+            else:
+                self._pins.pop(key, None)
+            self._evict()
+
+    def clear(self):
+        """Remove every unpinned entry; returns the number removed."""
+        with self._lock:
+            removed = 0
+            for key in list(self._entries):
+                if key in self._pins:
+                    continue
+                self._remove(key)
+                removed += 1
+        logger.info("{} cache cleared: {} entries removed", self.name, removed)
+        return removed
+
+    def stats(self):
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+                "evictions": self.evictions,
+                "pinned": len(self._pins),
+            }
+
+    # -- internals (caller holds _lock) -----------------------------------
+
+    def _remove(self, key):
+        self._bytes -= self._entries.pop(key)
+        try:
+            os.remove(self.path_for(key))
+        except OSError:
+            pass
+
+    def _evict(self):
+        if self._bytes <= self.max_bytes:
+            return
+        for key in list(self._entries):
+            if self._bytes <= self.max_bytes:
+                break
+            if key in self._pins:
+                continue
+            self._remove(key)
+            self.evictions += 1
+            logger.debug("{} cache: evicted {}", self.name, key[:12])
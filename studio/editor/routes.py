@@ -7,25 +7,47 @@ import subprocess
 import sys
 import uuid
 import threading
+import time
 import traceback
 
-from flask import Blueprint, send_from_directory, request, jsonify, send_file
+from flask import (Blueprint, Response, send_from_directory, request, jsonify, send_file,
+                   stream_with_context)
 from loguru import logger
 
-from config import TIMELINE_EDITOR_DIR, OUTPUT_DIR, BIN_DIR
+from config import TIMELINE_EDITOR_DIR, OUTPUT_DIR, BIN_DIR, EXPORT_QUEUE_DB, EXPORT_QUEUE_WORKERS
+from studio.export_queue import ExportQueue
 from studio.fonts import FONT_REGISTRY, get_font_path, get_font_url
 
 editor_bp = Blueprint("editor", __name__)
 
 # ---------------------------------------------------------------------------
-# Export job storage & output directory
+# Export job queue & output directory
 # ---------------------------------------------------------------------------
-_export_jobs = {}
+_export_queue = None
+_export_queue_lock = threading.Lock()
 EXPORT_DIR = os.path.join(OUTPUT_DIR, "exports")
 os.makedirs(EXPORT_DIR, exist_ok=True)
 logger.info("Export output directory: {}", EXPORT_DIR)
 
 
+def _get_export_queue():
+    """Shared persistent export queue (created and started on first use)."""
+    global _export_queue
+    with _export_queue_lock:
+        if _export_queue is None:
+            _export_queue = ExportQueue(EXPORT_QUEUE_DB, _process_video,
+                                        workers=EXPORT_QUEUE_WORKERS,
+                                        transient_fields=("processor",))
+            _export_queue.start()
+    return _export_queue
+
+
+@editor_bp.record_once
+def _start_export_queue(state):
+    """Resume queued and interrupted exports as soon as the app starts."""
+    _get_export_queue()
+
+
 # ---------------------------------------------------------------------------
 # Static file serving
 # ---------------------------------------------------------------------------
@@ -122,10 +144,22 @@ def start_export():
                 logger.warning("Export missing required field: {}", field)
                 return jsonify({"error": f"Missing required field: {field}"}), 400
 
+        encode_profile = (data.get("output") or {}).get("encode_profile")
+        if encode_profile and encode_profile not in _video_processor_module().ENCODE_PROFILES:
+            logger.warning("Export with unknown encode_profile: {}", encode_profile)
+            return jsonify({"error": f"Unknown encode_profile: {encode_profile}"}), 400
+
+        try:
+            priority = int(data.get("priority", 0))
+        except (TypeError, ValueError):
+            return jsonify({"error": "priority must be an integer"}), 400
+
         job_id = str(uuid.uuid4())
         project_id = data["project_id"]
         scene_count = len(data.get("scenes", []))
-        output_filename = f"{project_id}_{job_id[:8]}.mp4"
+        is_proxy = (data.get("output") or {}).get("export_mode") == "proxy"
+        suffix = "_proxy" if is_proxy else ""
+        output_filename = f"{project_id}_{job_id[:8]}{suffix}.mp4"
         output_path = os.path.join(EXPORT_DIR, output_filename)
 
         logger.info("Export started — job={} project={} scenes={} output={}",
@@ -134,10 +168,10 @@ def start_export():
         # Log export settings
         output_cfg = data.get("output", {})
         res = output_cfg.get("resolution", {})
-        logger.debug("Export settings: {}x{} {}fps crf={} codec={}",
+        logger.debug("Export settings: {}x{} {}fps crf={} codec={} profile={}",
                       res.get("width", "?"), res.get("height", "?"),
                       output_cfg.get("fps", "?"), output_cfg.get("crf", "?"),
-                      output_cfg.get("codec", "?"))
+                      output_cfg.get("codec", "?"), encode_profile or "default")
 
         audio_cfg = data.get("audio")
         if audio_cfg and audio_cfg.get("path"):
@@ -166,92 +200,152 @@ def start_export():
                           effect.get("type", "static"),
                           (media.get("path") or "n/a")[:60])
 
-        _export_jobs[job_id] = {
+        job = {
             "status": "queued",
             "progress": 0,
             "message": "Job queued",
             "output_path": output_path,
             "output_filename": output_filename,
             "error": None,
+            "processor": None,
+            "cancelled": False,
+            "encode_profile": "proxy" if is_proxy else (encode_profile or "default"),
+            "encode_stats": None,
+            "proxy": is_proxy,
         }
+        position = _get_export_queue().submit(job_id, job, data, priority=priority)
 
-        thread = threading.Thread(
-            target=_process_video,
-            args=(job_id, data, output_path),
-            daemon=True,
-        )
-        thread.start()
-
-        return jsonify({"job_id": job_id, "status": "queued", "message": "Export job started"})
+        return jsonify({"job_id": job_id, "status": "queued", "message": "Export job queued",
+                        "queue_position": position})
 
     except Exception as e:
         logger.exception("Export start error")
         return jsonify({"error": str(e)}), 500
 
 
-def _process_video(job_id, export_data, output_path):
-    """Process video in background thread."""
+def _video_processor_module():
+    """Import the timeline-editor backend lazily (avoids circular imports at load)."""
+    backend_dir = os.path.join(os.path.dirname(__file__), "..", "..", "timeline-editor", "backend")
+    if backend_dir not in sys.path:
+        sys.path.insert(0, backend_dir)
+    import video_processor
+    return video_processor
+
+
+def _process_video(job_id, job, export_data):
+    """Run one export on an export queue worker thread."""
     short_id = job_id[:8]
+    output_path = job["output_path"]
+    processor = None
     try:
-        # Import here to avoid circular imports at module load
-        sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "..", "timeline-editor", "backend"))
-        from video_processor import VideoProcessor
+        VideoProcessor = _video_processor_module().VideoProcessor
+
+        if job["cancelled"]:
+            logger.info("[{}] Cancelled before processing started", short_id)
+            job["status"] = "cancelled"
+            return
 
         logger.info("[{}] Processing started", short_id)
-        _export_jobs[job_id]["status"] = "processing"
-        _export_jobs[job_id]["message"] = "Starting video processing"
+        job["status"] = "processing"
+        job["message"] = "Starting video processing"
 
         def update_progress(progress, message):
-            _export_jobs[job_id]["progress"] = progress
-            _export_jobs[job_id]["message"] = message
+            job["progress"] = progress
+            job["message"] = message
             logger.debug("[{}] Progress: {}% — {}", short_id, progress, message)
 
         processor = VideoProcessor(
             export_data=export_data,
             progress_callback=update_progress,
         )
+        job["processor"] = processor
         processor.process(output_path)
 
         file_size = os.path.getsize(output_path) if os.path.exists(output_path) else 0
         logger.success("[{}] Export completed — {} ({:.1f} MB)",
                        short_id, output_path, file_size / (1024 * 1024))
 
-        _export_jobs[job_id]["status"] = "completed"
-        _export_jobs[job_id]["progress"] = 100
-        _export_jobs[job_id]["message"] = "Export completed successfully"
+        job["encode_stats"] = processor.encode_stats()
+        job["status"] = "completed"
+        job["progress"] = 100
+        job["message"] = "Export completed successfully"
 
     except Exception as e:
+        if job["cancelled"] or (processor is not None and processor.cancelled):
+            logger.info("[{}] Export cancelled", short_id)
+            job["status"] = "cancelled"
+            job["message"] = "Export cancelled"
+            return
         logger.error("[{}] Export FAILED: {}", short_id, e)
         logger.debug("[{}] Traceback:\n{}", short_id, traceback.format_exc())
-        _export_jobs[job_id]["status"] = "failed"
-        _export_jobs[job_id]["error"] = str(e)
-        _export_jobs[job_id]["message"] = f"Export failed: {str(e)}"
+        job["status"] = "failed"
+        job["error"] = str(e)
+        job["message"] = f"Export failed: {str(e)}"
+    finally:
+        job["processor"] = None
+
+
+@editor_bp.route("/api/export/profiles", methods=["GET"])
+def list_encode_profiles():
+    """Named encode profiles (draft/review/final) with measured encode fps."""
+    return jsonify(_video_processor_module().get_encode_profiles())
+
+
+@editor_bp.route("/api/export/cache", methods=["GET"])
+def export_cache_stats():
+    """Scene clip cache size and hit/miss statistics."""
+    cache = _video_processor_module().get_clip_cache()
+    if cache is None:
+        return jsonify({"enabled": False})
+    return jsonify({"enabled": True, **cache.stats()})
+
+
+@editor_bp.route("/api/export/cache", methods=["DELETE"])
+def clear_export_cache():
+    """Drop all cached scene clips (clips in use by running exports are kept)."""
+    cache = _video_processor_module().get_clip_cache()
+    if cache is None:
+        return jsonify({"enabled": False, "removed": 0})
+    removed = cache.clear()
+    return jsonify({"enabled": True, "removed": removed})
+
+
+@editor_bp.route("/api/export/queue", methods=["GET"])
+def export_queue_metrics():
+    """Export queue depth, running jobs and recent wait/run times."""
+    return jsonify(_get_export_queue().metrics())
 
 
 @editor_bp.route("/api/export/<job_id>/status", methods=["GET"])
 def get_export_status(job_id):
     """Get status of an export job."""
-    if job_id not in _export_jobs:
+    job = _get_export_queue().get(job_id)
+    if job is None:
         return jsonify({"error": "Job not found"}), 404
 
-    job = _export_jobs[job_id]
     return jsonify({
         "job_id": job_id,
         "status": job["status"],
         "progress": job["progress"],
         "message": job["message"],
         "error": job["error"],
+        "encode_profile": job["encode_profile"],
+        "encode_stats": job["encode_stats"],
+        "proxy": job["proxy"],
+        "preview_ready": _preview_ready(job),
+        "priority": job.get("priority", 0),
+        "queue_position": _get_export_queue().position(job_id),
     })
 
 
 @editor_bp.route("/api/export/<job_id>/download", methods=["GET"])
 def download_export(job_id):
     """Download completed export."""
-    if job_id not in _export_jobs:
+    job = _get_export_queue().get(job_id)
+    if job is None:
         logger.warning("Download request for unknown job: {}", job_id[:8])
         return jsonify({"error": "Job not found"}), 404
 
-    job = _export_jobs[job_id]
     if job["status"] != "completed":
         logger.warning("Download attempt on non-completed job: {} (status={})", job_id[:8], job["status"])
         return jsonify({"error": "Export not completed yet"}), 400
@@ -268,14 +362,54 @@ def download_export(job_id):
     )
 
 
+def _preview_ready(job):
+    """True once the preview endpoint has something playable to serve."""
+    if job["status"] == "completed":
+        return True
+    # Proxy exports are fragmented MP4: playable once the first fragment lands
+    return (job["proxy"] and job["status"] == "processing"
+            and os.path.exists(job["output_path"])
+            and os.path.getsize(job["output_path"]) > 0)
+
+
+def _tail_export(job, chunk_size=64 * 1024, poll=0.25):
+    """Stream a proxy export file as ffmpeg appends fragments to it."""
+    path = job["output_path"]
+    while not os.path.exists(path):
+        if job["status"] not in ("queued", "processing"):
+            return
+        time.sleep(poll)
+
+    with open(path, "rb") as f:
+        while True:
+            data = f.read(chunk_size)
+            if data:
+                yield data
+                continue
+            if job["status"] not in ("queued", "processing"):
+                # Pick up whatever ffmpeg wrote between the last read and exit
+                rest = f.read()
+                if rest:
+                    yield rest
+                return
+            time.sleep(poll)
+
+
 @editor_bp.route("/api/export/<job_id>/preview", methods=["GET"])
 def preview_export(job_id):
-    """Preview completed export in browser."""
-    if job_id not in _export_jobs:
+    """Preview completed export in browser (proxy exports stream while encoding)."""
+    job = _get_export_queue().get(job_id)
+    if job is None:
         logger.warning("Preview request for unknown job: {}", job_id[:8])
         return jsonify({"error": "Job not found"}), 404
 
-    job = _export_jobs[job_id]
+    if job["proxy"] and job["status"] in ("queued", "processing"):
+        logger.info("Streaming proxy preview: {}", job["output_filename"])
+        return Response(
+            stream_with_context(_tail_export(job)),
+            mimetype="video/mp4",
+            headers={"Cache-Control": "no-cache"},
+        )
     if job["status"] != "completed":
         logger.warning("Preview attempt on non-completed job: {} (status={})", job_id[:8], job["status"])
         return jsonify({"error": "Export not completed yet"}), 400
@@ -294,11 +428,16 @@ def preview_export(job_id):
 @editor_bp.route("/api/export/<job_id>", methods=["DELETE"])
 def cancel_export(job_id):
     """Cancel/cleanup an export job."""
-    if job_id not in _export_jobs:
+    job = _get_export_queue().get(job_id)
+    if job is None:
         return jsonify({"error": "Job not found"}), 404
 
-    job = _export_jobs[job_id]
     logger.info("Cancelling export job: {} (status={})", job_id[:8], job["status"])
+    job["cancelled"] = True
+    processor = job.get("processor")
+    if processor is not None:
+        processor.cancel()
+
     if os.path.exists(job["output_path"]):
         try:
             os.remove(job["output_path"])
@@ -306,17 +445,17 @@ def cancel_export(job_id):
         except OSError as e:
             logger.warning("Could not remove export file: {}", e)
 
-    del _export_jobs[job_id]
+    _get_export_queue().remove(job_id)
     return jsonify({"message": "Job cancelled and cleaned up"})
 
 
 @editor_bp.route("/api/export/<job_id>/open-folder", methods=["POST"])
 def open_export_folder(job_id):
     """Open the folder containing the exported video and select it."""
-    if job_id not in _export_jobs:
+    job = _get_export_queue().get(job_id)
+    if job is None:
         return jsonify({"error": "Job not found"}), 404
 
-    job = _export_jobs[job_id]
     output_path = os.path.abspath(job.get("output_path", ""))
 
     if not os.path.exists(output_path):
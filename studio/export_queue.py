@@ -0,0 +1,282 @@
+"""Export Queue — persistent, prioritised job queue for video exports.
+
+Jobs live in memory as plain dicts (what the status endpoints read) and are
+mirrored to SQLite on every state change, so the queue survives a restart.
+A fixed pool of worker threads runs jobs highest priority first, FIFO
+within a priority. Jobs that were running when the process died are put
+back in the queue on startup (the clip cache makes the re-render cheap).
+Finished jobs are pruned by age and count on startup and as jobs finish.
+"""
+
+import json
+import os
+import sqlite3
+import threading
+import time
+
+from loguru import logger
+
+from config import EXPORT_QUEUE_KEEP_HOURS, EXPORT_QUEUE_KEEP_JOBS
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    job_id      TEXT PRIMARY KEY,
+    seq         INTEGER NOT NULL,
+    priority    INTEGER NOT NULL DEFAULT 0,
+    status      TEXT NOT NULL,
+    created_at  REAL NOT NULL,
+    started_at  REAL,
+    finished_at REAL,
+    payload     TEXT NOT NULL,
+    record      TEXT NOT NULL
+)
+"""
+
+ACTIVE_STATUSES = ("queued", "processing")
+
+# Wait/run times of the most recent jobs, for the metrics endpoint
+_METRICS_WINDOW = 50
+
+
+class ExportQueue:
+    """SQLite-backed job queue with a bounded worker pool.
+
+    ``run_job(job_id, job, payload)`` is called on a worker thread; it
+    updates the job dict in place (status, progress, message, ...). The
+    queue persists the dict when the job starts and when ``run_job``
+    returns. Keys in *transient_fields* (e.g. live processor objects) are
+    never written to disk. Jobs that are no longer active are kept for
+    *keep_seconds* after they finish, and at most *keep_jobs* of them.
+    """
+
+    def __init__(self, db_path, run_job, workers=1, transient_fields=(), name="export",
+                 keep_seconds=EXPORT_QUEUE_KEEP_HOURS * 3600, keep_jobs=EXPORT_QUEUE_KEEP_JOBS):
+        self.db_path = db_path
+        self.run_job = run_job
+        self.workers = max(1, int(workers))
+        self.transient_fields = set(transient_fields)
+        self.name = name
+        self.keep_seconds = keep_seconds
+        self.keep_jobs = keep_jobs
+
+        self.jobs = {}
+        self._queued = {}   # job_id -> (priority, seq, created_at)
+        self._cond = threading.Condition()
+        self._db_lock = threading.Lock()
+        self._seq = 0
+        self._threads = []
+        self._wait_times = []
+        self._run_times = []
+
+        os.makedirs(os.path.dirname(os.path.abspath(db_path)), exist_ok=True)
+        self._db = sqlite3.connect(db_path, check_same_thread=False)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute(_SCHEMA)
+        self._db.commit()
+        self.prune()
+        self._restore()
+
+    # -- persistence ------------------------------------------------------
+
+    def _restore(self):
+        """Load jobs from disk; interrupted jobs go back to the queue."""
+        rows = self._db.execute(
+            "SELECT job_id, seq, priority, status, created_at, record FROM jobs ORDER BY seq"
+        ).fetchall()
+        requeued = 0
+        for job_id, seq, priority, status, created_at, record in rows:
+            job = json.loads(record)
+            if status == "processing":
+                job.update(status="queued", progress=0, message="Re-queued after restart")
+                status = "queued"
+                requeued += 1
+            job["status"] = status
+            for field in self.transient_fields:
+                job.setdefault(field, None)
+            self.jobs[job_id] = job
+            if status == "queued":
+                self._queued[job_id] = (priority, seq, created_at)
+            self._seq = max(self._seq, seq)
+
+        if requeued:
+            with self._db_lock:
+                self._db.execute(
+                    "UPDATE jobs SET status='queued', started_at=NULL WHERE status='processing'")
+                self._db.commit()
+        logger.info("{} queue: restored {} jobs ({} queued, {} re-queued) from {}",
+                    self.name, len(rows), len(self._queued), requeued, self.db_path)
+
+    def prune(self):
+        """Delete finished jobs older than keep_seconds or beyond the newest keep_jobs."""
+        placeholders = ", ".join("?" * len(ACTIVE_STATUSES))
+        with self._cond:
+            with self._db_lock:
+                rows = self._db.execute(
+                    f"SELECT job_id, COALESCE(finished_at, created_at) FROM jobs "
+                    f"WHERE status NOT IN ({placeholders}) ORDER BY 2 DESC", ACTIVE_STATUSES
+                ).fetchall()
+                cutoff = time.time() - self.keep_seconds
+                expired = [job_id for i, (job_id, finished) in enumerate(rows)
+                           if i >= self.keep_jobs or finished < cutoff]
+                if expired:
+                    self._db.executemany("DELETE FROM jobs WHERE job_id=?", [(j,) for j in expired])
+                    self._db.commit()
+            for job_id in expired:
+                self.jobs.pop(job_id, None)
+        if expired:
+            logger.debug("{} queue: pruned {} finished jobs", self.name, len(expired))
+        return len(expired)
+
+    def _record(self, job):
+        return json.dumps({k: v for k, v in job.items() if k not in self.transient_fields})
+
+    def save(self, job_id, **timestamps):
+        """Persist the current in-memory state of *job_id*."""
+        job = self.jobs.get(job_id)
+        if job is None:
+            return
+        sets = ["status=?", "record=?"]
+        args = [job["status"], self._record(job)]
+        for column, value in timestamps.items():
+            sets.append(f"{column}=?")
+            args.append(value)
+        with self._db_lock:
+            self._db.execute(f"UPDATE jobs SET {', '.join(sets)} WHERE job_id=?", args + [job_id])
+            self._db.commit()
+
+    # -- public API -------------------------------------------------------
+
+    def start(self):
+        """Start the worker threads (idempotent)."""
+        with self._cond:
+            if self._threads:
+                return
+            for i in range(self.workers):
+                t = threading.Thread(target=self._worker, name=f"{self.name}-worker-{i}", daemon=True)
+                t.start()
+                self._threads.append(t)
+        logger.info("{} queue: {} worker(s) started", self.name, self.workers)
+
+    def submit(self, job_id, job, payload, priority=0):
+        """Queue a job. *job* is the status dict, *payload* the JSON-able job input."""
+        now = time.time()
+        job.setdefault("status", "queued")
+        job["priority"] = priority
+        job["created_at"] = now
+        with self._cond:
+            self._seq += 1
+            seq = self._seq
+            with self._db_lock:
+                self._db.execute(
+                    "INSERT INTO jobs (job_id, seq, priority, status, created_at, payload, record) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    (job_id, seq, priority, job["status"], now, json.dumps(payload), self._record(job)),
+                )
+                self._db.commit()
+            self.jobs[job_id] = job
+            self._queued[job_id] = (priority, seq, now)
+            position = self._position(job_id)
+            self._cond.notify()
+        logger.info("{} queue: job {} queued (priority={}, position={})",
+                    self.name, job_id[:8], priority, position)
+        return position
+
+    def get(self, job_id):
+        return self.jobs.get(job_id)
+
+    def position(self, job_id):
+        """1-based position among queued jobs, or None if not queued."""
+        with self._cond:
+            return self._position(job_id)
+
+    def remove(self, job_id):
+        """Forget a job (queued jobs will not run; running jobs must be cancelled by the caller)."""
+        with self._cond:
+            self._queued.pop(job_id, None)
+            job = self.jobs.pop(job_id, None)
+            with self._db_lock:
+                self._db.execute("DELETE FROM jobs WHERE job_id=?", (job_id,))
+                self._db.commit()
+        return job
+
+    def metrics(self):
+        """Queue depth, running jobs and recent wait/run times."""
+        now = time.time()
+        with self._cond:
+            queued = list(self._queued.values())
+            counts = {}
+            for job in self.jobs.values():
+                counts[job.get("status")] = counts.get(job.get("status"), 0) + 1
+            waits = list(self._wait_times)
+            runs = list(self._run_times)
+
+        by_priority = {}
+        for priority, _, _ in queued:
+            by_priority[priority] = by_priority.get(priority, 0) + 1
+
+        def _avg(values):
+            return round(sum(values) / len(values), 2) if values else None
+
+        return {
+            "workers": self.workers,
+            "depth": len(queued),
+            "running": counts.get("processing", 0),
+            "depth_by_priority": {str(k): v for k, v in sorted(by_priority.items(), reverse=True)},
+            "oldest_wait_seconds": round(now - min(c for _, _, c in queued), 2) if queued else 0.0,
+            "avg_wait_seconds": _avg(waits),
+            "max_wait_seconds": round(max(waits), 2) if waits else None,
+            "avg_run_seconds": _avg(runs),
+            "jobs_by_status": counts,
+        }
+
+    # -- scheduling -------------------------------------------------------
+
+    def _order(self):
+        # Highest priority first, then submission order
+        return sorted(self._queued, key=lambda j: (-self._queued[j][0], self._queued[j][1]))
+
+    def _position(self, job_id):
+        if job_id not in self._queued:
+            return None
+        return self._order().index(job_id) + 1
+
+    def _next(self):
+        with self._cond:
+            while not self._queued:
+                self._cond.wait()
+            job_id = self._order()[0]
+            _, _, created_at = self._queued.pop(job_id)
+            job = self.jobs[job_id]
+            started = time.time()
+            job["status"] = "processing"
+            job["started_at"] = started
+            self._wait_times = (self._wait_times + [started - created_at])[-_METRICS_WINDOW:]
+        return job_id, job, started
+
+    def _payload(self, job_id):
+        with self._db_lock:
+            row = self._db.execute("SELECT payload FROM jobs WHERE job_id=?", (job_id,)).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def _worker(self):
+        while True:
+            job_id, job, started = self._next()
+            payload = self._payload(job_id)
+            if payload is None:
+                # Removed between scheduling and start
+                continue
+            self.save(job_id, started_at=started)
+            logger.info("{} queue: job {} started (waited {:.1f}s)",
+                        self.name, job_id[:8], started - job.get("created_at", started))
+            try:
+                self.run_job(job_id, job, payload)
+            except Exception:
+                logger.exception("{} queue: job {} crashed", self.name, job_id[:8])
+                if job.get("status") in ACTIVE_STATUSES:
+                    job["status"] = "failed"
+            finally:
+                finished = time.time()
+                with self._cond:
+                    self._run_times = (self._run_times + [finished - started])[-_METRICS_WINDOW:]
+                self.save(job_id, finished_at=finished)
+                self.prune()
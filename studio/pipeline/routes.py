@@ -17,13 +17,12 @@ from datetime import datetime
 from queue import Queue
 
 import numpy as np
-import soundfile as sf
 import requests as http_requests
 from flask import Blueprint, Response, jsonify, request
 from loguru import logger
 
 from config import (
-    TTS_DIR, ALIGN_DIR, SEGMENTER_DIR, SCENES_DIR, DNA_DIR,
+    TTS_DIR, ALIGN_DIR, SEGMENTER_DIR, SCENES_DIR, DNA_DIR, TTS_ALIGN_SIDECAR,
     N8N_WEBHOOK_URL, generate_project_id,
 )
 
@@ -273,54 +272,39 @@ def _run_pipeline(job_id):
 
 def _step_tts(config, project_id):
     """Generate TTS audio and return metadata dict (includes wav_path)."""
-    from studio.tts.routes import (
-        load_model, _voice_to_lang, _phonemize_with_misaki,
-        generation_inference_lock, generate_filename, _tts_job_dir,
-    )
+    from studio.tts.routes import _voice_to_lang, generate_filename, _tts_job_dir
     from studio.tts.normalize import clean_for_tts, tts_breathing_blocks
-    from studio.tts.audio import pad_audio, concatenate_chunks, run_loudnorm
+    from studio.tts.audio import run_loudnorm
+    from studio.tts.chunked import synthesize_script_to_file
+    from studio.resample import write_sidecar
 
     text = config["text"]
     voice = config["voice"]
     speed = config["speed"]
 
-    kokoro = load_model()
     lang = _voice_to_lang(voice)
 
     tts_prompt = clean_for_tts(text)
     blocks = tts_breathing_blocks(tts_prompt)
 
-    audio_chunks = []
-    total_inference = 0.0
-
-    for block in blocks:
-        phonemes, is_ph = _phonemize_with_misaki(block, lang)
-        start = time.perf_counter()
-        with generation_inference_lock:
-            chunk_audio, _sr = kokoro.create(
-                text=phonemes, voice=voice, speed=speed,
-                lang=lang, is_phonemes=is_ph,
-            )
-        total_inference += time.perf_counter() - start
-        audio_chunks.append(chunk_audio)
-
-    if len(audio_chunks) > 1:
-        audio = concatenate_chunks(audio_chunks, sample_rate=24000,
-                                   gap_ms=80, crossfade_ms=20)
-    else:
-        audio = audio_chunks[0]
-    audio = pad_audio(audio, sample_rate=24000)
-
     basename = generate_filename(text)
     job_dir = _tts_job_dir(basename)
     os.makedirs(job_dir, exist_ok=True)
     wav_path = os.path.join(job_dir, basename + ".wav")
-    sf.write(wav_path, audio, 24000)
 
-    run_loudnorm(wav_path)
+    frames, meter, stages, normalized = synthesize_script_to_file(
+        blocks, voice, speed, lang, wav_path, gap_ms=80, crossfade_ms=20)
+    total_inference = stages["inference"]
+
+    if not normalized:
+        run_loudnorm(wav_path, measured=meter.stats())
+    if TTS_ALIGN_SIDECAR:
+        # Read by the timing step in place of the WAV
+        start = time.perf_counter()
+        write_sidecar(wav_path)
+        stages["sidecar"] = round(time.perf_counter() - start, 3)
 
-    info = sf.info(wav_path)
-    duration = info.duration
+    duration = frames / 24000
     rtf = total_inference / duration if duration > 0 else 0
     clean_prompt = re.sub(r'[\[\]]', '', text).strip()
 
@@ -340,6 +324,7 @@ def _step_tts(config, project_id):
         "speed": speed,
         "words": len(clean_prompt.split()),
         "approx_tokens": int(len(clean_prompt.split()) * 1.3),
+        "stages": stages,
         "wav_path": wav_path,
     }
 
@@ -0,0 +1,154 @@
+"""Resample — polyphase windowed-sinc sample-rate conversion.
+
+``resample`` converts between any two integer rates by the rational factor
+up/down (24 kHz -> 16 kHz is 2/3) with a Kaiser-windowed sinc low-pass, the
+same design as scipy's ``resample_poly``: content above the new Nyquist is
+filtered out instead of folding back as it does with linear interpolation.
+Only the output samples are computed — each filter phase is split again by
+the decimation factor so every product is one ``np.convolve`` over a strided
+view. ``resample_stream`` does the same chunk by chunk with bounded memory.
+
+Alignment runs Whisper at 16 kHz, so TTS output can carry a *sidecar*: the
+16 kHz mono float32 samples as a raw ``<name>.16k.f32`` file next to the
+audio, which ``load_sidecar`` memory-maps without decoding or resampling.
+"""
+
+import math
+import os
+
+import numpy as np
+
+SIDECAR_RATE = 16000
+SIDECAR_SUFFIX = ".16k.f32"
+
+_HALF_LEN_PER_RATE = 10     # filter half-length per unit of max(up, down), as resample_poly
+_KAISER_BETA = 5.0
+_STREAM_BLOCK = 1 << 16     # output samples per step of resample_stream
+
+
+class _Polyphase:
+    """Filter and bookkeeping for one up/down ratio."""
+
+    def __init__(self, src_rate, dst_rate):
+        g = math.gcd(int(src_rate), int(dst_rate))
+        self.up, self.down = int(dst_rate) // g, int(src_rate) // g
+        rate = max(self.up, self.down)
+        self.delay = _HALF_LEN_PER_RATE * rate
+        n = 2 * self.delay + 1
+        t = np.arange(n) - self.delay
+        h = np.sinc(t / rate) * np.kaiser(n, _KAISER_BETA)
+        self.h = (h / h.sum() * self.up).astype(np.float32)
+        # Input samples on either side of an output's centre that it depends on
+        self.reach = -(-n // self.up) + self.down
+
+    def out_len(self, n_in):
+        return -(-n_in * self.up // self.down)
+
+    def centre(self, n):
+        """Input index an output sample's filter is centred on (its newest tap)."""
+        return (n * self.down + self.delay) // self.up
+
+    def run(self, x, x0, n_start, count):
+        """Outputs ``n_start .. n_start + count`` from input *x*, which holds
+        global samples ``x0 ..`` (zeros outside it)."""
+        up, down, h = self.up, self.down, self.h
+        pad = self.reach + len(h)
+        xp = np.zeros(len(x) + 2 * pad, dtype=np.float32)
+        xp[pad:pad + len(x)] = x
+        y = np.empty(count, dtype=np.float32)
+        for k in range(min(up, count)):
+            n0 = n_start + k
+            m0 = n0 * down + self.delay
+            phase_taps = h[m0 % up::up]
+            base = m0 // up - x0 + pad
+            outputs = len(range(k, count, up))
+            acc = np.zeros(outputs, dtype=np.float32)
+            # y[n0 + up*i] = sum_j phase_taps[j] * x[base + down*i - j]; split j by j % down
+            for r in range(min(down, len(phase_taps))):
+                taps = phase_taps[r::down]
+                start = base - r - down * (len(taps) - 1)
+                xr = xp[start:start + down * (outputs + len(taps) - 1):down]
+                acc += np.convolve(xr, taps, mode="valid")
+            y[k::up] = acc
+        return y
+
+
+def resample(audio, src_rate, dst_rate):
+    """*audio* (mono) from *src_rate* to *dst_rate* Hz as float32."""
+    audio = np.asarray(audio, dtype=np.float32).reshape(-1)
+    if src_rate == dst_rate:
+        return audio
+    poly = _Polyphase(src_rate, dst_rate)
+    return poly.run(audio, 0, 0, poly.out_len(len(audio)))
+
+
+def resample_stream(chunks, src_rate, dst_rate):
+    """``resample`` over consecutive mono *chunks*; yields float32 output.
+
+    Matches resample() on the joined input while holding only about one
+    block of input plus the filter's reach.
+    """
+    if src_rate == dst_rate:
+        for chunk in chunks:
+            yield np.asarray(chunk, dtype=np.float32).reshape(-1)
+        return
+    poly = _Polyphase(src_rate, dst_rate)
+    buf = np.zeros(0, dtype=np.float32)
+    buf0 = 0            # global index of buf[0]
+    done = 0            # outputs yielded so far
+    for chunk in chunks:
+        buf = np.concatenate([buf, np.asarray(chunk, dtype=np.float32).reshape(-1)])
+        end = buf0 + len(buf)
+        # Outputs whose newest input sample has arrived
+        ready = max(done, (end * poly.up - poly.delay - 1) // poly.down + 1)
+        while ready - done >= _STREAM_BLOCK or (ready > done and len(buf) > 4 * _STREAM_BLOCK):
+            count = min(ready - done, _STREAM_BLOCK)
+            yield poly.run(buf, buf0, done, count)
+            done += count
+            keep_from = max(buf0, poly.centre(done) - poly.reach)
+            buf, buf0 = buf[keep_from - buf0:], keep_from
+    total = poly.out_len(buf0 + len(buf))
+    while done < total:
+        count = min(total - done, _STREAM_BLOCK)
+        yield poly.run(buf, buf0, done, count)
+        done += count
+
+
+# ---------------------------------------------------------------------------
+# 16 kHz sidecars
+# ---------------------------------------------------------------------------
+
+def sidecar_path(audio_path):
+    return os.path.splitext(audio_path)[0] + SIDECAR_SUFFIX
+
+
+def write_sidecar(audio_path, block_seconds=10):
+    """Write *audio_path* as 16 kHz mono float32 to its sidecar; returns the path."""
+    import soundfile as sf
+
+    path = sidecar_path(audio_path)
+    tmp = path + ".tmp"
+    info = sf.info(audio_path)
+    blocks = (b.mean(axis=1) if b.ndim > 1 else b
+              for b in sf.blocks(audio_path, blocksize=info.samplerate * block_seconds,
+                                 dtype="float32"))
+    with open(tmp, "wb") as f:
+        for chunk in resample_stream(blocks, info.samplerate, SIDECAR_RATE):
+            f.write(chunk.astype("<f4", copy=False).tobytes())
+    os.replace(tmp, path)
+    return path
+
+
+def load_sidecar(audio_path):
+    """Memory-map the sidecar of *audio_path*; None if missing or older than it.
+
+    Mapped copy-on-write: consumers may write to the array (torch wants a
+    writable buffer) without touching the file.
+    """
+    path = sidecar_path(audio_path)
+    try:
+        if os.path.getmtime(path) < os.path.getmtime(audio_path) or not os.path.getsize(path):
+            return None
+    except OSError:
+        return None
+    return np.memmap(path, dtype="<f4", mode="c")
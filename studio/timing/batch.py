@@ -0,0 +1,287 @@
+"""Batch alignment — align many (audio, transcript) pairs in one run.
+
+Items come from a folder (every audio file with its transcript beside it:
+``<name>.txt``, or the ``prompt`` of a TTS ``<name>.json``) or a manifest
+(a JSON list or JSONL of ``{"audio": ..., "text": ...}``). They run on a
+thread pool sharing one loaded Whisper model, chosen per batch: workers
+overlap decoding, resampling and file copies, while the model aligns one
+item at a time (its word timings come from hooks on shared modules). Each item
+gets an alignment folder with the audio and ``alignment.json``, as
+/api/timing/align writes, and the run reports throughput in audio-seconds
+aligned per wall-second.
+
+    python -m studio.timing.batch output/tts --model base.en --workers 2
+    python -m studio.timing.batch pairs.jsonl --out /tmp/alignments
+"""
+
+import argparse
+import json
+import os
+import re
+import shutil
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime
+
+import soundfile as sf
+from loguru import logger
+
+from config import ALIGN_BATCH_WORKERS, ALIGN_DIR, ALIGN_MODEL, generate_project_id
+from studio.resample import load_sidecar
+from studio.timing.routes import (
+    ALIGN_MODELS, _check_alignment_available, _decode_to_sidecar, _load_alignment_model,
+    _run_alignment,
+)
+
+AUDIO_EXTS = (".wav", ".mp3", ".flac", ".ogg")
+
+_folder_lock = threading.Lock()
+
+
+# ---------------------------------------------------------------------------
+# Collecting items
+# ---------------------------------------------------------------------------
+
+def _transcript_for(audio_path):
+    """Transcript beside *audio_path*: <name>.txt, else a TTS <name>.json prompt."""
+    stem = os.path.splitext(audio_path)[0]
+    if os.path.isfile(stem + ".txt"):
+        with open(stem + ".txt", encoding="utf-8") as f:
+            return f.read().strip() or None
+    if os.path.isfile(stem + ".json"):
+        try:
+            with open(stem + ".json", encoding="utf-8") as f:
+                return (json.load(f).get("prompt") or "").strip() or None
+        except (json.JSONDecodeError, OSError, AttributeError):
+            return None
+    return None
+
+
+def discover(folder):
+    """Every audio file under *folder* that has a transcript beside it."""
+    items = []
+    for root, dirs, files in os.walk(folder):
+        dirs[:] = sorted(d for d in dirs if d != "TRASH")
+        for name in sorted(files):
+            if os.path.splitext(name)[1].lower() not in AUDIO_EXTS:
+                continue
+            path = os.path.join(root, name)
+            text = _transcript_for(path)
+            if text:
+                items.append({"audio": path, "text": text})
+            else:
+                logger.debug("Batch align: no transcript for {}", path)
+    return items
+
+
+def load_manifest(path):
+    """Items from a JSON list or JSONL file; audio paths are relative to it."""
+    with open(path, encoding="utf-8") as f:
+        raw = f.read()
+    try:
+        entries = json.loads(raw)
+    except json.JSONDecodeError:
+        entries = [json.loads(line) for line in raw.splitlines() if line.strip()]
+    return normalize_items(entries, base_dir=os.path.dirname(os.path.abspath(path)))
+
+
+def normalize_items(entries, base_dir=None):
+    """Validate ``{"audio", "text" | "transcript"}`` entries; raises ValueError."""
+    if not isinstance(entries, list):
+        raise ValueError("items must be a list")
+    items = []
+    for i, entry in enumerate(entries):
+        if not isinstance(entry, dict):
+            raise ValueError(f"item {i}: expected an object")
+        audio = entry.get("audio")
+        text = (entry.get("text") or entry.get("transcript") or "").strip()
+        if not audio or not text:
+            raise ValueError(f"item {i}: needs audio and text")
+        if base_dir and not os.path.isabs(audio):
+            audio = os.path.join(base_dir, audio)
+        if not os.path.isfile(audio):
+            raise ValueError(f"item {i}: audio not found: {audio}")
+        if os.path.splitext(audio)[1].lower() not in AUDIO_EXTS:
+            raise ValueError(f"item {i}: unsupported format: {audio}")
+        items.append({"audio": audio, "text": text})
+    return items
+
+
+def collect(source):
+    """Items from a folder or a manifest file path."""
+    if os.path.isdir(source):
+        items = discover(source)
+    elif os.path.isfile(source):
+        items = load_manifest(source)
+    else:
+        raise ValueError(f"Not found: {source}")
+    if not items:
+        raise ValueError(f"No audio with a transcript in {source}")
+    return items
+
+
+# ---------------------------------------------------------------------------
+# Running
+# ---------------------------------------------------------------------------
+
+def _claim_folder(out_dir, audio_path):
+    """Create and return a fresh alignment folder named like /api/timing/align's."""
+    name = os.path.splitext(os.path.basename(audio_path))[0]
+    safe_name = re.sub(r'[^a-zA-Z0-9]+', '-', name[:40]).strip('-')
+    base = f"{safe_name}_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+    with _folder_lock:
+        folder, n = base, 1
+        while os.path.exists(os.path.join(out_dir, folder)):
+            n += 1
+            folder = f"{base}_{n}"
+        os.makedirs(os.path.join(out_dir, folder))
+    return folder
+
+
+def _duration(audio_path, alignment):
+    try:
+        return sf.info(audio_path).duration
+    except Exception:
+        return alignment[-1]["end"] if alignment else 0.0
+
+
+def _align_one(item, model_name, out_dir):
+    audio_path, text = item["audio"], item["text"]
+    decoded = None
+    if os.path.splitext(audio_path)[1].lower() != ".wav" and load_sidecar(audio_path) is None:
+        decoded, error = _decode_to_sidecar(audio_path)
+        if error:
+            raise RuntimeError(error[0])
+    try:
+        start = time.perf_counter()
+        alignment = _run_alignment(audio_path, text, model_name)
+        elapsed = time.perf_counter() - start
+    finally:
+        if decoded and os.path.exists(decoded):
+            os.unlink(decoded)
+    if not alignment:
+        raise RuntimeError("Alignment produced no results")
+
+    source_file = os.path.basename(audio_path)
+    folder = _claim_folder(out_dir, audio_path)
+    job_dir = os.path.join(out_dir, folder)
+    shutil.copy2(audio_path, os.path.join(job_dir, source_file))
+    result_data = {
+        "project_id": generate_project_id("pm"),
+        "source_file": source_file,
+        "folder": folder,
+        "transcript": text,
+        "alignment": alignment,
+        "word_count": len(alignment),
+        "inference_time": round(elapsed, 3),
+        "model": model_name,
+        "timestamp": datetime.now().isoformat(),
+    }
+    with open(os.path.join(job_dir, "alignment.json"), "w") as f:
+        json.dump(result_data, f, indent=2)
+    return {
+        "audio": audio_path,
+        "status": "done",
+        "folder": folder,
+        "word_count": len(alignment),
+        "audio_seconds": round(_duration(audio_path, alignment), 3),
+        "seconds": round(elapsed, 3),
+    }
+
+
+def run_batch(items, model=None, workers=None, out_dir=ALIGN_DIR, on_item=None):
+    """Align *items* (``{"audio", "text"}``) and write one folder each to *out_dir*.
+
+    *model* is a Whisper model name (default ALIGN_MODEL), loaded once and
+    shared by *workers* threads (default ALIGN_BATCH_WORKERS), which take
+    turns on it for inference.
+    *on_item(result, done, total)* is called as each item finishes. Returns
+    a summary with per-item results in input order.
+    """
+    model = model or ALIGN_MODEL
+    if model not in ALIGN_MODELS:
+        raise ValueError(f"Unknown alignment model: {model}")
+    if not _check_alignment_available():
+        raise RuntimeError("Force alignment not available (stable-ts not installed)")
+    workers = max(1, int(workers or ALIGN_BATCH_WORKERS))
+    os.makedirs(out_dir, exist_ok=True)
+
+    start = time.perf_counter()
+    _load_alignment_model(model)
+    load_seconds = time.perf_counter() - start
+
+    results = [None] * len(items)
+    done = 0
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="align") as pool:
+        futures = {pool.submit(_align_one, item, model, out_dir): i for i, item in enumerate(items)}
+        for future in as_completed(futures):
+            i = futures[future]
+            try:
+                result = future.result()
+            except Exception as e:
+                logger.warning("Batch align failed for {}: {}", items[i]["audio"], e)
+                result = {"audio": items[i]["audio"], "status": "error", "error": str(e)}
+            results[i] = result
+            done += 1
+            if on_item:
+                on_item(result, done, len(items))
+    wall = time.perf_counter() - start - load_seconds
+
+    aligned = [r for r in results if r["status"] == "done"]
+    audio_seconds = sum(r["audio_seconds"] for r in aligned)
+    summary = {
+        "model": model,
+        "workers": workers,
+        "items": len(items),
+        "aligned": len(aligned),
+        "failed": len(items) - len(aligned),
+        "audio_seconds": round(audio_seconds, 2),
+        "wall_seconds": round(wall, 2),
+        "model_load_seconds": round(load_seconds, 2),
+        "throughput": round(audio_seconds / wall, 2) if wall > 0 else None,
+        "results": results,
+    }
+    logger.success("Batch align  {}/{} items | {:.0f}s audio in {:.1f}s | {:.1f}x realtime | {} x{}",
+                   len(aligned), len(items), audio_seconds, wall,
+                   summary["throughput"] or 0, model, workers)
+    return summary
+
+
+# ---------------------------------------------------------------------------
+# CLI
+# ---------------------------------------------------------------------------
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("source", help="folder to scan, or a JSON/JSONL manifest of {audio, text}")
+    parser.add_argument("--model", default=ALIGN_MODEL, choices=ALIGN_MODELS)
+    parser.add_argument("--workers", type=int, default=ALIGN_BATCH_WORKERS)
+    parser.add_argument("--out", default=ALIGN_DIR, help="where alignment folders are written")
+    args = parser.parse_args(argv)
+
+    try:
+        items = collect(args.source)
+    except ValueError as e:
+        parser.exit(2, f"{e}\n")
+    print(f"{len(items)} items, model {args.model}, {args.workers} worker(s)")
+
+    def _report(result, done, total):
+        if result["status"] == "done":
+            print(f"[{done}/{total}] {result['audio']}: {result['word_count']} words, "
+                  f"{result['audio_seconds']:.1f}s audio in {result['seconds']:.1f}s -> {result['folder']}")
+        else:
+            print(f"[{done}/{total}] {result['audio']}: FAILED ({result['error']})")
+
+    try:
+        summary = run_batch(items, args.model, args.workers, args.out, on_item=_report)
+    except (RuntimeError, ValueError) as e:
+        parser.exit(1, f"{e}\n")
+    print(f"aligned {summary['aligned']}/{summary['items']}: {summary['audio_seconds']:.0f}s of audio "
+          f"in {summary['wall_seconds']:.1f}s = {summary['throughput'] or 0:.1f} audio-s per wall-s "
+          f"(model load {summary['model_load_seconds']:.1f}s)")
+    return 0 if not summary["failed"] else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
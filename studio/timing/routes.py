@@ -7,23 +7,36 @@ import shutil
 import subprocess
 import time
 import threading
+import uuid
 import warnings
 from datetime import datetime
+from queue import Empty, Queue
 
-import numpy as np
 import soundfile as sf
-from flask import Blueprint, jsonify, request, send_from_directory
+from flask import Blueprint, Response, jsonify, request, send_from_directory
 from loguru import logger
 
-from config import ALIGN_DIR, ALIGN_TRASH_DIR, BIN_DIR, generate_project_id
+from config import (
+    ALIGN_BATCH_WORKERS, ALIGN_DIR, ALIGN_MODEL, ALIGN_TRASH_DIR, BIN_DIR, generate_project_id,
+)
+from studio.resample import SIDECAR_RATE, load_sidecar, resample, sidecar_path
 
 timing_bp = Blueprint("timing", __name__)
 
 # ---------------------------------------------------------------------------
 # Alignment model (stable-ts / Whisper)
 # ---------------------------------------------------------------------------
-alignment_model = None
+ALIGN_MODELS = (
+    "tiny", "tiny.en", "base", "base.en", "small", "small.en", "medium", "medium.en",
+    "large-v1", "large-v2", "large-v3", "large", "turbo",
+)
+
+alignment_model = None      # the default ALIGN_MODEL, once loaded
+alignment_models = {}       # every loaded model by name
 alignment_lock = threading.Lock()
+# One align() at a time per model: word timings are read from cross-attention
+# hooks on the model's shared decoder modules
+alignment_model_locks = {}
 alignment_available = None
 
 
@@ -39,15 +52,23 @@ def _check_alignment_available():
     return alignment_available
 
 
-def _load_alignment_model():
+def _load_alignment_model(name=None):
     global alignment_model
-    if alignment_model is not None:
-        return alignment_model
+    name = name or ALIGN_MODEL
+    model = alignment_models.get(name)
+    if model is not None:
+        return model
     import stable_whisper
     with alignment_lock:
-        if alignment_model is None:
-            alignment_model = stable_whisper.load_model("tiny.en")
-    return alignment_model
+        model = alignment_models.get(name)
+        if model is None:
+            logger.info("Loading alignment model {}", name)
+            model = stable_whisper.load_model(name)
+            alignment_model_locks[name] = threading.Lock()
+            alignment_models[name] = model
+            if name == ALIGN_MODEL:
+                alignment_model = model
+    return model
 
 
 def _find_ffmpeg():
@@ -55,20 +76,54 @@ def _find_ffmpeg():
     return local if os.path.isfile(local) else shutil.which("ffmpeg")
 
 
-def _run_alignment(wav_path, prompt_text):
+def _decode_to_sidecar(audio_path):
+    """Decode a non-WAV upload with ffmpeg straight to its 16 kHz float32 sidecar.
+
+    Returns ``(sidecar_path, None)`` or ``(None, (error, status))``.
+    """
+    ffmpeg = _find_ffmpeg()
+    if not ffmpeg:
+        return None, ("ffmpeg required for non-WAV files", 400)
+    out_path = sidecar_path(audio_path)
+    result = subprocess.run(
+        [ffmpeg, "-nostdin", "-y", "-i", audio_path,
+         "-ar", str(SIDECAR_RATE), "-ac", "1", "-f", "f32le", out_path],
+        capture_output=True, timeout=60,
+    )
+    if result.returncode != 0:
+        if os.path.exists(out_path):
+            os.unlink(out_path)
+        return None, ("Audio conversion failed", 500)
+    return out_path, None
+
+
+def _load_alignment_audio(audio_path):
+    """16 kHz mono float32 for Whisper.
+
+    Memory-maps the audio's sidecar when there is a current one (TTS output,
+    decoded uploads); otherwise reads the file and resamples it.
+    """
+    audio = load_sidecar(audio_path)
+    if audio is not None:
+        logger.debug("Alignment audio from sidecar {}", sidecar_path(audio_path))
+        return audio
+    audio, sr = sf.read(audio_path, dtype="float32")
+    if audio.ndim > 1:
+        audio = audio.mean(axis=1)
+    return resample(audio, sr, SIDECAR_RATE)
+
+
+def _run_alignment(wav_path, prompt_text, model_name=None):
+    """Word timings for *wav_path*; None on failure.
+
+    Loading and resampling run concurrently; the alignment itself holds the
+    model's lock, so callers on other threads queue for it.
+    """
     try:
-        model = _load_alignment_model()
-        audio, sr = sf.read(wav_path, dtype="float32")
-        if audio.ndim > 1:
-            audio = audio.mean(axis=1)
-        if sr != 16000:
-            target_len = int(len(audio) * 16000 / sr)
-            audio = np.interp(
-                np.linspace(0, len(audio), target_len, endpoint=False),
-                np.arange(len(audio), dtype=np.float32),
-                audio,
-            ).astype(np.float32)
-        with warnings.catch_warnings(record=True) as caught:
+        model_name = model_name or ALIGN_MODEL
+        model = _load_alignment_model(model_name)
+        audio = _load_alignment_audio(wav_path)
+        with alignment_model_locks[model_name], warnings.catch_warnings(record=True) as caught:
             warnings.simplefilter("always")
             result = model.align(audio, prompt_text, language="en", fast_mode=True)
         for w in caught:
@@ -161,17 +216,10 @@ def force_align():
     conv_path = None
     try:
         if ext != ".wav":
-            ffmpeg = _find_ffmpeg()
-            if not ffmpeg:
-                return jsonify({"error": "ffmpeg required for non-WAV files"}), 400
-            conv_path = os.path.join(job_dir, os.path.splitext(original_name)[0] + "_conv.wav")
-            result = subprocess.run(
-                [ffmpeg, "-nostdin", "-y", "-i", audio_path, "-ar", "24000", "-ac", "1", conv_path],
-                capture_output=True, timeout=60,
-            )
-            if result.returncode != 0:
-                return jsonify({"error": "Audio conversion failed"}), 500
-            wav_path = conv_path
+            # Decoded once, straight to the 16 kHz alignment input
+            conv_path, error = _decode_to_sidecar(audio_path)
+            if error:
+                return jsonify({"error": error[0]}), error[1]
 
         start = time.perf_counter()
         alignment = _run_alignment(wav_path, text)
@@ -244,17 +292,10 @@ def align_and_segment():
     conv_path = None
     try:
         if ext != ".wav":
-            ffmpeg = _find_ffmpeg()
-            if not ffmpeg:
-                return jsonify({"error": "ffmpeg required for non-WAV files"}), 400
-            conv_path = os.path.join(job_dir, os.path.splitext(original_name)[0] + "_conv.wav")
-            result = subprocess.run(
-                [ffmpeg, "-nostdin", "-y", "-i", audio_path, "-ar", "24000", "-ac", "1", conv_path],
-                capture_output=True, timeout=60,
-            )
-            if result.returncode != 0:
-                return jsonify({"error": "Audio conversion failed"}), 500
-            wav_path = conv_path
+            # Decoded once, straight to the 16 kHz alignment input
+            conv_path, error = _decode_to_sidecar(audio_path)
+            if error:
+                return jsonify({"error": error[0]}), error[1]
 
         # ── Alignment ──
         start = time.perf_counter()
@@ -314,6 +355,116 @@ def align_and_segment():
                 pass
 
 
+# --- Batch alignment ---
+
+_batch_jobs = {}
+_batch_jobs_lock = threading.Lock()
+
+
+def _cleanup_old_batch_jobs(max_age_s=3600):
+    now = time.time()
+    with _batch_jobs_lock:
+        expired = [jid for jid, job in _batch_jobs.items()
+                   if job["status"] != "running" and now - job["created"] > max_age_s]
+        for jid in expired:
+            del _batch_jobs[jid]
+
+
+def _run_batch_job(job_id, items, model, workers):
+    from studio.timing.batch import run_batch
+
+    with _batch_jobs_lock:
+        job = _batch_jobs[job_id]
+    q = job["queue"]
+
+    def _progress(result, done, total):
+        q.put({"phase": "aligning", "done": done, "total": total, "item": result})
+
+    try:
+        summary = run_batch(items, model, workers, on_item=_progress)
+    except Exception as e:
+        logger.exception("Batch alignment failed")
+        q.put({"phase": "error", "message": str(e)})
+        with _batch_jobs_lock:
+            job["status"] = "error"
+        return
+    q.put({"phase": "done", "summary": summary})
+    with _batch_jobs_lock:
+        job["status"] = "done"
+
+
+@timing_bp.route("/api/timing/align-batch", methods=["POST"])
+def align_batch():
+    """Align many (audio, transcript) pairs in the background.
+
+    JSON body:
+      - folder: server-side folder to scan (audio + <name>.txt or TTS <name>.json), or
+      - items: [{"audio": path, "text": transcript}, ...]
+      - model: Whisper model for this batch (default ALIGN_MODEL)
+      - workers: alignments run at once (default ALIGN_BATCH_WORKERS)
+
+    Progress and the throughput summary stream from
+    /api/timing/align-batch/<job_id>.
+    """
+    from studio.timing.batch import collect, normalize_items
+
+    if not _check_alignment_available():
+        return jsonify({"error": "Force alignment not available (stable-ts not installed)"}), 503
+
+    data = request.get_json(silent=True) or {}
+    model = data.get("model") or ALIGN_MODEL
+    if model not in ALIGN_MODELS:
+        return jsonify({"error": f"Unknown model: {model}", "models": list(ALIGN_MODELS)}), 400
+    try:
+        workers = max(1, min(8, int(data.get("workers") or ALIGN_BATCH_WORKERS)))
+        if data.get("items"):
+            items = normalize_items(data["items"])
+        elif data.get("folder"):
+            items = collect(data["folder"])
+        else:
+            return jsonify({"error": "Provide a folder or items"}), 400
+    except (TypeError, ValueError) as e:
+        return jsonify({"error": str(e)}), 400
+
+    _cleanup_old_batch_jobs()
+    job_id = uuid.uuid4().hex[:12]
+    with _batch_jobs_lock:
+        _batch_jobs[job_id] = {"queue": Queue(), "status": "running", "created": time.time()}
+    threading.Thread(target=_run_batch_job, args=(job_id, items, model, workers),
+                     name=f"align-batch-{job_id}", daemon=True).start()
+    return jsonify({"job_id": job_id, "items": len(items), "model": model, "workers": workers}), 202
+
+
+@timing_bp.route("/api/timing/align-batch/<job_id>")
+def align_batch_progress(job_id):
+    """SSE stream of batch alignment progress, ending with the summary."""
+    with _batch_jobs_lock:
+        job = _batch_jobs.get(job_id)
+    if not job:
+        return jsonify({"error": "Unknown job ID"}), 404
+
+    def stream():
+        q = job["queue"]
+        while True:
+            try:
+                event = q.get(timeout=300)
+            except Empty:
+                with _batch_jobs_lock:
+                    status = job["status"]
+                if status != "running":
+                    yield f"data: {json.dumps({'phase': status})}\n\n"
+                    break
+                continue
+            yield f"data: {json.dumps(event)}\n\n"
+            if event["phase"] in ("done", "error"):
+                break
+
+    return Response(
+        stream(), mimetype="text/event-stream",
+        headers={"Cache-Control": "no-cache", "Connection": "keep-alive", "X-Accel-Buffering": "no"},
+    )
+
+
 @timing_bp.route("/api/timing/<folder>", methods=["DELETE"])
 def delete_alignment(folder):
     folder = os.path.basename(folder)
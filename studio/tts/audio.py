@@ -1,16 +1,22 @@
 """TTS Audio Processing Helpers
 
-Padding, chunk concatenation with crossfade, and loudnorm via ffmpeg.
+Padding, (incremental) chunk concatenation with crossfade, and loudness
+normalisation (in process, with ffmpeg loudnorm as the fallback). Long
+scripts go through ``ChunkWriter`` and ``normalize_loudness_file`` so the
+narration never has to fit in memory.
 """
 
+import contextlib
 import os
 import subprocess
+import tempfile
 
 import numpy as np
 import soundfile as sf
 from loguru import logger
 
-from config import BIN_DIR
+from config import BIN_DIR, CACHE_DIR, TTS_LOUDNORM
+from . import loudness
 
 
 def _find_ffmpeg():
@@ -26,43 +32,180 @@ def pad_audio(audio, sample_rate=24000, pad_ms=50):
     return np.concatenate([pad, audio, pad])
 
 
+class ChunkAssembler:
+    """Incremental concatenate_chunks(): add chunks as they are synthesized.
+
+    Everything except the newest chunk is final, so finished audio can be
+    handed to *on_audio* (e.g. a loudness meter) while later chunks are
+    still being generated.
+    """
+
+    def __init__(self, sample_rate=24000, gap_ms=80, crossfade_ms=20, on_audio=None):
+        self.silence = np.zeros(int(sample_rate * gap_ms / 1000), dtype=np.float32)
+        self.xfade = int(sample_rate * crossfade_ms / 1000)
+        self.on_audio = on_audio
+        self.parts = []
+        self._last = None   # newest part, may still be crossfaded into
+
+    def _emit(self, audio):
+        self.parts.append(audio)
+        if self.on_audio is not None:
+            self.on_audio(audio)
+
+    def add(self, chunk):
+        chunk = chunk.squeeze()
+        prev, xf = self._last, self.xfade
+        if prev is None:
+            self._last = chunk
+        elif xf > 0 and len(prev) >= xf and len(chunk) >= xf:
+            fade_out = np.linspace(1.0, 0.0, xf, dtype=np.float32)
+            fade_in = np.linspace(0.0, 1.0, xf, dtype=np.float32)
+            self._emit(prev[:-xf])
+            self._emit(prev[-xf:] * fade_out + chunk[:xf] * fade_in)
+            self._emit(self.silence)
+            self._last = chunk[xf:]
+        else:
+            self._emit(prev)
+            self._emit(self.silence)
+            self._last = chunk
+
+    def finish(self) -> np.ndarray:
+        """Flush the last chunk and return the joined audio."""
+        if self._last is not None:
+            self._emit(self._last)
+            self._last = None
+        if not self.parts:
+            return np.array([], dtype=np.float32)
+        return self.parts[0] if len(self.parts) == 1 else np.concatenate(self.parts)
+
+
+class ChunkWriter(ChunkAssembler):
+    """ChunkAssembler that appends finished audio to an open SoundFile.
+
+    Nothing is kept, so memory stays at the newest chunk plus the one being
+    added however long the script runs. *pad_ms* of silence goes before the
+    first and after the last chunk, as pad_audio() would add; *on_audio*
+    sees only the audio itself.
+    """
+
+    def __init__(self, out, sample_rate=24000, gap_ms=80, crossfade_ms=20,
+                 on_audio=None, pad_ms=50):
+        super().__init__(sample_rate, gap_ms, crossfade_ms, on_audio)
+        self.out = out
+        self.pad = np.zeros(int(sample_rate * pad_ms / 1000), dtype=np.float32)
+        self.chunks = 0
+        self.frames = 0
+        self._write(self.pad)
+
+    def _write(self, audio):
+        self.out.write(audio)
+        self.frames += len(audio)
+
+    def _emit(self, audio):
+        self._write(audio)
+        if self.on_audio is not None:
+            self.on_audio(audio)
+
+    def add(self, chunk):
+        self.chunks += 1
+        super().add(chunk)
+
+    def finish(self) -> int:
+        """Flush the last chunk and the trailing pad; returns frames written."""
+        if self._last is not None:
+            self._emit(self._last)
+            self._last = None
+        self._write(self.pad)
+        return self.frames
+
+
+@contextlib.contextmanager
+def scratch_wav():
+    """Path of a scratch WAV in the cache dir, deleted on exit.
+
+    On disk rather than in the system temp dir, which may be RAM-backed.
+    """
+    fd, path = tempfile.mkstemp(prefix="tts-", suffix=".wav", dir=CACHE_DIR)
+    os.close(fd)
+    try:
+        yield path
+    finally:
+        if os.path.exists(path):
+            os.remove(path)
+
+
 def concatenate_chunks(chunks: list, sample_rate: int = 24000,
                        gap_ms: int = 80, crossfade_ms: int = 20) -> np.ndarray:
     """Concatenate audio chunks with silence gaps and crossfade."""
-    if not chunks:
-        return np.array([], dtype=np.float32)
-    flat = [c.squeeze() for c in chunks]
-    if len(flat) == 1:
-        return flat[0]
-
-    gap_samples = int(sample_rate * gap_ms / 1000)
-    xfade_samples = int(sample_rate * crossfade_ms / 1000)
-    silence = np.zeros(gap_samples, dtype=np.float32)
-
-    parts = []
-    for i, chunk in enumerate(flat):
-        if i == 0:
-            parts.append(chunk)
-            continue
-        prev = parts[-1]
-        if xfade_samples > 0 and len(prev) >= xfade_samples and len(chunk) >= xfade_samples:
-            fade_out = np.linspace(1.0, 0.0, xfade_samples, dtype=np.float32)
-            fade_in = np.linspace(0.0, 1.0, xfade_samples, dtype=np.float32)
-            tail = prev[-xfade_samples:] * fade_out
-            head = chunk[:xfade_samples] * fade_in
-            parts[-1] = prev[:-xfade_samples]
-            parts.append(tail + head)
-            parts.append(silence)
-            parts.append(chunk[xfade_samples:])
-        else:
-            parts.append(silence)
-            parts.append(chunk)
+    assembler = ChunkAssembler(sample_rate, gap_ms, crossfade_ms)
+    for chunk in chunks:
+        assembler.add(chunk)
+    return assembler.finish()
+
+
+LOUDNORM_TARGET = "I=-16:LRA=11:TP=-1.5"
+
+
+def normalize_loudness(audio, sample_rate=24000, meter=None):
+    """Normalise *audio* in memory to the loudnorm targets (I=-16, TP=-1.5).
+
+    *meter* is a LoudnessMeter that already measured this audio, if any.
+    Returns ``(audio, True)`` on success and ``(audio, False)`` when the
+    in-process path is disabled or failed; the caller then writes the file
+    and runs run_loudnorm() on it.
+    """
+    if TTS_LOUDNORM != "numpy":
+        return audio, False
+    try:
+        out, info = loudness.normalize(audio, sample_rate, meter)
+    except Exception:
+        logger.exception("In-process loudnorm failed, falling back to ffmpeg")
+        return audio, False
+    logger.debug("Loudnorm: {} LUFS {:+.2f} dB{}", info["input_i"], info["gain_db"],
+                 " (limited)" if info["limited"] else "")
+    return out, True
+
+
+_FILE_BLOCK_SECONDS = 10
+
+
+def normalize_loudness_file(src_path, dst_path, meter, sample_rate=24000):
+    """Streaming normalize_loudness(): *src_path* to a 16-bit WAV at *dst_path*.
+
+    Reads the source (e.g. a ChunkWriter's scratch file, which *meter*
+    measured on the way in) a block at a time. Returns ``(frames,
+    normalized)``; when *normalized* is False *dst_path* holds the audio
+    unchanged and the caller runs run_loudnorm() on it.
+    """
+    def _blocks():
+        return sf.blocks(src_path, blocksize=sample_rate * _FILE_BLOCK_SECONDS, dtype="float32")
+
+    def _write(chunks):
+        frames = 0
+        with sf.SoundFile(dst_path, "w", sample_rate, 1) as out:
+            for chunk in chunks:
+                out.write(chunk)
+                frames += len(chunk)
+        return frames
+
+    if TTS_LOUDNORM == "numpy":
+        try:
+            chunks, info = loudness.normalize_stream(_blocks(), meter, sample_rate)
+            frames = _write(chunks)
+            logger.debug("Loudnorm: {} LUFS {:+.2f} dB (streamed)", info["input_i"], info["gain_db"])
+            return frames, True
+        except Exception:
+            logger.exception("In-process loudnorm failed, falling back to ffmpeg")
+    return _write(_blocks()), False
 
-    return np.concatenate(parts)
 
+def run_loudnorm(wav_path, measured=None):
+    """Normalize audio volume using ffmpeg loudnorm. Overwrites in-place.
 
-def run_loudnorm(wav_path):
-    """Normalize audio volume using ffmpeg loudnorm. Overwrites in-place."""
+    With *measured* (LoudnessMeter.stats() of the same audio) loudnorm runs
+    its linear second pass: one gain for the whole file instead of the
+    dynamic single-pass mode.
+    """
     ffmpeg = _find_ffmpeg()
     if not ffmpeg:
         return False
@@ -73,9 +216,13 @@ def run_loudnorm(wav_path):
             sr = info.samplerate
         except Exception:
             sr = 24000
+        af = "loudnorm=" + LOUDNORM_TARGET
+        if measured:
+            af += (":measured_I={input_i}:measured_LRA={input_lra}:measured_TP={input_tp}"
+                   ":measured_thresh={input_thresh}:linear=true").format(**measured)
         result = subprocess.run(
             [ffmpeg, "-nostdin", "-y", "-i", wav_path,
-             "-af", "loudnorm=I=-16:LRA=11:TP=-1.5",
+             "-af", af,
              "-ar", str(sr), "-ac", "1",
              tmp_path],
             capture_output=True, timeout=60,
@@ -0,0 +1,161 @@
+"""Batched Kokoro inference for multi-block generation.
+
+Running one ONNX session call per breathing block pays the per-call graph
+overhead every time. Here blocks are tokenized up front, bucketed by length
+(so padding stays small) and each bucket runs as one padded batch; the
+batched waveform is cut back per block with the model's duration output.
+
+Exports without a batch dimension (or without durations) fall back to one
+``kokoro.create`` call per block, so callers never need to care.
+"""
+
+import numpy as np
+from loguru import logger
+
+from config import TTS_BATCH_SIZE
+
+SAMPLE_RATE = 24000
+
+# Longest block in a bucket may be at most this much longer than the shortest.
+# The decoder has no padding mask, so pad tokens slightly colour the prosody
+# of short rows; a tight ratio keeps that inaudible
+MAX_PAD_RATIO = 1.3
+
+# Pause lengths kokoro.create() uses by default (seconds)
+SENTENCE_PAUSE = 0.25
+CLAUSE_PAUSE = 0.1
+
+# Models whose graph rejected a batched run (keyed by model path, so every
+# session of the pool learns it from the first failure)
+_unbatchable = set()
+
+
+def prepare_blocks(kokoro, blocks, lang="en-us"):
+    """Tokenize blocks for batching.
+
+    *blocks* is a list of ``(text, is_phonemes)``. Returns one dict per block
+    with ``index``, ``phonemes``, ``is_phonemes`` and ``tokens`` (None when
+    the block is too long for one window and must go through ``create``).
+    """
+    from kokoro_onnx.config import MAX_PHONEME_LENGTH
+
+    prepared = []
+    for i, (text, is_ph) in enumerate(blocks):
+        phonemes = text if is_ph else kokoro.tokenizer.phonemize(text, lang)
+        phonemes = " ".join(phonemes.split())
+        tokens = None
+        if 0 < len(phonemes) <= MAX_PHONEME_LENGTH:
+            tokens = kokoro.tokenizer.tokenize(phonemes) or None
+        prepared.append({"index": i, "text": text, "is_phonemes": is_ph,
+                         "phonemes": phonemes, "tokens": tokens})
+    return prepared
+
+
+def _supports_batching(kokoro):
+    if kokoro.config.model_path in _unbatchable or not kokoro.has_timings:
+        return False
+    tokens_input = next(i for i in kokoro.sess.get_inputs() if i.name == kokoro._tokens_input)
+    return not (tokens_input.shape and tokens_input.shape[0] == 1)
+
+
+def plan_batches(kokoro, prepared, batch_size=None):
+    """Group prepared blocks into buckets of similar token length.
+
+    Returns a list of lists of prepared blocks; every block appears exactly
+    once. Blocks that cannot be batched get a bucket of their own.
+    """
+    batch_size = max(1, int(batch_size or TTS_BATCH_SIZE))
+    if batch_size == 1 or not _supports_batching(kokoro):
+        return [[p] for p in prepared]
+
+    singles = [[p] for p in prepared if p["tokens"] is None]
+    ordered = sorted((p for p in prepared if p["tokens"] is not None),
+                     key=lambda p: len(p["tokens"]))
+    buckets = []
+    for p in ordered:
+        bucket = buckets[-1] if buckets else None
+        if (bucket and len(bucket) < batch_size
+                and len(p["tokens"]) <= len(bucket[0]["tokens"]) * MAX_PAD_RATIO):
+            bucket.append(p)
+        else:
+            buckets.append([p])
+    # Keep roughly script order so progress events read naturally
+    return sorted(buckets + singles, key=lambda b: b[0]["index"])
+
+
+def _voice_style(kokoro, voice):
+    return kokoro.get_voice_style(voice) if isinstance(voice, str) else voice
+
+
+def _finish(kokoro, audio, edges, phonemes):
+    """Trim and pause one block the same way kokoro.create() does."""
+    from kokoro_onnx.pauses import insert as insert_pauses
+    from kokoro_onnx.sliding import timings
+    from kokoro_onnx.trim import trim as trim_audio
+
+    audio, (head, _) = trim_audio(audio)
+    edges = np.clip(edges - head, 0, len(audio))
+    spoken = timings(kokoro.tokenizer.known(phonemes), edges, SAMPLE_RATE)
+    audio, _ = insert_pauses(audio, spoken, SAMPLE_RATE, SENTENCE_PAUSE, CLAUSE_PAUSE)
+    return audio
+
+
+def _run_padded(kokoro, bucket, style, speed):
+    """One session run for the whole bucket; returns per-block audio."""
+    from kokoro_onnx.sliding import token_edges
+
+    n = len(bucket)
+    lengths = [len(p["tokens"]) for p in bucket]
+    width = max(lengths) + 2
+    dtypes = kokoro._input_dtypes
+
+    ids = np.zeros((n, width), dtype=dtypes[kokoro._tokens_input])
+    for row, p in enumerate(bucket):
+        ids[row, 1:lengths[row] + 1] = p["tokens"]
+    styles = np.concatenate([kokoro._style_for(style, length) for length in lengths])
+    speed_input = next(i for i in kokoro.sess.get_inputs() if i.name == "speed")
+    speeds = np.full(n if speed_input.shape and speed_input.shape[0] != 1 else 1,
+                     kokoro._speed_value(speed), dtype=dtypes["speed"])
+
+    waveform, duration = kokoro.sess.run(None, {
+        kokoro._tokens_input: ids,
+        "style": styles.astype(dtypes["style"]),
+        "speed": speeds,
+    })[:2]
+    waveform = np.asarray(waveform).reshape(n, -1)
+    duration = np.asarray(duration).reshape(n, width)
+
+    # Rows are padded to the longest in frames; all share one hop size
+    hop = waveform.shape[1] / duration.sum(axis=1).max()
+    audios = []
+    for row, p in enumerate(bucket):
+        frames = duration[row, :lengths[row] + 2]
+        end = min(waveform.shape[1], int(round(frames.sum() * hop)))
+        edges = token_edges(frames, end)[1:]
+        audios.append(_finish(kokoro, waveform[row, :end], edges, p["phonemes"]))
+    return audios
+
+
+def run_batch(kokoro, bucket, voice, speed=1.0, lang="en-us"):
+    """Synthesize one bucket from plan_batches(); returns audio per block.
+
+    *kokoro* must not be used by another thread meanwhile (lease it from
+    the session pool).
+    """
+    style = _voice_style(kokoro, voice)
+
+    if len(bucket) > 1:
+        try:
+            return _run_padded(kokoro, bucket, style, speed)
+        except Exception as e:
+            # Static batch dim or a graph that cannot broadcast speed/style
+            _unbatchable.add(kokoro.config.model_path)
+            logger.warning("Batched Kokoro inference unavailable ({}), falling back to per-block", e)
+
+    audios = []
+    for p in bucket:
+        audio, _sr = kokoro.create(text=p["phonemes"] if p["tokens"] else p["text"],
+                                   voice=style, speed=speed, lang=lang,
+                                   is_phonemes=bool(p["tokens"]) or p["is_phonemes"])
+        audios.append(audio)
+    return audios
@@ -0,0 +1,175 @@
+"""Voice Blends — SLERP / LERP of Kokoro style tensors, cached and nameable.
+
+A voice is a (510, 1, 256) style tensor, one row per phoneme count. Blends
+are interpolated row-wise in one vectorised pass and kept in a small LRU
+keyed by (voice_a, voice_b, ratio, method), so repeating a blend (every
+stream, every multi-voice segment) costs a dict lookup instead of two
+archive reads and 510 interpolations.
+
+Named blends are blend specs saved under a name in ``voice_blends.json``;
+their embeddings stay pinned in the cache once built.
+"""
+
+import json
+import os
+import re
+import threading
+from collections import OrderedDict
+
+import numpy as np
+from loguru import logger
+
+from config import TTS_BLEND_CACHE_SIZE, VOICE_BLENDS_FILE
+
+METHODS = ("slerp", "lerp")
+NAME_RE = re.compile(r"^[a-z0-9][a-z0-9_-]{0,39}$")
+
+
+# ---------------------------------------------------------------------------
+# Interpolation
+# ---------------------------------------------------------------------------
+
+def slerp(v0: np.ndarray, v1: np.ndarray, t: float) -> np.ndarray:
+    """Spherical interpolation along the last axis, for every leading index."""
+    v0 = np.asarray(v0, dtype=np.float64)
+    v1 = np.asarray(v1, dtype=np.float64)
+    n0 = np.linalg.norm(v0, axis=-1, keepdims=True)
+    n1 = np.linalg.norm(v1, axis=-1, keepdims=True)
+    dot = np.clip(np.sum(v0 * v1, axis=-1, keepdims=True) / (n0 * n1 + 1e-10), -1.0, 1.0)
+    omega = np.arccos(dot)
+    # Nearly parallel rows fall back to LERP (sin(omega) ~ 0)
+    parallel = np.abs(omega) < 1e-6
+    so = np.where(parallel, 1.0, np.sin(omega))
+    w0 = np.where(parallel, 1.0 - t, np.sin((1.0 - t) * omega) / so)
+    w1 = np.where(parallel, t, np.sin(t * omega) / so)
+    return (w0 * v0 + w1 * v1).astype(np.float32)
+
+
+def lerp(v0: np.ndarray, v1: np.ndarray, t: float) -> np.ndarray:
+    return ((1.0 - t) * v0 + t * v1).astype(np.float32)
+
+
+# ---------------------------------------------------------------------------
+# Embedding cache
+# ---------------------------------------------------------------------------
+
+_cache = OrderedDict()
+_pinned = set()
+_cache_lock = threading.Lock()
+_hits = 0
+_misses = 0
+
+
+def blend_key(voice_a, voice_b, ratio, method):
+    return voice_a, voice_b, round(float(ratio), 4), method
+
+
+def blend_embedding(kokoro, voice_a, voice_b, ratio, method="slerp", pin=False):
+    """Blended style tensor for two voices (cached; treat as read-only)."""
+    global _hits, _misses
+    key = blend_key(voice_a, voice_b, ratio, method)
+    with _cache_lock:
+        embedding = _cache.get(key)
+        if embedding is not None:
+            _cache.move_to_end(key)
+            _hits += 1
+            if pin:
+                _pinned.add(key)
+            return embedding
+        _misses += 1
+
+    embed_a = kokoro.get_voice_style(voice_a)
+    embed_b = kokoro.get_voice_style(voice_b)
+    fn = slerp if method == "slerp" else lerp
+    embedding = fn(embed_a, embed_b, key[2])
+    embedding.setflags(write=False)
+
+    with _cache_lock:
+        _cache[key] = embedding
+        if pin:
+            _pinned.add(key)
+        # Evict unpinned entries, oldest first
+        for old in list(_cache):
+            if len(_cache) - len(_pinned) <= TTS_BLEND_CACHE_SIZE:
+                break
+            if old not in _pinned:
+                del _cache[old]
+    return embedding
+
+
+def unpin(voice_a, voice_b, ratio, method):
+    """Let a deleted named blend's embedding age out of the cache."""
+    with _cache_lock:
+        _pinned.discard(blend_key(voice_a, voice_b, ratio, method))
+
+
+def cache_stats():
+    with _cache_lock:
+        lookups = _hits + _misses
+        return {
+            "entries": len(_cache),
+            "pinned": len(_pinned),
+            "hits": _hits,
+            "misses": _misses,
+            "hit_rate": round(_hits / lookups, 4) if lookups else 0.0,
+        }
+
+
+# ---------------------------------------------------------------------------
+# Named blends
+# ---------------------------------------------------------------------------
+
+class BlendRegistry:
+    """Named blend specs ({voice_a, voice_b, ratio, method}) in a JSON file."""
+
+    def __init__(self, path):
+        self.path = path
+        self._lock = threading.Lock()
+        self._blends = {}
+        if os.path.isfile(path):
+            try:
+                with open(path) as f:
+                    self._blends = json.load(f)
+            except (json.JSONDecodeError, OSError) as e:
+                logger.warning("Ignoring unreadable voice blends file {}: {}", path, e)
+
+    def _save(self):
+        # caller holds _lock
+        tmp = self.path + ".tmp"
+        with open(tmp, "w") as f:
+            json.dump(self._blends, f, indent=2)
+        os.replace(tmp, self.path)
+
+    def list(self):
+        with self._lock:
+            return [{"name": name, **spec} for name, spec in sorted(self._blends.items())]
+
+    def get(self, name):
+        with self._lock:
+            spec = self._blends.get(name)
+            return dict(spec) if spec else None
+
+    def add(self, name, spec):
+        with self._lock:
+            self._blends[name] = dict(spec)
+            self._save()
+
+    def remove(self, name):
+        with self._lock:
+            if self._blends.pop(name, None) is None:
+                return False
+            self._save()
+            return True
+
+
+_registry = None
+_registry_lock = threading.Lock()
+
+
+def get_registry():
+    """Lazy-load the named blend registry."""
+    global _registry
+    with _registry_lock:
+        if _registry is None:
+            _registry = BlendRegistry(VOICE_BLENDS_FILE)
+        return _registry
@@ -0,0 +1,98 @@
+"""Block Audio Cache — synthesized PCM per breathing block.
+
+Editing one sentence of a long script should only re-synthesize that
+sentence. Each block's raw float32 PCM (24 kHz mono) is cached on disk,
+keyed by everything that changes the model output: phonemes, voice (name
+or blended embedding), speed, language and model file. Disk use is bounded
+by the shared LRU file cache.
+"""
+
+import hashlib
+import os
+import tempfile
+import threading
+
+import numpy as np
+from loguru import logger
+
+from config import MODELS_DIR, TTS_BLOCK_CACHE_DIR, TTS_BLOCK_CACHE_MAX_MB
+from studio.cache import DiskLRUCache, hash_key
+
+_cache = None
+_cache_lock = threading.Lock()
+
+
+def get_block_cache():
+    """Lazy-open the block cache (None when disabled)."""
+    global _cache
+    if TTS_BLOCK_CACHE_MAX_MB <= 0:
+        return None
+    with _cache_lock:
+        if _cache is None:
+            _cache = DiskLRUCache(TTS_BLOCK_CACHE_DIR, TTS_BLOCK_CACHE_MAX_MB * 1024 * 1024,
+                                  suffix=".f32", name="TTS block")
+        return _cache
+
+
+def _model_version():
+    # File name + size identifies a Kokoro release without hashing 300 MB
+    from .routes import MODELS
+    onnx_file = MODELS["kokoro"]["onnx_file"]
+    try:
+        return onnx_file, os.path.getsize(os.path.join(MODELS_DIR, onnx_file))
+    except OSError:
+        return onnx_file, None
+
+
+def _voice_id(voice):
+    if isinstance(voice, str):
+        return voice
+    return hashlib.sha256(np.ascontiguousarray(voice, dtype=np.float32).tobytes()).hexdigest()
+
+
+def block_key(block, voice, speed, lang):
+    """Cache key for one prepared block (see batching.prepare_blocks)."""
+    return hash_key(block["phonemes"], _voice_id(voice), round(float(speed), 3), lang,
+                    _model_version())
+
+
+def lookup_blocks(prepared, voice, speed, lang):
+    """Split prepared blocks into cached audio and blocks still to synthesize.
+
+    Returns ``(audio_by_index, keys_by_index, pending)``.
+    """
+    cache = get_block_cache()
+    audio, keys, pending = {}, {}, []
+    for block in prepared:
+        if cache is None:
+            pending.append(block)
+            continue
+        key = block_key(block, voice, speed, lang)
+        keys[block["index"]] = key
+        path = cache.get(key)
+        if path:
+            try:
+                audio[block["index"]] = np.fromfile(path, dtype=np.float32)
+                continue
+            except OSError as e:
+                logger.warning("TTS block cache read failed for {}: {}", key[:12], e)
+        pending.append(block)
+    return audio, keys, pending
+
+
+def store_block(key, audio):
+    """Add one block's PCM to the cache (no-op when disabled or key is None)."""
+    cache = get_block_cache()
+    if cache is None or key is None:
+        return
+    # .tmp: DiskLRUCache sweeps leftovers on start if the process dies mid-write
+    fd, tmp = tempfile.mkstemp(suffix=".tmp", dir=TTS_BLOCK_CACHE_DIR)
+    try:
+        with os.fdopen(fd, "wb") as f:
+            np.ascontiguousarray(audio, dtype=np.float32).tofile(f)
+        cache.put(key, tmp)
+    except OSError as e:
+        logger.warning("TTS block cache write failed for {}: {}", key[:12], e)
+    finally:
+        if os.path.exists(tmp):
+            os.remove(tmp)
@@ -0,0 +1,237 @@
+"""Chunked synthesis — G2P, inference and assembly as overlapping stages.
+
+    G2P thread ──> inference (caller thread) ──> assembly thread
+    (misaki, tokenize)  (cache lookup, batches)     (crossfade, loudness meter)
+
+G2P for the next blocks runs while the current bucket is on the model, and
+finished blocks are crossfaded and metered while the next bucket infers, so
+a script takes roughly its inference time end to end. The returned meter
+already holds the loudness of the joined audio, so normalisation needs no
+extra analysis pass. ``synthesize_script_to_file`` assembles straight to
+disk instead of memory, for scripts of any length.
+
+``stream_blocks`` is the listen-only variant: the same G2P thread ahead of
+inference, but each block is yielded the moment it is synthesized.
+"""
+
+import queue
+import threading
+import time
+
+import numpy as np
+import soundfile as sf
+
+from config import TTS_BATCH_SIZE
+from .audio import ChunkAssembler, ChunkWriter, normalize_loudness_file, scratch_wav
+from .batching import CLAUSE_PAUSE, SENTENCE_PAUSE, plan_batches, prepare_blocks, run_batch
+from .block_cache import lookup_blocks, store_block
+from .loudness import LoudnessMeter
+
+SAMPLE_RATE = 24000
+
+_END = object()
+
+
+class GenerationAborted(Exception):
+    """Raised when *should_abort* returns True between buckets."""
+
+
+def synthesize_script(blocks, voice, speed, lang, gap_ms=80, crossfade_ms=20,
+                      on_progress=None, should_abort=None, out=None):
+    """Synthesize breathing *blocks* into one crossfaded track.
+
+    *voice* is a voice name or embedding. *on_progress(done, total, block,
+    batch, cached)* is called before each bucket runs. Returns ``(audio,
+    meter, stages)``: the joined float32 audio (unpadded), its
+    LoudnessMeter and per-stage timings in seconds. With *out* (an open
+    SoundFile) the track is written there as it is assembled, padded as
+    pad_audio() would, and *audio* is the number of frames written.
+    """
+    from .routes import _phonemize_with_misaki, get_pool, load_model
+
+    kokoro = load_model()
+    total = len(blocks)
+    stop = threading.Event()
+    stages = {"g2p": 0.0, "g2p_wait": 0.0, "inference": 0.0, "assembly": 0.0}
+
+    # -- stage 1: G2P ---------------------------------------------------
+    prepared_q = queue.Queue()
+
+    def _g2p():
+        try:
+            for i, block in enumerate(blocks):
+                if stop.is_set():
+                    break
+                start = time.perf_counter()
+                p = prepare_blocks(kokoro, [_phonemize_with_misaki(block, lang)], lang)[0]
+                p["index"] = i
+                stages["g2p"] += time.perf_counter() - start
+                prepared_q.put(p)
+        except Exception as e:
+            prepared_q.put(e)
+        prepared_q.put(_END)
+
+    # -- stage 3: assembly ----------------------------------------------
+    meter = LoudnessMeter(SAMPLE_RATE)
+    if out is None:
+        assembler = ChunkAssembler(SAMPLE_RATE, gap_ms, crossfade_ms, on_audio=meter.add)
+    else:
+        assembler = ChunkWriter(out, SAMPLE_RATE, gap_ms, crossfade_ms, on_audio=meter.add)
+    audio_q = queue.Queue()
+    assembly_error = []
+
+    def _assemble():
+        while True:
+            chunk = audio_q.get()
+            if chunk is _END:
+                return
+            if assembly_error:
+                continue
+            start = time.perf_counter()
+            try:
+                assembler.add(chunk)
+            except Exception as e:
+                assembly_error.append(e)
+            stages["assembly"] += time.perf_counter() - start
+
+    g2p_thread = threading.Thread(target=_g2p, name="tts-g2p", daemon=True)
+    asm_thread = threading.Thread(target=_assemble, name="tts-assemble", daemon=True)
+    g2p_thread.start()
+    asm_thread.start()
+
+    # -- stage 2: inference ---------------------------------------------
+    batch_size = max(1, TTS_BATCH_SIZE)
+    done = n_cached = 0
+    exhausted = False
+    try:
+        while not exhausted:
+            # Wait for the next block, then take whatever else G2P has ready
+            start = time.perf_counter()
+            window = [prepared_q.get()]
+            stages["g2p_wait"] += time.perf_counter() - start
+            while len(window) < batch_size:
+                try:
+                    window.append(prepared_q.get_nowait())
+                except queue.Empty:
+                    break
+            if window[-1] is _END:
+                window.pop()
+                exhausted = True
+            for item in window:
+                if isinstance(item, Exception):
+                    raise item
+            if not window:
+                break
+
+            cached, keys, pending = lookup_blocks(window, voice, speed, lang)
+            n_cached += len(cached)
+            results = dict(cached)
+            for bucket in plan_batches(kokoro, pending, batch_size):
+                if should_abort and should_abort():
+                    raise GenerationAborted()
+                done_before = done + len(results)
+                if on_progress:
+                    on_progress(done_before + len(bucket), total,
+                                blocks[bucket[0]["index"]], len(bucket), n_cached)
+                start = time.perf_counter()
+                with get_pool().session() as session:
+                    audios = run_batch(session, bucket, voice, speed=speed, lang=lang)
+                stages["inference"] += time.perf_counter() - start
+                for p, chunk_audio in zip(bucket, audios):
+                    results[p["index"]] = chunk_audio
+                    store_block(keys.get(p["index"]), chunk_audio)
+
+            # Hand over in script order; the assembler only appends
+            for index in sorted(results):
+                audio_q.put(results[index])
+            done += len(results)
+    finally:
+        stop.set()
+        audio_q.put(_END)
+        asm_thread.join()
+        g2p_thread.join()
+
+    if assembly_error:
+        raise assembly_error[0]
+    audio = assembler.finish()
+    stages = {k: round(v, 3) for k, v in stages.items()}
+    stages["cached_blocks"] = n_cached
+    return audio, meter, stages
+
+
+def synthesize_script_to_file(blocks, voice, speed, lang, wav_path, gap_ms=80, crossfade_ms=20,
+                              on_progress=None, should_abort=None, on_normalize=None):
+    """synthesize_script() into a padded, loudness-normalised 16-bit WAV.
+
+    Blocks are crossfaded into a float32 scratch file as they finish, metered
+    on the way, then normalised from that file into *wav_path* a block at a
+    time; peak memory is about two blocks whatever the script length.
+    *on_normalize()* is called between the two passes. Returns ``(frames,
+    meter, stages, normalized)``; when *normalized* is False the caller runs
+    run_loudnorm() on *wav_path*.
+    """
+    with scratch_wav() as raw_path:
+        with sf.SoundFile(raw_path, "w", SAMPLE_RATE, 1, subtype="FLOAT") as raw:
+            _, meter, stages = synthesize_script(
+                blocks, voice, speed, lang, gap_ms, crossfade_ms,
+                on_progress=on_progress, should_abort=should_abort, out=raw)
+        if on_normalize:
+            on_normalize()
+        start = time.perf_counter()
+        frames, normalized = normalize_loudness_file(raw_path, wav_path, meter, SAMPLE_RATE)
+        stages["loudnorm"] = round(time.perf_counter() - start, 3)
+    return frames, meter, stages, normalized
+
+
+def stream_blocks(blocks, voice, speed, lang, stop=None, on_block=None):
+    """Yield ``(audio, sample_rate)`` per breathing block as soon as it exists.
+
+    G2P for later blocks runs on its own thread while earlier blocks infer;
+    one pool session is leased for the whole stream. Each chunk ends with
+    the pause its closing punctuation calls for, so chunks play back to
+    back. Setting *stop* (a threading.Event) ends the stream after the
+    current block. *on_block(chars, seconds)* reports each block's G2P +
+    inference cost.
+    """
+    from kokoro_onnx.chunker import pause_after
+
+    from .routes import _phonemize_with_misaki, get_pool
+
+    stop = stop or threading.Event()
+    phonemes_q = queue.Queue()
+
+    def _g2p():
+        try:
+            for block in blocks:
+                if stop.is_set():
+                    break
+                start = time.perf_counter()
+                phonemes, is_ph = _phonemize_with_misaki(block, lang)
+                phonemes_q.put((block, phonemes, is_ph, time.perf_counter() - start))
+        except Exception as e:
+            phonemes_q.put(e)
+        phonemes_q.put(_END)
+
+    g2p_thread = threading.Thread(target=_g2p, name="tts-stream-g2p", daemon=True)
+    g2p_thread.start()
+    try:
+        with get_pool().session() as session:
+            for i in range(len(blocks)):
+                item = phonemes_q.get()
+                if item is _END or stop.is_set():
+                    break
+                if isinstance(item, Exception):
+                    raise item
+                block, phonemes, is_ph, g2p_seconds = item
+                start = time.perf_counter()
+                audio, sr = session.create(text=phonemes, voice=voice, speed=speed,
+                                           lang=lang, is_phonemes=is_ph)
+                if on_block:
+                    on_block(len(block), g2p_seconds + time.perf_counter() - start)
+                pause = pause_after(phonemes, SENTENCE_PAUSE, CLAUSE_PAUSE) if i < len(blocks) - 1 else 0.0
+                if pause:
+                    audio = np.concatenate([audio, np.zeros(int(pause * sr), dtype=audio.dtype)])
+                yield audio, sr
+    finally:
+        stop.set()
+        g2p_thread.join()
@@ -0,0 +1,326 @@
+"""Loudness — incremental ITU-R BS.1770 / EBU R128 measurement and normalisation.
+
+``LoudnessMeter`` is fed audio as it is produced and keeps only 100 ms
+energy sums, so integrated loudness, loudness range and the gating
+threshold are known the moment the last block is assembled — no second
+read of the finished file. ``normalize`` then applies one gain to reach
+the target loudness and a look-ahead true-peak limiter, in memory;
+``normalize_stream`` does the same a chunk at a time for long tracks.
+
+K-weighting uses scipy's ``sosfilt`` when scipy is installed; otherwise
+the two biquads run as an FFT-convolved FIR (their impulse response has
+decayed below float32 precision well within the kernel).
+"""
+
+import math
+
+import numpy as np
+
+ABSOLUTE_GATE = -70.0       # LUFS
+RELATIVE_GATE = -10.0       # LU below the absolute-gated mean (integrated)
+LRA_RELATIVE_GATE = -20.0   # LU below the absolute-gated mean (loudness range)
+
+_SUBBLOCK = 0.1             # seconds; momentary = 4, short-term = 30 sub-blocks
+_FIR_TAPS = 16384
+
+# Same targets as the ffmpeg path (loudnorm=I=-16:LRA=11:TP=-1.5)
+TARGET_I = -16.0
+TARGET_TP = -1.5
+
+_TP_RATE = 192000           # BS.1770 true peak: oversample to 192 kHz (4x at 48 kHz)
+_TP_TAPS_PER_PHASE = 32
+_LIMITER_LOOKAHEAD = 0.005  # seconds the limiter sees a peak coming
+_LIMITER_MARGIN_DB = 0.2    # headroom for peaks the gain modulation itself creates
+
+
+def _fft_convolve(x, kernel):
+    """Full linear convolution via FFT."""
+    n = len(x) + len(kernel) - 1
+    size = 1 << int(math.ceil(math.log2(n)))
+    return np.fft.irfft(np.fft.rfft(x, size) * np.fft.rfft(kernel, size), size)[:n]
+
+
+def k_weighting_sos(sample_rate):
+    """Second-order sections of the BS.1770 K-weighting filter at *sample_rate*.
+
+    Coefficients are derived from the analogue prototype (as libebur128 /
+    ffmpeg do) so any sample rate matches the 48 kHz reference table.
+    """
+    # Stage 1: high-shelf (head effects)
+    f0, gain, q = 1681.974450955533, 3.999843853973347, 0.7071752369554196
+    k = math.tan(math.pi * f0 / sample_rate)
+    vh = 10.0 ** (gain / 20.0)
+    vb = vh ** 0.4996667741545416
+    a0 = 1.0 + k / q + k * k
+    shelf = [(vh + vb * k / q + k * k) / a0, 2.0 * (k * k - vh) / a0, (vh - vb * k / q + k * k) / a0,
+             1.0, 2.0 * (k * k - 1.0) / a0, (1.0 - k / q + k * k) / a0]
+    # Stage 2: RLB high-pass
+    f0, q = 38.13547087602444, 0.5003270373238773
+    k = math.tan(math.pi * f0 / sample_rate)
+    a0 = 1.0 + k / q + k * k
+    highpass = [1.0, -2.0, 1.0, 1.0, 2.0 * (k * k - 1.0) / a0, (1.0 - k / q + k * k) / a0]
+    return np.array([shelf, highpass], dtype=np.float64)
+
+
+def _impulse_response(sos, n):
+    """First *n* samples of the cascade's impulse response (pure Python, once)."""
+    x = [1.0] + [0.0] * (n - 1)
+    for b0, b1, b2, _, a1, a2 in sos:
+        y, x1, x2, y1, y2 = [], 0.0, 0.0, 0.0, 0.0
+        for v in x:
+            out = b0 * v + b1 * x1 + b2 * x2 - a1 * y1 - a2 * y2
+            x2, x1, y2, y1 = x1, v, y1, out
+            y.append(out)
+        x = y
+    return np.array(x, dtype=np.float64)
+
+
+class _KWeighting:
+    """Streaming K-weighting filter (state carried across chunks)."""
+
+    def __init__(self, sample_rate):
+        self.sos = k_weighting_sos(sample_rate)
+        try:
+            from scipy.signal import sosfilt, sosfilt_zi
+            self._sosfilt = sosfilt
+            self._zi = sosfilt_zi(self.sos) * 0.0
+        except ImportError:
+            self._sosfilt = None
+            self._fir = _impulse_response(self.sos, _FIR_TAPS)
+            self._history = np.zeros(_FIR_TAPS - 1)
+
+    def process(self, x):
+        x = np.asarray(x, dtype=np.float64)
+        if self._sosfilt is not None:
+            y, self._zi = self._sosfilt(self.sos, x, zi=self._zi)
+            return y
+        # Overlap-save: prepend the input history so the kernel sees continuity
+        buf = np.concatenate([self._history, x])
+        self._history = buf[-(_FIR_TAPS - 1):]
+        return _fft_convolve(buf, self._fir)[_FIR_TAPS - 1:len(buf)]
+
+
+def _lufs(energy):
+    return -0.691 + 10.0 * np.log10(np.maximum(energy, 1e-20))
+
+
+class LoudnessMeter:
+    """Incremental EBU R128 meter for mono audio."""
+
+    def __init__(self, sample_rate=24000):
+        self.sample_rate = sample_rate
+        self._filter = _KWeighting(sample_rate)
+        self._sub_len = int(round(sample_rate * _SUBBLOCK))
+        self._pending = np.zeros(0)
+        self._subblocks = []    # mean square of each complete 100 ms sub-block
+        self.samples = 0
+        self.peak = 0.0         # sample peak
+        self._true_peak = 0.0   # inter-sample peak, for samples with full interpolator context
+        self._tp_tail = np.zeros(_TP_TAPS_PER_PHASE)
+
+    def add(self, audio):
+        """Feed the next stretch of audio (any length)."""
+        audio = np.asarray(audio).reshape(-1)
+        if not len(audio):
+            return
+        self.samples += len(audio)
+        self.peak = max(self.peak, float(np.max(np.abs(audio))))
+        # The interpolator reaches half its taps either side: measure the
+        # samples whose context is complete and carry the rest over
+        half = _TP_TAPS_PER_PHASE // 2
+        buf = np.concatenate([self._tp_tail, audio])
+        env = true_peak_envelope(buf, self.sample_rate)
+        self._true_peak = max(self._true_peak, float(env[half:len(buf) - half].max()))
+        self._tp_tail = buf[-_TP_TAPS_PER_PHASE:]
+        weighted = np.concatenate([self._pending, self._filter.process(audio)])
+        whole = len(weighted) // self._sub_len * self._sub_len
+        if whole:
+            squares = weighted[:whole].reshape(-1, self._sub_len) ** 2
+            self._subblocks.extend(squares.mean(axis=1).tolist())
+        self._pending = weighted[whole:]
+
+    def _windows(self, n):
+        """Mean square of every n-sub-block window (100 ms hop)."""
+        sub = np.asarray(self._subblocks)
+        if len(sub) < n:
+            return np.zeros(0)
+        csum = np.concatenate([[0.0], np.cumsum(sub)])
+        return (csum[n:] - csum[:-n]) / n
+
+    def integrated(self):
+        """Integrated loudness (LUFS) and its relative gate threshold."""
+        blocks = self._windows(4)
+        gated = blocks[_lufs(blocks) > ABSOLUTE_GATE]
+        if not len(gated):
+            return -70.0, -70.0
+        threshold = _lufs(gated.mean()) + RELATIVE_GATE
+        gated = gated[_lufs(gated) > threshold]
+        return float(_lufs(gated.mean())), float(threshold)
+
+    def loudness_range(self):
+        """EBU Tech 3342 loudness range (LU) from 3 s short-term windows."""
+        short = self._windows(30)
+        gated = short[_lufs(short) > ABSOLUTE_GATE]
+        if len(gated) < 2:
+            return 0.0
+        gated = gated[_lufs(gated) > _lufs(gated.mean()) + LRA_RELATIVE_GATE]
+        if len(gated) < 2:
+            return 0.0
+        low, high = np.percentile(_lufs(gated), [10, 95])
+        return float(high - low)
+
+    def true_peak(self):
+        """True peak (dBTP) of everything added so far, as true_peak() on the whole."""
+        half = _TP_TAPS_PER_PHASE // 2
+        tail = true_peak_envelope(np.concatenate([self._tp_tail, np.zeros(half)]), self.sample_rate)
+        peak = max(self._true_peak, float(tail[half:-half].max()) if self.samples else 0.0)
+        return 20.0 * math.log10(peak) if peak > 0 else -99.0
+
+    def stats(self):
+        """Measurements in the shape ffmpeg loudnorm's print_format=json uses."""
+        integrated, threshold = self.integrated()
+        return {
+            "input_i": round(integrated, 2),
+            "input_lra": round(self.loudness_range(), 2),
+            "input_tp": round(self.true_peak(), 2),
+            "input_thresh": round(threshold, 2),
+            "duration": round(self.samples / self.sample_rate, 3),
+        }
+
+
+# ---------------------------------------------------------------------------
+# True peak and normalisation
+# ---------------------------------------------------------------------------
+
+def _interpolation_kernel(factor):
+    """Windowed-sinc interpolator for *factor*x oversampling, one row per phase."""
+    n = factor * _TP_TAPS_PER_PHASE
+    t = (np.arange(n) - n // 2) / factor
+    kernel = np.sinc(t) * np.kaiser(n, 6.0)
+    return kernel.reshape(_TP_TAPS_PER_PHASE, factor).T
+
+
+def true_peak_envelope(audio, sample_rate=24000):
+    """Per-sample absolute true peak (max over the oversampled neighbourhood).
+
+    Polyphase: each interpolated phase is a short direct convolution of the
+    original signal, so nothing is ever materialised at 192 kHz.
+    """
+    audio = np.asarray(audio, dtype=np.float64).reshape(-1)
+    env = np.abs(audio)
+    factor = int(round(_TP_RATE / sample_rate))
+    if factor < 2 or not len(audio):
+        return env
+    delay = _TP_TAPS_PER_PHASE // 2
+    for phase in _interpolation_kernel(factor)[1:]:
+        interp = np.convolve(audio, phase)[delay:delay + len(audio)]
+        np.maximum(env, np.abs(interp), out=env)
+    return env
+
+
+def true_peak(audio, sample_rate=24000):
+    """True peak in dBTP."""
+    env = true_peak_envelope(audio, sample_rate)
+    peak = float(env.max()) if len(env) else 0.0
+    return 20.0 * math.log10(peak) if peak > 0 else -99.0
+
+
+def _sliding_min(x, radius):
+    """Centred running minimum (van Herk / Gil-Werman, O(n))."""
+    width = 2 * radius + 1
+    n = len(x)
+    padded = np.pad(x, (radius, radius + (-(n + 2 * radius)) % width), constant_values=np.inf)
+    blocks = padded.reshape(-1, width)
+    prefix = np.minimum.accumulate(blocks, axis=1).reshape(-1)
+    suffix = np.minimum.accumulate(blocks[:, ::-1], axis=1)[:, ::-1].reshape(-1)
+    return np.minimum(suffix[:n], prefix[width - 1:width - 1 + n])
+
+
+def _box_mean(x, radius):
+    csum = np.concatenate([[0.0], np.cumsum(np.pad(x, radius, mode="edge"))])
+    return (csum[2 * radius + 1:] - csum[:-2 * radius - 1]) / (2 * radius + 1)
+
+
+def limit(audio, sample_rate=24000, ceiling_db=TARGET_TP):
+    """Look-ahead true-peak limiter.
+
+    The gain each sample needs is spread over a window on both sides with a
+    min filter, then smoothed by a box filter of the same radius; every
+    sample of the box around a peak is at most the peak's own gain, so the
+    ceiling holds without a per-sample loop.
+    """
+    ceiling = 10.0 ** ((ceiling_db - _LIMITER_MARGIN_DB) / 20.0)
+    audio = np.asarray(audio)
+    if not len(audio) or np.abs(audio).max() < ceiling / 2:
+        # Inter-sample overshoot never reaches 6 dB on real audio
+        return audio
+    env = true_peak_envelope(audio, sample_rate)
+    if env.max() <= ceiling:
+        return audio
+    needed = np.minimum(1.0, ceiling / np.maximum(env, 1e-12))
+    radius = max(1, int(sample_rate * _LIMITER_LOOKAHEAD))
+    gain = _box_mean(_sliding_min(needed, radius), radius)
+    return (audio.astype(np.float64) * gain).astype(np.float32)
+
+
+def limit_stream(chunks, sample_rate=24000, ceiling_db=TARGET_TP):
+    """``limit()`` over consecutive *chunks*, yielding the limited audio in order.
+
+    A sample's gain depends only on the true peaks within two look-ahead
+    windows (plus the interpolator's reach), so each chunk is limited with
+    that much of its neighbours as context and the output matches limit()
+    on the joined audio (to float rounding) while holding one chunk at a time.
+    """
+    margin = 2 * max(1, int(sample_rate * _LIMITER_LOOKAHEAD)) + _TP_TAPS_PER_PHASE
+    context = np.zeros(0, dtype=np.float32)     # already-emitted input before *pending*
+    pending = np.zeros(0, dtype=np.float32)
+    for chunk in chunks:
+        pending = np.concatenate([pending, np.asarray(chunk, dtype=np.float32).reshape(-1)])
+        ready = len(pending) - margin           # samples whose right context is complete
+        if ready <= 0:
+            continue
+        window = np.concatenate([context, pending])
+        yield limit(window, sample_rate, ceiling_db)[len(context):len(context) + ready]
+        context = window[max(0, len(context) + ready - margin):len(context) + ready]
+        pending = pending[ready:]
+    if len(pending):
+        window = np.concatenate([context, pending])
+        yield limit(window, sample_rate, ceiling_db)[len(context):]
+
+
+def normalize_stream(chunks, meter, sample_rate=24000, target_i=TARGET_I, target_tp=TARGET_TP):
+    """Streaming ``normalize()`` of audio *meter* has already measured.
+
+    Returns ``(chunks, info)``: an iterator of normalised, limited chunks
+    (same samples normalize() would produce) and the measured input and
+    gain to apply.
+    """
+    integrated, _ = meter.integrated()
+    if integrated <= ABSOLUTE_GATE:
+        return iter(chunks), {"input_i": integrated, "gain_db": 0.0}
+    gain_db = target_i - integrated
+    scale = 10.0 ** (gain_db / 20.0)
+    scaled = ((np.asarray(c, dtype=np.float64) * scale).astype(np.float32) for c in chunks)
+    return limit_stream(scaled, sample_rate, target_tp), {"input_i": round(integrated, 2),
+                                                          "gain_db": round(gain_db, 2)}
+
+
+def normalize(audio, sample_rate=24000, meter=None, target_i=TARGET_I, target_tp=TARGET_TP):
+    """Linear gain to *target_i* LUFS, then true-peak limit to *target_tp* dBTP.
+
+    *meter* may already hold the measurement of *audio* (silence padding
+    around it does not matter); otherwise it is measured here. Returns
+    ``(audio, info)`` with the measured input and applied gain.
+    """
+    if meter is None:
+        meter = LoudnessMeter(sample_rate)
+        meter.add(audio)
+    integrated, _ = meter.integrated()
+    if integrated <= ABSOLUTE_GATE:
+        # Silence: nothing to normalise
+        return audio, {"input_i": integrated, "gain_db": 0.0, "limited": False}
+    gain_db = target_i - integrated
+    out = (np.asarray(audio, dtype=np.float64) * 10.0 ** (gain_db / 20.0)).astype(np.float32)
+    limited = limit(out, sample_rate, target_tp)
+    return limited, {"input_i": round(integrated, 2), "gain_db": round(gain_db, 2),
+                     "limited": limited is not out}
@@ -5,8 +5,13 @@ ordinals, and numbers into speakable text.  Also provides sentence
 splitting into breathing-sized blocks for chunked TTS generation.
 """
 
+import functools
 import re
 
+from config import TTS_BLOCK_SPLITTER
+
+BLOCK_SPLITTERS = ("greedy", "optimal")
+
 # ---------------------------------------------------------------------------
 # Lookup tables
 # ---------------------------------------------------------------------------
@@ -111,6 +116,83 @@ def _restore_kokoro(text, replacements):
     return text
 
 
+# ---------------------------------------------------------------------------
+# Compiled rule tables
+# ---------------------------------------------------------------------------
+
+
+# Characters re.IGNORECASE matches to an ASCII letter that str.lower() does not map to it
+_FOLD_FIXES = str.maketrans({"\u0130": "i", "\u0131": "i", "\u017f": "s"})
+
+
+def _required_literal(pattern):
+    """The literal text every match of a table *pattern* contains.
+
+    Table patterns are ``\\b``- or ``(\\d+)\\s?``-prefixed literals with an
+    optional trailing ``\\b``.
+    """
+    body = re.sub(r"^(?:\\b|\(\\d\+\)\\s\?)|\\b$", "", pattern)
+    literal = re.sub(r"\\(.)", r"\1", body)
+    if re.escape(literal) != body:
+        raise ValueError(f"rule {pattern!r} has no plain literal core")
+    return literal
+
+
+class _RuleTable:
+    """An ordered (pattern -> replacement) table, applied rule by rule.
+
+    Output is exactly that of one ``re.sub`` per rule in order: later rules
+    see earlier rules' output (``Dr.API`` -> ``DoctorAPI``, no new word
+    boundary). What makes it fast is skipping: every rule carries a literal
+    its matches must contain, and a rule whose literal is absent from the
+    case-folded text costs one substring test instead of a regex scan.
+    """
+
+    def __init__(self, rules, flags=0, literal=False):
+        self._ignore_case = bool(flags & re.IGNORECASE)
+        self._rules = []
+        for pattern, repl in rules.items():
+            needle = pattern if literal else _required_literal(pattern)
+            regex = re.compile(re.escape(pattern) if literal else pattern, flags)
+            self._rules.append((self._fold(needle), regex, repl))
+
+    def _fold(self, text):
+        return text.translate(_FOLD_FIXES).lower() if self._ignore_case else text
+
+    def sub(self, text):
+        folded = self._fold(text)
+        for needle, regex, repl in self._rules:
+            if needle in folded:
+                replaced = regex.sub(repl, text)
+                if replaced != text:
+                    text, folded = replaced, self._fold(replaced)
+        return text
+
+
+_CONTRACTIONS_RE = _RuleTable(_CONTRACTIONS, re.IGNORECASE, literal=True)
+_ABBREVIATIONS_RE = _RuleTable(_ABBREVIATIONS, re.IGNORECASE)
+_UNITS_RE = _RuleTable(_UNITS, re.IGNORECASE)
+_ORDINALS_RE = _RuleTable(_ORDINALS, re.IGNORECASE)
+
+_CURRENCY = [
+    (re.compile(r'\$(\d+)'), r'\1 dollars'),
+    (re.compile(r'€(\d+)'), r'\1 euros'),
+    (re.compile(r'£(\d+)'), r'\1 pounds'),
+    (re.compile(r'¥(\d+)'), r'\1 yen'),
+    (re.compile(r'HTG\s?(\d+)'), r'\1 Haitian gourdes'),
+]
+_DATE_RE = re.compile(r'\b(\d{4})-(\d{2})-(\d{2})\b')
+_CLOCK_TIME_RE = re.compile(r'\b(\d{1,2}):(\d{2})\s?(am|pm)\b', re.IGNORECASE)
+_HOUR_TIME_RE = re.compile(r'\b(\d{1,2})\s?(am|pm)\b', re.IGNORECASE)
+_DECIMAL_RE = re.compile(r'\b(\d+)\.(\d+)\b')
+_INTEGER_RE = re.compile(r'\b(\d+)\b')
+_SPACES_RE = re.compile(r'\s+')
+
+_SENTENCE_RE = re.compile(r".+?(?:\u2026|\.{3}|[.!?\u2014])(?:\s+|$)")
+_CLAUSE_SPLIT_RE = re.compile(r"(?<=[,;:])\s+")
+_KOKORO_PLACEHOLDER_RE = re.compile(r"\x00KK(\d+)\x00")
+
+
 # ---------------------------------------------------------------------------
 # Expansion helpers
 # ---------------------------------------------------------------------------
@@ -123,68 +205,61 @@ def _expand_symbols(text):
 
 
 def _expand_contractions(text):
-    for c, e in _CONTRACTIONS.items():
-        text = re.sub(re.escape(c), e, text, flags=re.IGNORECASE)
-    return text
+    return _CONTRACTIONS_RE.sub(text)
 
 
 def _expand_abbreviations(text):
-    for p, r in _ABBREVIATIONS.items():
-        text = re.sub(p, r, text, flags=re.IGNORECASE)
-    return text
+    return _ABBREVIATIONS_RE.sub(text)
 
 
 def _expand_currency(text):
-    text = re.sub(r'\$(\d+)', r'\1 dollars', text)
-    text = re.sub(r'€(\d+)', r'\1 euros', text)
-    text = re.sub(r'£(\d+)', r'\1 pounds', text)
-    text = re.sub(r'¥(\d+)', r'\1 yen', text)
-    text = re.sub(r'HTG\s?(\d+)', r'\1 Haitian gourdes', text)
+    for pattern, repl in _CURRENCY:
+        text = pattern.sub(repl, text)
     return text
 
 
 def _expand_units(text):
-    for p, r in _UNITS.items():
-        text = re.sub(p, r, text, flags=re.IGNORECASE)
-    return text
+    return _UNITS_RE.sub(text)
 
 
 def _expand_dates(text):
     def _replace(m):
         y, mo, d = m.group(1), m.group(2), m.group(3)
         return f"{_DATE_MONTHS.get(mo, mo)} {int(d)}, {y}"
-    return re.sub(r'\b(\d{4})-(\d{2})-(\d{2})\b', _replace, text)
+    return _DATE_RE.sub(_replace, text)
 
 
 def _expand_time(text):
-    text = re.sub(
-        r'\b(\d{1,2}):(\d{2})\s?(am|pm)\b',
+    text = _CLOCK_TIME_RE.sub(
         lambda m: f"{m.group(1)} {m.group(2)} {m.group(3).replace('am','a m').replace('pm','p m')}",
-        text, flags=re.IGNORECASE)
-    text = re.sub(
-        r'\b(\d{1,2})\s?(am|pm)\b',
+        text)
+    text = _HOUR_TIME_RE.sub(
         lambda m: f"{m.group(1)} {m.group(2).replace('am','a m').replace('pm','p m')}",
-        text, flags=re.IGNORECASE)
+        text)
     return text
 
 
 def _expand_ordinals(text):
-    for p, r in _ORDINALS.items():
-        text = re.sub(p, r, text, flags=re.IGNORECASE)
-    return text
+    return _ORDINALS_RE.sub(text)
+
+
+@functools.lru_cache(maxsize=4096)
+def _cardinal(digits):
+    from num2words import num2words
+    return num2words(int(digits))
 
 
 def _expand_numbers(text):
     try:
-        from num2words import num2words
-        def _float_repl(m):
-            whole = num2words(int(m.group(1)))
-            decimals = " ".join(num2words(int(d)) for d in m.group(2))
-            return f"{whole} point {decimals}"
-        text = re.sub(r'\b(\d+)\.(\d+)\b', _float_repl, text)
-        text = re.sub(r'\b(\d+)\b', lambda m: num2words(int(m.group(1))), text)
+        import num2words  # noqa: F401
     except ImportError:
-        pass
+        return text
+    def _float_repl(m):
+        whole = _cardinal(m.group(1))
+        decimals = " ".join(_cardinal(d) for d in m.group(2))
+        return f"{whole} point {decimals}"
+    text = _DECIMAL_RE.sub(_float_repl, text)
+    text = _INTEGER_RE.sub(lambda m: _cardinal(m.group(1)), text)
     return text
 
 
@@ -209,7 +284,7 @@ def normalize_for_tts(text: str) -> str:
     text = _expand_time(text)
     text = _expand_ordinals(text)
     text = _expand_numbers(text)
-    text = re.sub(r'\s+', ' ', text)
+    text = _SPACES_RE.sub(' ', text)
     text = _restore_kokoro(text, kokoro)
     return text.strip()
 
@@ -230,12 +305,19 @@ def clean_for_tts(text: str) -> str:
     return text.strip()
 
 
-def tts_breathing_blocks(text: str, min_chars: int = 150, max_chars: int = 200) -> list[str]:
+def tts_breathing_blocks(text: str, min_chars: int = 150, max_chars: int = 200,
+                         algorithm: str | None = None) -> list[str]:
     """Split text into breathing-sized blocks for chunked TTS generation.
 
     Each block aims for *min_chars*-*max_chars*, preferring sentence
     boundaries, then comma/semicolon boundaries, then word boundaries.
+    *algorithm* is one of BLOCK_SPLITTERS (default TTS_BLOCK_SPLITTER):
+    "greedy" packs sentences then merges short blocks; "optimal" picks the
+    partition with the lowest total cost (see ``_optimal_blocks``).
     """
+    algorithm = algorithm or TTS_BLOCK_SPLITTER
+    if algorithm not in BLOCK_SPLITTERS:
+        raise ValueError(f"Unknown block splitter: {algorithm}")
     if not text or not text.strip():
         return []
 
@@ -245,9 +327,14 @@ def tts_breathing_blocks(text: str, min_chars: int = 150, max_chars: int = 200)
     text = text.replace("\u2013", "-")
     # Preserve em dash and ellipsis for Kokoro intonation
     text = re.sub(r"\s+", " ", text).strip()
+    if algorithm == "optimal":
+        return _optimal_blocks(text, kokoro, min_chars, max_chars)
     text = _restore_kokoro(text, kokoro)
+    return _greedy_blocks(text, min_chars, max_chars)
 
-    sentences = re.findall(r".+?(?:\u2026|\.{3}|[.!?\u2014])(?:\s+|$)", text)
+
+def _greedy_blocks(text, min_chars, max_chars):
+    sentences = _SENTENCE_RE.findall(text)
     if not sentences:
         sentences = [text]
 
@@ -274,7 +361,7 @@ def tts_breathing_blocks(text: str, min_chars: int = 150, max_chars: int = 200)
             flush()
             cur = s
             continue
-        parts = re.split(r"(?<=[,;:])\s+", s)
+        parts = _CLAUSE_SPLIT_RE.split(s)
         for p in parts:
             p = p.strip()
             if not p:
@@ -321,9 +408,123 @@ def tts_breathing_blocks(text: str, min_chars: int = 150, max_chars: int = 200)
     return blocks
 
 
-def format_breathing_blocks(text: str, min_chars: int = 150, max_chars: int = 200) -> str:
+# Boundary penalties for the optimal splitter, in the same units as
+# _block_cost: one unit is a block 10 chars short of min_chars squared.
+_BREAK_SENTENCE = 0.0
+_BREAK_CLAUSE = 6.0
+_BREAK_WORD = 40.0
+
+
+def _block_atoms(text, kokoro, max_chars):
+    """Unsplittable pieces of *text* with the penalty for breaking after each.
+
+    Atoms are clauses; a clause longer than *max_chars* is broken into words.
+    *text* has its Kokoro links protected so none is split; they are
+    restored per atom, before lengths are measured.
+    """
+    sentences, end = [], 0
+    for m in _SENTENCE_RE.finditer(text):
+        sentences.append(m.group())
+        end = m.end()
+    if text[end:].strip():
+        # Trailing text without closing punctuation
+        sentences.append(text[end:])
+
+    def restore(piece):
+        if "\x00" not in piece:
+            return piece
+        return _KOKORO_PLACEHOLDER_RE.sub(lambda m: kokoro[int(m.group(1))], piece)
+
+    atoms, penalties = [], []
+    for sentence in sentences:
+        clauses = [c.strip() for c in _CLAUSE_SPLIT_RE.split(sentence.strip()) if c.strip()]
+        for ci, protected in enumerate(clauses):
+            clause = restore(protected)
+            words = [clause]
+            if len(clause) > max_chars:
+                words = [restore(w) for w in protected.split(" ")]
+            atoms.extend(words)
+            penalties.extend([_BREAK_WORD] * (len(words) - 1))
+            penalties.append(_BREAK_CLAUSE if ci < len(clauses) - 1 else _BREAK_SENTENCE)
+    return atoms, penalties
+
+
+def _block_cost(length, min_chars, max_chars):
+    """Cost of one block: squared shortfall below *min_chars*, plus a small
+    pull toward the middle of the range so equal-cost splits stay balanced."""
+    short = max(0, min_chars - length) / 10.0
+    off_centre = (length - (min_chars + max_chars) / 2.0) / max(max_chars, 1)
+    return short * short + off_centre * off_centre
+
+
+def _optimal_blocks(text, kokoro, min_chars, max_chars):
+    """Minimum-cost partition of *text* into blocks of at most *max_chars*.
+
+    Dynamic programming over atom boundaries: ``best[j]`` is the cheapest
+    split of the first j atoms, trying every block that ends at atom j and
+    fits in *max_chars* (an oversized single word still stands alone).
+    A block's cost is ``_block_cost`` plus the penalty of the boundary it
+    ends on, so sentence ends are preferred over clause and word breaks.
+    Each atom is tried against at most max_chars / 2 predecessors, so the
+    run time is linear in the length of the text.
+    """
+    atoms, penalties = _block_atoms(text, kokoro, max_chars)
+    n = len(atoms)
+    prefix = [0]
+    for atom in atoms:
+        prefix.append(prefix[-1] + len(atom))
+
+    best = [0.0] + [float("inf")] * n
+    back = [0] * (n + 1)
+    for j in range(1, n + 1):
+        end_penalty = penalties[j - 1] if j < n else 0.0
+        for i in range(j - 1, -1, -1):
+            length = prefix[j] - prefix[i] + (j - i - 1)
+            if length > max_chars and i < j - 1:
+                break
+            cost = best[i] + _block_cost(length, min_chars, max_chars) + end_penalty
+            if cost < best[j]:
+                best[j], back[j] = cost, i
+
+    blocks = []
+    j = n
+    while j > 0:
+        blocks.append(" ".join(atoms[back[j]:j]))
+        j = back[j]
+    return blocks[::-1]
+
+
+def split_first_block(blocks: list[str], max_chars: int, min_chars: int = 30) -> list[str]:
+    """Shorten the first block to at most *max_chars* for a fast stream start.
+
+    The cut prefers a sentence end, then a comma/semicolon/colon, then a
+    word boundary (never inside a Kokoro link); the remainder becomes its
+    own block. Blocks are returned unchanged when the first already fits.
+    """
+    if not blocks or len(blocks[0]) <= max_chars:
+        return blocks
+    first = blocks[0]
+    protected, kokoro = _protect_kokoro(first)
+    window = protected[:max_chars + 1]
+
+    cut = None
+    for pattern in (r"(?:\u2026|\.{3}|[.!?\u2014])\s", r"[,;:]\s", r"\s"):
+        ends = [m.end() for m in re.finditer(pattern, window) if m.end() - 1 >= min_chars]
+        if ends:
+            cut = ends[-1]
+            break
+    if cut is None:
+        return blocks
+
+    head = _restore_kokoro(protected[:cut].strip(), kokoro)
+    tail = _restore_kokoro(protected[cut:].strip(), kokoro)
+    return [head, tail, *blocks[1:]] if tail else [head, *blocks[1:]]
+
+
+def format_breathing_blocks(text: str, min_chars: int = 150, max_chars: int = 200,
+                            algorithm: str | None = None) -> str:
     """Format text into bracket-wrapped breathing blocks for display."""
-    blocks = tts_breathing_blocks(text, min_chars, max_chars)
+    blocks = tts_breathing_blocks(text, min_chars, max_chars, algorithm)
     if not blocks:
         return text.strip()
     if len(blocks) == 1:
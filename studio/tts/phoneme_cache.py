@@ -0,0 +1,121 @@
+"""Phoneme Cache — memoised misaki G2P output.
+
+G2P is deterministic for a given (text, accent, misaki version), so its
+output is content-addressed by those and kept at two levels: an in-memory
+LRU for the running process and a SQLite table that survives restarts.
+Regenerating a script (new voice, new speed) then skips G2P entirely.
+"""
+
+import importlib.metadata
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+
+from loguru import logger
+
+from studio.cache import hash_key
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS phonemes (
+    key       TEXT PRIMARY KEY,
+    phonemes  TEXT NOT NULL,
+    last_used REAL NOT NULL
+)
+"""
+
+
+def _misaki_version():
+    try:
+        return importlib.metadata.version("misaki")
+    except importlib.metadata.PackageNotFoundError:
+        return "unknown"
+
+
+class PhonemeCache:
+    """Two-level (memory LRU + SQLite) cache of G2P results.
+
+    Disk rows beyond *max_rows* are pruned least-recently-used first when
+    the cache is opened.
+    """
+
+    def __init__(self, db_path, memory_entries=4096, max_rows=200_000):
+        self.db_path = db_path
+        self.memory_entries = max(0, int(memory_entries))
+        self.max_rows = int(max_rows)
+        self.version = _misaki_version()
+
+        self._lock = threading.Lock()
+        self._memory = OrderedDict()
+        self.memory_hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+
+        self._db = sqlite3.connect(db_path, check_same_thread=False)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute(_SCHEMA)
+        self._prune()
+        self._db.commit()
+
+    def _prune(self):
+        (rows,) = self._db.execute("SELECT COUNT(*) FROM phonemes").fetchone()
+        excess = rows - self.max_rows
+        if excess > 0:
+            self._db.execute(
+                "DELETE FROM phonemes WHERE key IN "
+                "(SELECT key FROM phonemes ORDER BY last_used LIMIT ?)", (excess,))
+        logger.info("Phoneme cache: {} entries (misaki {}) in {}",
+                    min(rows, self.max_rows), self.version, self.db_path)
+
+    def key(self, text, lang, british):
+        return hash_key(" ".join(text.split()), lang, bool(british), self.version)
+
+    def _remember(self, key, phonemes):
+        # caller holds _lock
+        if not self.memory_entries:
+            return
+        self._memory[key] = phonemes
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.memory_entries:
+            self._memory.popitem(last=False)
+
+    def get(self, text, lang, british=False):
+        """Cached phonemes for *text*, or None."""
+        key = self.key(text, lang, british)
+        with self._lock:
+            phonemes = self._memory.get(key)
+            if phonemes is not None:
+                self._memory.move_to_end(key)
+                self.memory_hits += 1
+                return phonemes
+            row = self._db.execute("SELECT phonemes FROM phonemes WHERE key=?", (key,)).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+            self.disk_hits += 1
+            self._db.execute("UPDATE phonemes SET last_used=? WHERE key=?", (time.time(), key))
+            self._db.commit()
+            self._remember(key, row[0])
+            return row[0]
+
+    def put(self, text, lang, british, phonemes):
+        key = self.key(text, lang, british)
+        with self._lock:
+            self._remember(key, phonemes)
+            self._db.execute(
+                "INSERT OR REPLACE INTO phonemes (key, phonemes, last_used) VALUES (?, ?, ?)",
+                (key, phonemes, time.time()))
+            self._db.commit()
+
+    def stats(self):
+        with self._lock:
+            hits = self.memory_hits + self.disk_hits
+            lookups = hits + self.misses
+            return {
+                "memory_entries": len(self._memory),
+                "memory_hits": self.memory_hits,
+                "disk_hits": self.disk_hits,
+                "misses": self.misses,
+                "hit_rate": round(hits / lookups, 4) if lookups else 0.0,
+                "misaki_version": self.version,
+            }
@@ -0,0 +1,113 @@
+"""Kokoro session pool — concurrent TTS inference.
+
+A fixed number of Kokoro ONNX sessions, each pinned to its own slice of the
+CPU via ``intra_op_num_threads``. Callers lease a session for one unit of
+work (a block bucket, a single-shot generation, a stream) and give it back;
+when every session is busy, callers wait in FIFO order instead of being
+turned away. Sessions beyond the first are loaded on first demand.
+"""
+
+import contextlib
+import itertools
+import os
+import threading
+import time
+
+from loguru import logger
+
+
+class KokoroPool:
+    """Lease Kokoro instances from a bounded pool.
+
+    *threads* is the ONNX intra-op thread count per session (0 = the CPU
+    count divided evenly among the sessions).
+    """
+
+    def __init__(self, model_path, voices_path, size=1, threads=0):
+        self.model_path = model_path
+        self.voices_path = voices_path
+        self.size = max(1, int(size))
+        self.threads = int(threads) or max(1, (os.cpu_count() or 1) // self.size)
+
+        self._cond = threading.Condition()
+        self._idle = []
+        self._loaded = 0
+        self._tickets = itertools.count()
+        self._waiting = []      # tickets of callers waiting for a session, in order
+        self._leases = 0
+        self._wait_total = 0.0
+
+        # The first session is loaded eagerly: it doubles as the shared
+        # instance for tokenizer / voice lookups
+        self.primary = self._create()
+        self._loaded = 1
+        self._idle.append(self.primary)
+
+    def _create(self):
+        import onnxruntime as rt
+        from kokoro_onnx import Kokoro
+        from kokoro_onnx.session import resolve_providers
+
+        options = rt.SessionOptions()
+        options.intra_op_num_threads = self.threads
+        options.inter_op_num_threads = 1
+        start = time.perf_counter()
+        session = rt.InferenceSession(self.model_path, sess_options=options,
+                                      providers=resolve_providers())
+        kokoro = Kokoro.from_session(session, self.voices_path)
+        logger.info("Kokoro session {}/{} loaded in {:.1f}s ({} threads)",
+                    self._loaded + 1, self.size, time.perf_counter() - start, self.threads)
+        return kokoro
+
+    def _acquire(self):
+        ticket = next(self._tickets)
+        start = time.perf_counter()
+        with self._cond:
+            self._waiting.append(ticket)
+            try:
+                # FIFO: only the oldest waiter may take a session
+                while self._waiting[0] != ticket or (not self._idle and self._loaded >= self.size):
+                    self._cond.wait()
+                self._wait_total += time.perf_counter() - start
+                self._leases += 1
+                if self._idle:
+                    return self._idle.pop()
+                self._loaded += 1   # reserve the slot, load outside the lock
+            finally:
+                self._waiting.remove(ticket)
+                self._cond.notify_all()
+
+        try:
+            return self._create()
+        except Exception:
+            with self._cond:
+                self._loaded -= 1
+                self._cond.notify_all()
+            raise
+
+    def _release(self, kokoro):
+        with self._cond:
+            self._idle.append(kokoro)
+            self._cond.notify_all()
+
+    @contextlib.contextmanager
+    def session(self):
+        """Lease a Kokoro instance for the duration of the ``with`` block."""
+        kokoro = self._acquire()
+        try:
+            yield kokoro
+        finally:
+            self._release(kokoro)
+
+    def stats(self):
+        with self._cond:
+            busy = self._loaded - len(self._idle)
+            return {
+                "size": self.size,
+                "loaded": self._loaded,
+                "busy": busy,
+                "waiting": len(self._waiting),
+                "threads_per_session": self.threads,
+                "leases": self._leases,
+                "avg_wait_seconds": round(self._wait_total / self._leases, 3) if self._leases else 0.0,
+            }
@@ -4,8 +4,6 @@ Provides text-to-speech generation, streaming, model management,
 voice blending, and generation history.
 """
 
-import asyncio
-import base64
 import json
 import os
 import re
@@ -24,12 +22,30 @@ import urllib.request
 from flask import Blueprint, Response, jsonify, request, send_from_directory
 from loguru import logger
 
-from config import TTS_DIR, TTS_TRASH_DIR, MODELS_DIR, BIN_DIR
+from config import (
+    TTS_DIR, TTS_TRASH_DIR, MODELS_DIR, BIN_DIR, TTS_POOL_SIZE, TTS_SESSION_THREADS,
+    PHONEME_CACHE_DB, PHONEME_CACHE_MEMORY, TTS_STREAM_FIRST_CHUNK_MS,
+)
 from .normalize import (
     normalize_for_tts, clean_for_tts, tts_breathing_blocks,
-    format_breathing_blocks, validate_brackets,
+    format_breathing_blocks, split_first_block, validate_brackets,
+)
+from .audio import (
+    ChunkWriter, pad_audio, normalize_loudness_file, run_loudnorm, scratch_wav, _find_ffmpeg,
+)
+from .blends import (
+    METHODS, NAME_RE, blend_embedding, cache_stats as blend_cache_stats,
+    get_registry as get_blend_registry, unpin as unpin_blend,
+)
+from .block_cache import get_block_cache
+from .chunked import GenerationAborted, stream_blocks, synthesize_script_to_file
+from .loudness import LoudnessMeter
+from .phoneme_cache import PhonemeCache
+from .pool import KokoroPool
+from .streaming import (
+    L16_MIMETYPE, SAMPLE_RATE, STREAM_FORMATS, encode_l16, first_block_planner,
+    l16_error_trailer, negotiate_format, sse_audio_event, sse_event, stream_stats,
 )
-from .audio import pad_audio, concatenate_chunks, run_loudnorm, _find_ffmpeg
 
 # ---------------------------------------------------------------------------
 # Blueprint
@@ -102,35 +118,53 @@ def _voice_to_lang(voice_name: str) -> str:
 # Voice blending (SLERP / LERP)
 # ---------------------------------------------------------------------------
 
-def _slerp(v0: np.ndarray, v1: np.ndarray, t: float) -> np.ndarray:
-    v0 = v0.astype(np.float64)
-    v1 = v1.astype(np.float64)
-    if v0.ndim == 1:
-        n0, n1 = np.linalg.norm(v0), np.linalg.norm(v1)
-        dot = np.clip(np.dot(v0, v1) / (n0 * n1 + 1e-10), -1.0, 1.0)
-        omega = np.arccos(dot)
-        if abs(omega) < 1e-6:
-            return ((1.0 - t) * v0 + t * v1).astype(np.float32)
-        so = np.sin(omega)
-        return ((np.sin((1.0 - t) * omega) / so) * v0
-                + (np.sin(t * omega) / so) * v1).astype(np.float32)
-    result = np.empty_like(v0)
-    for i in range(v0.shape[0]):
-        result[i] = _slerp(v0[i], v1[i], t)
-    return result.astype(np.float32)
+def _parse_blend(blend):
+    """Validated (voice_a, voice_b, ratio, method) from a request's blend dict."""
+    voice_a = blend.get("voice_a", "")
+    voice_b = blend.get("voice_b", "")
+    ratio = max(0.0, min(1.0, float(blend.get("ratio", 0.5))))
+    method = blend.get("method", "slerp")
+    if method not in METHODS:
+        method = "slerp"
+    if voice_a not in VOICES:
+        raise ValueError(f"Unknown voice_a: {voice_a}")
+    if voice_b not in VOICES:
+        raise ValueError(f"Unknown voice_b: {voice_b}")
+    return voice_a, voice_b, ratio, method
 
 
-def _lerp(v0: np.ndarray, v1: np.ndarray, t: float) -> np.ndarray:
-    return ((1.0 - t) * v0 + t * v1).astype(np.float32)
+def _blend_voices(kokoro_inst, voice_a: str, voice_b: str,
+                  ratio: float, method: str = "slerp", pin: bool = False) -> np.ndarray:
+    return blend_embedding(kokoro_inst, voice_a, voice_b, ratio, method, pin=pin)
 
 
-def _blend_voices(kokoro_inst, voice_a: str, voice_b: str,
-                  ratio: float, method: str = "slerp") -> np.ndarray:
-    embed_a = kokoro_inst.get_voice_style(voice_a)
-    embed_b = kokoro_inst.get_voice_style(voice_b)
-    if method == "slerp":
-        return _slerp(embed_a, embed_b, ratio)
-    return _lerp(embed_a, embed_b, ratio)
+def _resolve_voice(voice, blend=None):
+    """Resolve a request's voice / blend fields.
+
+    *voice* is a Kokoro voice or the name of a saved blend; an explicit
+    *blend* dict wins over both. Returns ``(voice_param, base_voice, label,
+    blend_meta)`` where *base_voice* picks the language. Raises ValueError
+    with a client-facing message.
+    """
+    if blend:
+        voice_a, voice_b, ratio, method = _parse_blend(blend)
+        name = None
+    elif voice in VOICES:
+        return voice, voice, voice, None
+    else:
+        spec = get_blend_registry().get(voice)
+        if spec is None:
+            raise ValueError(f"Unknown voice. Choose from: {VOICES}")
+        voice_a, voice_b, ratio, method = _parse_blend(spec)
+        name = voice
+
+    voice_param = _blend_voices(load_model(), voice_a, voice_b, ratio, method, pin=bool(name))
+    label = f"{voice_a} + {voice_b} ({int(round(ratio * 100))}% {method.upper()})"
+    blend_meta = {"voice_a": voice_a, "voice_b": voice_b, "ratio": ratio, "method": method}
+    if name:
+        label = f"{name}: {label}"
+        blend_meta["name"] = name
+    return voice_param, voice_a, label, blend_meta
 
 
 # ---------------------------------------------------------------------------
@@ -140,6 +174,18 @@ def _blend_voices(kokoro_inst, voice_a: str, voice_b: str,
 _misaki_g2p = None
 _misaki_lock = threading.Lock()
 
+_phoneme_cache = None
+_phoneme_cache_lock = threading.Lock()
+
+
+def get_phoneme_cache():
+    """Lazy-open the G2P result cache (memory LRU + SQLite)."""
+    global _phoneme_cache
+    with _phoneme_cache_lock:
+        if _phoneme_cache is None:
+            _phoneme_cache = PhonemeCache(PHONEME_CACHE_DB, memory_entries=PHONEME_CACHE_MEMORY)
+        return _phoneme_cache
+
 
 def _get_misaki_g2p(british=False):
     """Lazy-load the misaki G2P engine (supports [word](+1) stress syntax)."""
@@ -171,6 +217,11 @@ def _phonemize_with_misaki(text: str, lang: str = "en-us") -> tuple[str | None,
         return text, False
 
     british = lang == "en-gb"
+    cache = get_phoneme_cache()
+    cached = cache.get(text, lang, british)
+    if cached is not None:
+        return cached, True
+
     g2p = _get_misaki_g2p(british=british)
     if g2p is None:
         return text, False
@@ -178,6 +229,7 @@ def _phonemize_with_misaki(text: str, lang: str = "en-us") -> tuple[str | None,
     try:
         phonemes, _tokens = g2p(text)
         if phonemes and phonemes.strip():
+            cache.put(text, lang, british, phonemes)
             return phonemes, True
     except Exception:
         logger.exception("Misaki G2P failed, falling back to espeak")
@@ -189,13 +241,11 @@ def _phonemize_with_misaki(text: str, lang: str = "en-us") -> tuple[str | None,
 # ---------------------------------------------------------------------------
 
 kokoro_instance = None
+kokoro_pool = None
 kokoro_lock = threading.Lock()
 
 generation_jobs = {}
 generation_jobs_lock = threading.Lock()
-generation_inference_lock = threading.Lock()
-
-_stream_active = threading.Event()
 
 _metadata_locks = {}
 _metadata_locks_lock = threading.Lock()
@@ -268,12 +318,11 @@ def _model_files_present() -> bool:
 
 
 def load_model():
-    global kokoro_instance
+    """Load the session pool; returns its primary instance (tokenizer, voices)."""
+    global kokoro_instance, kokoro_pool
     if kokoro_instance is not None:
         return kokoro_instance
 
-    from kokoro_onnx import Kokoro
-
     cfg = MODELS["kokoro"]
     onnx_path = os.path.join(MODELS_DIR, cfg["onnx_file"])
     voices_path = os.path.join(MODELS_DIR, cfg["voices_file"])
@@ -281,7 +330,9 @@ def load_model():
     with kokoro_lock:
         if kokoro_instance is None:
             logger.info("Loading Kokoro model ...")
-            kokoro_instance = Kokoro(onnx_path, voices_path)
+            kokoro_pool = KokoroPool(onnx_path, voices_path,
+                                     size=TTS_POOL_SIZE, threads=TTS_SESSION_THREADS)
+            kokoro_instance = kokoro_pool.primary
             try:
                 available = kokoro_instance.get_voices()
                 if available:
@@ -289,10 +340,16 @@ def load_model():
                     VOICES = sorted(available)
             except Exception:
                 pass
-            logger.success("Kokoro model ready")
+            logger.success("Kokoro model ready (pool of {})", kokoro_pool.size)
     return kokoro_instance
 
 
+def get_pool() -> KokoroPool:
+    """The Kokoro session pool, loading the model on first use."""
+    load_model()
+    return kokoro_pool
+
+
 def _download_file_with_progress(url: str, dest_path: str, queue: Queue, label: str):
     tmp_path = dest_path + ".tmp"
     try:
@@ -351,51 +408,48 @@ def _background_chunked_generate(job_id, voice_param, voice_name, sentences, spe
     if voice_for_metadata is None:
         voice_for_metadata = voice_name
     try:
-        kokoro = load_model()
         lang = _voice_to_lang(voice_name)
-
-        audio_chunks = []
         total = len(sentences)
-        total_inference = 0.0
+        started = time.perf_counter()
 
-        for i, block in enumerate(sentences):
-            if job.get("abort"):
-                q.put({"phase": "aborted"})
-                with generation_jobs_lock:
-                    job["status"] = "aborted"
-                return
-
-            q.put({"phase": "generating", "chunk": i + 1, "total": total,
-                    "sentence": block})
-
-            phonemes, is_ph = _phonemize_with_misaki(block, lang)
-            start = time.perf_counter()
-            with generation_inference_lock:
-                chunk_audio, _sr = kokoro.create(
-                    text=phonemes, voice=voice_param, speed=speed,
-                    lang=lang, is_phonemes=is_ph,
-                )
-            elapsed = time.perf_counter() - start
-            total_inference += elapsed
-            audio_chunks.append(chunk_audio)
-
-        q.put({"phase": "concatenating"})
-        audio = concatenate_chunks(audio_chunks, sample_rate=24000, gap_ms=80, crossfade_ms=20)
-        audio = pad_audio(audio, sample_rate=24000)
+        def _progress(done, total, block, batch, cached):
+            q.put({"phase": "generating", "chunk": done, "total": total,
+                    "sentence": block, "batch": batch, "cached": cached})
 
         job_dir = _tts_job_dir(basename)
-        os.makedirs(job_dir, exist_ok=True)
         wav_path = os.path.join(job_dir, basename + ".wav")
-        sf.write(wav_path, audio, 24000)
 
-        q.put({"phase": "normalizing"})
-        run_loudnorm(wav_path)
+        def _normalizing():
+            q.put({"phase": "normalizing"})
+            os.makedirs(job_dir, exist_ok=True)
 
-        info = sf.info(wav_path)
-        duration_generated = info.duration
+        # Assembled and normalised through a scratch file: memory stays at a
+        # couple of blocks however long the script is
+        try:
+            frames, meter, stages, normalized = synthesize_script_to_file(
+                sentences, voice_param, speed, lang, wav_path, gap_ms=80, crossfade_ms=20,
+                on_progress=_progress, should_abort=lambda: job.get("abort"),
+                on_normalize=_normalizing)
+        except GenerationAborted:
+            q.put({"phase": "aborted"})
+            with generation_jobs_lock:
+                job["status"] = "aborted"
+            return
+        n_cached = stages["cached_blocks"]
+        if n_cached:
+            logger.info("Reused {}/{} cached blocks", n_cached, total)
+
+        if not normalized:
+            t0 = time.perf_counter()
+            run_loudnorm(wav_path, measured=meter.stats())
+            stages["loudnorm"] = round(stages["loudnorm"] + time.perf_counter() - t0, 3)
+        stages["total"] = round(time.perf_counter() - started, 3)
+
+        total_inference = stages["inference"]
+        duration_generated = frames / 24000
         rtf = total_inference / duration_generated if duration_generated > 0 else 0
-        logger.success("Generated  {:.1f}s audio in {:.2f}s | RTF {:.2f} | {} chunks",
-                       duration_generated, total_inference, rtf, total)
+        logger.success("Generated  {:.1f}s audio in {:.2f}s | RTF {:.2f} | {} chunks | done in {:.2f}s",
+                       duration_generated, total_inference, rtf, total, stages["total"])
 
         clean_prompt = re.sub(r'[\[\]]', '', prompt).strip()
         words = len(clean_prompt.split())
@@ -418,6 +472,8 @@ def _background_chunked_generate(job_id, voice_param, voice_name, sentences, spe
             "approx_tokens": int(words * 1.3),
             "chunked": True,
             "num_chunks": total,
+            "cached_chunks": n_cached,
+            "stages": stages,
         }
         if blend_meta:
             metadata["blend"] = blend_meta
@@ -490,6 +546,55 @@ def voices():
     return jsonify(VOICES)
 
 
+# --- Named voice blends ---
+@tts_bp.route("/api/tts/blends")
+def list_blends():
+    return jsonify(get_blend_registry().list())
+
+
+@tts_bp.route("/api/tts/blends", methods=["POST"])
+def save_blend():
+    """Save a blend under a name usable as ``voice`` in generate/stream/multi-voice.
+
+    Accepts: {name, voice_a, voice_b, ratio?, method?}
+    """
+    data = request.get_json(force=True)
+    name = str(data.get("name", "")).strip().lower()
+    if not NAME_RE.match(name):
+        return jsonify({"error": "Name must be 1-40 chars of a-z, 0-9, '-' or '_'"}), 400
+    if name in VOICES:
+        return jsonify({"error": f"'{name}' is a built-in voice"}), 400
+    try:
+        voice_a, voice_b, ratio, method = _parse_blend(data)
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+
+    registry = get_blend_registry()
+    previous = registry.get(name)
+    if previous:
+        unpin_blend(*_parse_blend(previous))
+    spec = {"voice_a": voice_a, "voice_b": voice_b, "ratio": ratio, "method": method}
+    registry.add(name, spec)
+    if _model_files_present():
+        # Build (and pin) the embedding now so the first use is free
+        _blend_voices(load_model(), voice_a, voice_b, ratio, method, pin=True)
+    logger.info("Saved voice blend {}: {} + {} ({:.0%} {})", name, voice_a, voice_b, ratio, method)
+    return jsonify({"name": name, **spec}), 201
+
+
+@tts_bp.route("/api/tts/blends/<name>", methods=["DELETE"])
+def delete_blend(name):
+    registry = get_blend_registry()
+    spec = registry.get(name)
+    if spec is None or not registry.remove(name):
+        return jsonify({"error": "Blend not found"}), 404
+    try:
+        unpin_blend(*_parse_blend(spec))
+    except ValueError:
+        pass
+    return jsonify({"status": "deleted", "name": name})
+
+
 # --- Model status ---
 @tts_bp.route("/api/tts/model-status/<model_id>")
 def model_status(model_id):
@@ -590,41 +695,12 @@ def generate():
     if model_id not in MODELS:
         return jsonify({"error": "Unknown model"}), 404
 
-    voice_for_metadata = voice
-    voice_param = voice
-    blend_meta = None
-
-    if blend:
-        voice_a = blend.get("voice_a", "")
-        voice_b = blend.get("voice_b", "")
-        ratio = max(0.0, min(1.0, float(blend.get("ratio", 0.5))))
-        method = blend.get("method", "slerp")
-        if method not in ("slerp", "lerp"):
-            method = "slerp"
-        if voice_a not in VOICES:
-            return jsonify({"error": f"Unknown voice_a: {voice_a}"}), 400
-        if voice_b not in VOICES:
-            return jsonify({"error": f"Unknown voice_b: {voice_b}"}), 400
-
-        kokoro_inst = load_model()
-        voice_param = _blend_voices(kokoro_inst, voice_a, voice_b, ratio, method)
-        pct = int(round(ratio * 100))
-        voice_for_metadata = f"{voice_a} + {voice_b} ({pct}% {method.upper()})"
-        voice = voice_a
-        blend_meta = {"voice_a": voice_a, "voice_b": voice_b,
-                      "ratio": ratio, "method": method}
-    else:
-        if voice not in VOICES:
-            return jsonify({"error": f"Unknown voice. Choose from: {VOICES}"}), 400
-
-    if _stream_active.is_set():
-        return jsonify({"error": "A stream is already in progress. Please wait."}), 429
-    with generation_jobs_lock:
-        for job in generation_jobs.values():
-            if job.get("status") == "running":
-                return jsonify({"error": "A generation is already in progress. Please wait or abort."}), 429
+    try:
+        voice_param, voice, voice_for_metadata, blend_meta = _resolve_voice(voice, blend)
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
 
-    kokoro = load_model()
+    load_model()
     lang = _voice_to_lang(voice)
     logger.info("Generate  \033[1m{}\033[0m | {} | {} chars", model_id, voice_for_metadata, len(prompt))
 
@@ -679,8 +755,8 @@ def generate():
     phonemes, is_ph = _phonemize_with_misaki(single_block, lang)
     start = time.perf_counter()
     try:
-        with generation_inference_lock:
-            audio, _sr = kokoro.create(
+        with get_pool().session() as session:
+            audio, _sr = session.create(
                 text=phonemes, voice=voice_param, speed=speed,
                 lang=lang, is_phonemes=is_ph,
             )
@@ -785,105 +861,144 @@ def abort_generation(job_id):
 # --- Stream audio (listen-only, no save) ---
 @tts_bp.route("/api/tts/stream", methods=["POST"])
 def stream_audio():
+    """Stream synthesized audio as it is produced.
+
+    ``format`` (body or query) selects the transport: ``sse`` (JSON events,
+    base64 float32 — default) or ``l16`` (chunked raw audio/L16). Without
+    it, ``Accept: audio/L16`` selects l16. See studio/tts/streaming.py.
+    """
+    started = time.perf_counter()
     data = request.get_json()
     model_id = data.get("model", "kokoro")
     voice = data.get("voice", "af_bella")
     prompt = data.get("prompt", "")
     speed = max(0.5, min(2.0, float(data.get("speed", 1.0))))
     blend = data.get("blend")
+    fmt = negotiate_format(request.args.get("format") or data.get("format"),
+                           request.headers.get("Accept", ""))
 
     if not prompt.strip():
         return jsonify({"error": "Prompt is required"}), 400
     if model_id not in MODELS:
         return jsonify({"error": "Unknown model"}), 404
+    if fmt is None:
+        return jsonify({"error": f"Unknown format. Choose from: {list(STREAM_FORMATS)}"}), 400
 
-    voice_param = voice
-    if blend:
-        voice_a = blend.get("voice_a", "")
-        voice_b = blend.get("voice_b", "")
-        ratio = max(0.0, min(1.0, float(blend.get("ratio", 0.5))))
-        method = blend.get("method", "slerp")
-        if method not in ("slerp", "lerp"):
-            method = "slerp"
-        if voice_a not in VOICES:
-            return jsonify({"error": f"Unknown voice_a: {voice_a}"}), 400
-        if voice_b not in VOICES:
-            return jsonify({"error": f"Unknown voice_b: {voice_b}"}), 400
-        kokoro_inst = load_model()
-        voice_param = _blend_voices(kokoro_inst, voice_a, voice_b, ratio, method)
-        voice = voice_a
-    else:
-        if voice not in VOICES:
-            return jsonify({"error": f"Unknown voice. Choose from: {VOICES}"}), 400
-
-    if _stream_active.is_set():
-        return jsonify({"error": "A stream is already in progress."}), 429
-    with generation_jobs_lock:
-        for job in generation_jobs.values():
-            if job.get("status") == "running":
-                return jsonify({"error": "A generation is already in progress. Please wait or abort."}), 429
+    try:
+        voice_param, voice, _label, _blend_meta = _resolve_voice(voice, blend)
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
 
-    kokoro = load_model()
+    load_model()
     lang = _voice_to_lang(voice)
     skip_clean = data.get("skip_clean", False)
     tts_prompt = clean_for_tts(prompt) if not skip_clean else prompt.strip()
 
-    logger.info("Stream  \033[1m{}\033[0m | {} | {} chars", model_id, voice, len(prompt))
+    # Short first block so audio starts within the latency budget; the rest
+    # is phonemized and synthesized while the first plays
+    blocks = split_first_block(tts_breathing_blocks(tts_prompt) or [tts_prompt],
+                               first_block_planner.max_chars())
+    logger.info("Stream  \033[1m{}\033[0m | {} | {} chars | {} blocks (first {}) | {}",
+                model_id, voice, len(prompt), len(blocks), len(blocks[0]), fmt)
 
     q = Queue()
-
-    stream_phonemes, stream_is_ph = _phonemize_with_misaki(tts_prompt, lang)
+    stop = threading.Event()
 
     def _run_stream():
-        _stream_active.set()
-        loop = asyncio.new_event_loop()
         try:
-            async def _produce():
-                with generation_inference_lock:
-                    stream = kokoro.create_stream(
-                        text=stream_phonemes, voice=voice_param,
-                        speed=speed, lang=lang, is_phonemes=stream_is_ph,
-                    )
-                    async for samples, sr in stream:
-                        q.put(("audio", samples, sr))
-                q.put(("done", None, None))
-
-            loop.run_until_complete(_produce())
-        except Exception:
+            first = True
+            for samples, sr in stream_blocks(blocks, voice_param, speed, lang, stop=stop,
+                                             on_block=first_block_planner.observe):
+                ttfc_ms = None
+                if first:
+                    first = False
+                    ttfc_ms = round((time.perf_counter() - started) * 1000)
+                    stream_stats.record_first_chunk(ttfc_ms)
+                    if ttfc_ms > TTS_STREAM_FIRST_CHUNK_MS:
+                        logger.warning("Stream first chunk after {} ms (budget {} ms, {} chars)",
+                                       ttfc_ms, TTS_STREAM_FIRST_CHUNK_MS, len(blocks[0]))
+                q.put(("audio", (samples, ttfc_ms), sr))
+            q.put(("done", None, None))
+        except Exception as e:
             logger.exception("Stream generation failed")
-            q.put(("error", str(Exception), None))
-        finally:
-            loop.close()
-            _stream_active.clear()
+            q.put(("error", str(e), None))
 
     t = threading.Thread(target=_run_stream, daemon=True)
     t.start()
 
+    def _next():
+        try:
+            return q.get(timeout=60)
+        except Exception:
+            raise TimeoutError("Stream timed out")
+
+    def _chunks(head=None):
+        """(samples, sample_rate, latency) per chunk; latency only on the first.
+
+        *head* is a queue item already taken. Leaving the generator (client
+        gone) stops synthesis after the current block.
+        """
+        first = True
+        try:
+            while True:
+                kind, payload, sr = head or _next()
+                head = None
+                if kind == "done":
+                    return
+                if kind == "error":
+                    raise RuntimeError(payload)
+                samples, ttfc_ms = payload
+                latency = None
+                if first:
+                    first = False
+                    ttfa_ms = round((time.perf_counter() - started) * 1000)
+                    stream_stats.record_first_audio(fmt, ttfa_ms)
+                    logger.info("Stream first audio after {} ms (chunk ready at {} ms, {})",
+                                ttfa_ms, ttfc_ms, fmt)
+                    latency = {"ttfc_ms": ttfc_ms, "ttfa_ms": ttfa_ms}
+                yield samples, sr, latency
+        finally:
+            stop.set()
+
     def _sse():
         chunk_num = 0
-        while True:
-            try:
-                kind, payload, sr = q.get(timeout=60)
-            except Exception:
-                yield f"data: {json.dumps({'phase': 'error', 'message': 'Stream timed out'})}\n\n"
-                break
-            if kind == "audio":
+        latency = {}
+        try:
+            for samples, sr, first_latency in _chunks():
                 chunk_num += 1
-                pcm_bytes = payload.astype(np.float32).tobytes()
-                b64 = base64.b64encode(pcm_bytes).decode("ascii")
-                yield f"data: {json.dumps({'phase': 'audio', 'chunk': chunk_num, 'samples': b64, 'sample_rate': sr})}\n\n"
-            elif kind == "done":
-                yield f"data: {json.dumps({'phase': 'done', 'total_chunks': chunk_num})}\n\n"
-                break
-            elif kind == "error":
-                yield f"data: {json.dumps({'phase': 'error', 'message': payload})}\n\n"
-                break
-
-    return Response(
-        _sse(),
-        mimetype="text/event-stream",
-        headers={"Cache-Control": "no-cache", "Connection": "keep-alive", "X-Accel-Buffering": "no"},
-    )
+                latency = first_latency or latency
+                event = sse_audio_event(chunk_num, samples, sr, first_latency)
+                stream_stats.record_payload(fmt, len(event), len(samples))
+                yield event
+            yield sse_event({"phase": "done", "total_chunks": chunk_num, **latency})
+        except (TimeoutError, RuntimeError) as e:
+            yield sse_event({"phase": "error", "message": str(e)})
+
+    def _l16(head):
+        try:
+            for samples, _sr, _latency in _chunks(head):
+                pcm = encode_l16(samples)
+                stream_stats.record_payload(fmt, len(pcm), len(samples))
+                yield pcm
+        except (TimeoutError, RuntimeError) as e:
+            # Headers are gone; end the body with the error marker instead
+            logger.warning("L16 stream ended early: {}", e)
+            yield l16_error_trailer(e)
+
+    headers = {"Cache-Control": "no-cache", "Connection": "keep-alive", "X-Accel-Buffering": "no"}
+    if fmt == "l16":
+        # Raw audio has no room for an error event, so fail before the
+        # status line while we still can
+        try:
+            head = _next()
+        except TimeoutError as e:
+            stop.set()
+            return jsonify({"error": str(e)}), 504
+        if head[0] == "error":
+            return jsonify({"error": head[1]}), 500
+        return Response(_l16(head), mimetype=L16_MIMETYPE,
+                        headers={**headers, "X-Sample-Rate": str(SAMPLE_RATE)})
+    return Response(_sse(), mimetype="text/event-stream", headers=headers)
 
 
 # --- List generations ---
@@ -1074,78 +1189,79 @@ def convert_to_mp3(filename):
 # --- Multi-voice generation ---
 
 def _background_multivoice_generate(job_id, segments, speed, gap_ms, prompt, basename):
-    """Generate audio with different voices per segment, then concatenate."""
+    """Generate audio with different voices per segment, crossfaded into one track."""
     with generation_jobs_lock:
         job = generation_jobs[job_id]
     q = job["queue"]
     try:
-        kokoro = load_model()
-        audio_chunks = []
+        load_model()
         total = len(segments)
         total_inference = 0.0
         voices_used = set()
+        aborted = False
+
+        # Segments are crossfaded straight into a scratch file and metered on
+        # the way, so a long multi-voice script never sits in memory whole
+        with scratch_wav() as raw_path:
+            meter = LoudnessMeter(24000)
+            with sf.SoundFile(raw_path, "w", 24000, 1, subtype="FLOAT") as raw:
+                writer = ChunkWriter(raw, 24000, gap_ms=gap_ms, crossfade_ms=20, on_audio=meter.add)
+                for i, seg in enumerate(segments):
+                    if job.get("abort"):
+                        aborted = True
+                        break
 
-        for i, seg in enumerate(segments):
-            if job.get("abort"):
+                    seg_text = seg.get("text", "").strip()
+                    seg_voice = seg.get("voice", "af_heart")
+                    seg_speed = max(0.5, min(2.0, float(seg.get("speed", speed))))
+                    seg_blend = seg.get("blend")
+
+                    if not seg_text:
+                        continue
+
+                    voices_used.add(seg_voice)
+                    q.put({"phase": "generating", "chunk": i + 1, "total": total,
+                            "sentence": seg_text[:60], "voice": seg_voice})
+
+                    # Resolve voice param (blend, saved blend or single)
+                    try:
+                        voice_param, base_voice, _label, _blend_meta = _resolve_voice(seg_voice, seg_blend)
+                    except ValueError:
+                        voice_param, base_voice = seg_voice, seg_voice
+
+                    lang = _voice_to_lang(base_voice)
+                    phonemes, is_ph = _phonemize_with_misaki(seg_text, lang)
+                    start = time.perf_counter()
+                    with get_pool().session() as session:
+                        chunk_audio, _sr = session.create(
+                            text=phonemes, voice=voice_param, speed=seg_speed,
+                            lang=lang, is_phonemes=is_ph,
+                        )
+                    elapsed = time.perf_counter() - start
+                    total_inference += elapsed
+                    writer.add(chunk_audio)
+                frames = writer.finish()
+
+            if aborted:
                 q.put({"phase": "aborted"})
                 with generation_jobs_lock:
                     job["status"] = "aborted"
                 return
+            if not writer.chunks:
+                q.put({"phase": "error", "message": "No audio generated"})
+                with generation_jobs_lock:
+                    job["status"] = "error"
+                return
 
-            seg_text = seg.get("text", "").strip()
-            seg_voice = seg.get("voice", "af_heart")
-            seg_speed = max(0.5, min(2.0, float(seg.get("speed", speed))))
-            seg_blend = seg.get("blend")
-
-            if not seg_text:
-                continue
-
-            voices_used.add(seg_voice)
-            q.put({"phase": "generating", "chunk": i + 1, "total": total,
-                    "sentence": seg_text[:60], "voice": seg_voice})
-
-            # Resolve voice param (blend or single)
-            voice_param = seg_voice
-            if seg_blend:
-                va = seg_blend.get("voice_a", "")
-                vb = seg_blend.get("voice_b", "")
-                ratio = max(0.0, min(1.0, float(seg_blend.get("ratio", 0.5))))
-                method = seg_blend.get("method", "slerp")
-                if va in VOICES and vb in VOICES:
-                    voice_param = _blend_voices(kokoro, va, vb, ratio, method)
-
-            lang = _voice_to_lang(seg_voice)
-            phonemes, is_ph = _phonemize_with_misaki(seg_text, lang)
-            start = time.perf_counter()
-            with generation_inference_lock:
-                chunk_audio, _sr = kokoro.create(
-                    text=phonemes, voice=voice_param, speed=seg_speed,
-                    lang=lang, is_phonemes=is_ph,
-                )
-            elapsed = time.perf_counter() - start
-            total_inference += elapsed
-            audio_chunks.append(chunk_audio)
-
-        if not audio_chunks:
-            q.put({"phase": "error", "message": "No audio generated"})
-            with generation_jobs_lock:
-                job["status"] = "error"
-            return
-
-        q.put({"phase": "concatenating"})
-        audio = concatenate_chunks(audio_chunks, sample_rate=24000, gap_ms=gap_ms, crossfade_ms=20)
-        audio = pad_audio(audio, sample_rate=24000)
-
-        job_dir = _tts_job_dir(basename)
-        os.makedirs(job_dir, exist_ok=True)
-        wav_path = os.path.join(job_dir, basename + ".wav")
-        sf.write(wav_path, audio, 24000)
-
-        q.put({"phase": "normalizing"})
-        run_loudnorm(wav_path)
+            q.put({"phase": "normalizing"})
+            job_dir = _tts_job_dir(basename)
+            os.makedirs(job_dir, exist_ok=True)
+            wav_path = os.path.join(job_dir, basename + ".wav")
+            frames, normalized = normalize_loudness_file(raw_path, wav_path, meter)
+        if not normalized:
+            run_loudnorm(wav_path)
 
-        info = sf.info(wav_path)
-        duration_generated = info.duration
+        duration_generated = frames / 24000
         rtf = total_inference / duration_generated if duration_generated > 0 else 0
         logger.success("Multi-voice  {:.1f}s audio in {:.2f}s | RTF {:.2f} | {} segments",
                        duration_generated, total_inference, rtf, total)
@@ -1214,16 +1330,9 @@ def generate_multivoice():
     # Validate voices
     for i, seg in enumerate(segments):
         v = seg.get("voice", "")
-        if v and v not in VOICES:
+        if v and v not in VOICES and get_blend_registry().get(v) is None:
             return jsonify({"error": f"Unknown voice in segment {i + 1}: {v}"}), 400
 
-    if _stream_active.is_set():
-        return jsonify({"error": "A stream is already in progress."}), 429
-    with generation_jobs_lock:
-        for job in generation_jobs.values():
-            if job.get("status") == "running":
-                return jsonify({"error": "A generation is already in progress."}), 429
-
     if not _model_files_present():
         return jsonify({"error": "Model not downloaded. Download it first."}), 400
 
@@ -0,0 +1,156 @@
+"""Stream Transports — wire formats for /api/tts/stream and their timing.
+
+Two encodings of the same chunk sequence:
+
+* ``sse``  — JSON events with base64 float32 samples (the original format;
+  carries phases and errors, ~5.3 bytes per sample on the wire).
+* ``l16``  — a chunked ``audio/L16`` HTTP body: raw big-endian int16
+  (RFC 2586), 2 bytes per sample and no per-chunk encoding work. A failure
+  before the first chunk is a JSON error response; after it, the status
+  line is gone, so the body ends with ``L16_ERROR_MARKER`` and the UTF-8
+  message.
+
+The format is chosen by an explicit ``format`` parameter, else by the
+Accept header. Time-to-first-chunk (request received to first block
+synthesized) and time-to-first-audio (to first bytes handed to the
+transport) are recorded; ``FirstBlockPlanner`` sizes the first block so
+time-to-first-chunk stays within TTS_STREAM_FIRST_CHUNK_MS.
+"""
+
+import base64
+import json
+import threading
+from collections import deque
+
+import numpy as np
+
+from config import TTS_STREAM_FIRST_CHUNK_MS
+
+SAMPLE_RATE = 24000
+STREAM_FORMATS = ("sse", "l16")
+L16_MIMETYPE = f"audio/L16;rate={SAMPLE_RATE};channels=1"
+# Sample-aligned and not plausible audio; static/js/tts.js looks for it
+L16_ERROR_MARKER = b"\x7f\xffL16-STREAM-ERR"
+
+
+def negotiate_format(requested, accept=""):
+    """Stream format for a request; None if *requested* is not supported."""
+    if requested:
+        requested = requested.lower()
+        return requested if requested in STREAM_FORMATS else None
+    if "audio/l16" in (accept or "").lower():
+        return "l16"
+    return "sse"
+
+
+def encode_l16(samples):
+    """float32 [-1, 1] samples as big-endian int16 bytes."""
+    pcm = np.clip(np.asarray(samples, dtype=np.float32), -1.0, 1.0) * 32767.0
+    return np.round(pcm).astype(">i2").tobytes()
+
+
+def l16_error_trailer(message):
+    """Bytes that end an l16 body which failed mid-stream."""
+    return L16_ERROR_MARKER + str(message).encode("utf-8")
+
+
+def sse_event(payload):
+    return f"data: {json.dumps(payload)}\n\n"
+
+
+def sse_audio_event(chunk, samples, sample_rate, latency=None):
+    event = {
+        "phase": "audio",
+        "chunk": chunk,
+        "samples": base64.b64encode(np.asarray(samples, dtype=np.float32).tobytes()).decode("ascii"),
+        "sample_rate": sample_rate,
+    }
+    if latency:
+        event.update(latency)
+    return sse_event(event)
+
+
+def _percentile(values, q):
+    return values[min(len(values) - 1, int(len(values) * q))] if values else None
+
+
+class FirstBlockPlanner:
+    """Longest first block (chars) whose synthesis fits the latency budget.
+
+    Learns the G2P + inference cost per character from every streamed block
+    (exponential moving average), so the cap follows the hardware and the
+    current pool load.
+    """
+
+    MIN_CHARS = 30
+    MAX_CHARS = 200         # tts_breathing_blocks' own max
+
+    def __init__(self, budget_ms=TTS_STREAM_FIRST_CHUNK_MS, ms_per_char=15.0, overhead_ms=60.0):
+        self.budget_ms = budget_ms
+        self.ms_per_char = ms_per_char      # prior: ~RTF 0.25 on a laptop CPU
+        self.overhead_ms = overhead_ms      # request parsing, session lease, first G2P
+        self._lock = threading.Lock()
+
+    def observe(self, chars, seconds):
+        if chars <= 0:
+            return
+        with self._lock:
+            self.ms_per_char += 0.2 * (seconds * 1000.0 / chars - self.ms_per_char)
+
+    def max_chars(self):
+        with self._lock:
+            chars = (self.budget_ms - self.overhead_ms) / max(self.ms_per_char, 1e-3)
+        return int(max(self.MIN_CHARS, min(self.MAX_CHARS, chars)))
+
+
+class StreamStats:
+    """Rolling first-chunk / first-audio latency and payload size per format."""
+
+    def __init__(self, window=200, budget_ms=TTS_STREAM_FIRST_CHUNK_MS):
+        self.budget_ms = budget_ms
+        self._lock = threading.Lock()
+        self._ttfc = deque(maxlen=window)
+        self._over_budget = 0
+        self._ttfa = {fmt: deque(maxlen=window) for fmt in STREAM_FORMATS}
+        self._bytes = {fmt: 0 for fmt in STREAM_FORMATS}
+        self._seconds = {fmt: 0.0 for fmt in STREAM_FORMATS}
+
+    def record_first_chunk(self, ttfc_ms):
+        with self._lock:
+            self._ttfc.append(ttfc_ms)
+            if ttfc_ms > self.budget_ms:
+                self._over_budget += 1
+
+    def record_first_audio(self, fmt, ttfa_ms):
+        with self._lock:
+            self._ttfa[fmt].append(ttfa_ms)
+
+    def record_payload(self, fmt, n_bytes, n_samples):
+        with self._lock:
+            self._bytes[fmt] += n_bytes
+            self._seconds[fmt] += n_samples / SAMPLE_RATE
+
+    def stats(self):
+        with self._lock:
+            ttfc = sorted(self._ttfc)
+            out = {
+                "first_chunk_budget_ms": self.budget_ms,
+                "first_block_max_chars": first_block_planner.max_chars(),
+                "ttfc_p50_ms": _percentile(ttfc, 0.5),
+                "ttfc_p95_ms": _percentile(ttfc, 0.95),
+                "ttfc_over_budget": self._over_budget,
+            }
+            for fmt in STREAM_FORMATS:
+                ttfa = sorted(self._ttfa[fmt])
+                seconds = self._seconds[fmt]
+                out[fmt] = {
+                    "streams": len(ttfa),
+                    "ttfa_p50_ms": _percentile(ttfa, 0.5),
+                    "ttfa_p95_ms": _percentile(ttfa, 0.95),
+                    "bytes_per_audio_second": round(self._bytes[fmt] / seconds) if seconds else None,
+                }
+        return out
+
+
+first_block_planner = FirstBlockPlanner()
+stream_stats = StreamStats()
@@ -0,0 +1,115 @@
+"""Warm-up — load models in the background at boot.
+
+Kokoro, misaki and the stable-ts aligner all load lazily, so without this
+the first request of each kind waits for its model. ``start()`` (opt-in via
+``--preload`` or STUDIO_PRELOAD=1) loads them on background threads and
+runs one tiny Kokoro inference so ONNX Runtime has allocated its buffers
+before a user asks. ``readiness()`` backs /api/ready.
+"""
+
+import threading
+import time
+
+from loguru import logger
+
+MODELS = ("kokoro", "misaki", "alignment")
+
+# state: idle -> loading -> warming -> ready | unavailable | error
+_status = {name: {"state": "idle"} for name in MODELS}
+_status_lock = threading.Lock()
+
+
+def _set(name, **fields):
+    with _status_lock:
+        _status[name].update(fields)
+
+
+def _warm_kokoro():
+    from studio.tts import routes as tts_routes
+    if not tts_routes._model_files_present():
+        return "unavailable", "model files not downloaded"
+    start = time.perf_counter()
+    kokoro = tts_routes.load_model()
+    _set("kokoro", state="warming", load_seconds=round(time.perf_counter() - start, 2))
+
+    start = time.perf_counter()
+    voice = kokoro.get_voices()[0]
+    with tts_routes.get_pool().session() as session:
+        session.create("həlˈO.", voice=voice, is_phonemes=True)
+    _set("kokoro", warmup_seconds=round(time.perf_counter() - start, 2))
+    return "ready", None
+
+
+def _warm_misaki():
+    from studio.tts import routes as tts_routes
+    start = time.perf_counter()
+    if tts_routes._get_misaki_g2p(british=False) is None:
+        return "unavailable", "misaki not installed"
+    _set("misaki", state="warming", load_seconds=round(time.perf_counter() - start, 2))
+
+    start = time.perf_counter()
+    tts_routes._phonemize_with_misaki("Hello world.", "en-us")
+    _set("misaki", warmup_seconds=round(time.perf_counter() - start, 2))
+    return "ready", None
+
+
+def _warm_alignment():
+    from studio.timing import routes as timing_routes
+    if not timing_routes._check_alignment_available():
+        return "unavailable", "stable-ts not installed"
+    start = time.perf_counter()
+    timing_routes._load_alignment_model()
+    _set("alignment", load_seconds=round(time.perf_counter() - start, 2))
+    return "ready", None
+
+
+_WARMERS = {"kokoro": _warm_kokoro, "misaki": _warm_misaki, "alignment": _warm_alignment}
+
+
+def _run(name):
+    start = time.perf_counter()
+    try:
+        state, reason = _WARMERS[name]()
+    except Exception as e:
+        logger.exception("Warm-up of {} failed", name)
+        _set(name, state="error", error=str(e))
+        return
+    _set(name, state=state, total_seconds=round(time.perf_counter() - start, 2),
+         **({"reason": reason} if reason else {}))
+    if state == "ready":
+        logger.success("Warm-up: {} ready in {:.1f}s", name, time.perf_counter() - start)
+    else:
+        logger.info("Warm-up: {} skipped ({})", name, reason)
+
+
+def start(models=MODELS):
+    """Warm *models* on background threads; returns immediately."""
+    for name in models:
+        with _status_lock:
+            if _status[name]["state"] != "idle":
+                continue
+            _status[name]["state"] = "loading"
+        threading.Thread(target=_run, args=(name,), name=f"warmup-{name}", daemon=True).start()
+
+
+def _loaded(name):
+    """Whether a model was loaded by a request even without warm-up."""
+    if name == "kokoro":
+        from studio.tts import routes as tts_routes
+        return tts_routes.kokoro_instance is not None
+    if name == "misaki":
+        from studio.tts import routes as tts_routes
+        return tts_routes._misaki_g2p is not None
+    from studio.timing import routes as timing_routes
+    return timing_routes.alignment_model is not None
+
+
+def readiness():
+    """Per-model state and timings; ``ready`` once nothing is still loading."""
+    with _status_lock:
+        models = {name: dict(status) for name, status in _status.items()}
+    for name, status in models.items():
+        if status["state"] == "idle":
+            status["state"] = "ready" if _loaded(name) else "lazy"
+    busy = any(s["state"] in ("loading", "warming") for s in models.values())
+    return {"ready": not busy, "models": models}
@@ -7,18 +7,17 @@ import os
 import sys
 import uuid
 import json
-import threading
 import subprocess
-from flask import Flask, request, jsonify, send_file
+import time
+from flask import Flask, Response, request, jsonify, send_file, stream_with_context
 from flask_cors import CORS
-from video_processor import VideoProcessor
+from video_processor import ENCODE_PROFILES, VideoProcessor, get_clip_cache, get_encode_profiles
+from config import EXPORT_QUEUE_WORKERS
+from studio.export_queue import ExportQueue
 
 app = Flask(__name__)
 CORS(app)
 
-# Store job statuses
-jobs = {}
-
 # Configure paths
 EXPORT_DIR = os.path.join(os.path.dirname(__file__), 'exports')
 os.makedirs(EXPORT_DIR, exist_ok=True)
@@ -94,96 +93,162 @@ def start_export():
             if field not in data:
                 return jsonify({'error': f'Missing required field: {field}'}), 400
 
+        encode_profile = (data.get('output') or {}).get('encode_profile')
+        if encode_profile and encode_profile not in ENCODE_PROFILES:
+            return jsonify({'error': f'Unknown encode_profile: {encode_profile}'}), 400
+
+        try:
+            priority = int(data.get('priority', 0))
+        except (TypeError, ValueError):
+            return jsonify({'error': 'priority must be an integer'}), 400
+
         # Generate job ID
         job_id = str(uuid.uuid4())
 
         # Prepare output path
-        output_filename = f"{data['project_id']}_{job_id[:8]}.mp4"
+        is_proxy = (data.get('output') or {}).get('export_mode') == 'proxy'
+        suffix = '_proxy' if is_proxy else ''
+        output_filename = f"{data['project_id']}_{job_id[:8]}{suffix}.mp4"
         output_path = os.path.join(EXPORT_DIR, output_filename)
 
         # Initialize job status
-        jobs[job_id] = {
+        job = {
             'status': 'queued',
             'progress': 0,
             'message': 'Job queued',
             'output_path': output_path,
             'output_filename': output_filename,
-            'error': None
+            'error': None,
+            'processor': None,
+            'cancelled': False,
+            'encode_profile': 'proxy' if is_proxy else (encode_profile or 'default'),
+            'encode_stats': None,
+            'proxy': is_proxy
         }
 
-        # Start processing in background thread
-        thread = threading.Thread(
-            target=process_video,
-            args=(job_id, data, output_path)
-        )
-        thread.daemon = True
-        thread.start()
+        # Queue for the render workers
+        position = job_queue.submit(job_id, job, data, priority=priority)
 
         return jsonify({
             'job_id': job_id,
             'status': 'queued',
-            'message': 'Export job started'
+            'message': 'Export job queued',
+            'queue_position': position
         })
 
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
 
-def process_video(job_id, export_data, output_path):
-    """Process video in background thread"""
+def process_video(job_id, job, export_data):
+    """Run one export on an export queue worker thread"""
+    output_path = job['output_path']
+    processor = None
     try:
-        jobs[job_id]['status'] = 'processing'
-        jobs[job_id]['message'] = 'Starting video processing'
+        if job['cancelled']:
+            job['status'] = 'cancelled'
+            return
+
+        job['status'] = 'processing'
+        job['message'] = 'Starting video processing'
 
         def update_progress(progress, message):
-            jobs[job_id]['progress'] = progress
-            jobs[job_id]['message'] = message
+            job['progress'] = progress
+            job['message'] = message
 
         # Create processor with full export data and run
         processor = VideoProcessor(
             export_data=export_data,
             progress_callback=update_progress
         )
+        job['processor'] = processor
 
         processor.process(output_path)
 
-        jobs[job_id]['status'] = 'completed'
-        jobs[job_id]['progress'] = 100
-        jobs[job_id]['message'] = 'Export completed successfully'
+        job['encode_stats'] = processor.encode_stats()
+        job['status'] = 'completed'
+        job['progress'] = 100
+        job['message'] = 'Export completed successfully'
 
     except Exception as e:
+        if job['cancelled'] or (processor is not None and processor.cancelled):
+            job['status'] = 'cancelled'
+            job['message'] = 'Export cancelled'
+            return
         import traceback
         error_details = traceback.format_exc()
         print(f"Export error: {error_details}")
-        jobs[job_id]['status'] = 'failed'
-        jobs[job_id]['error'] = str(e)
-        jobs[job_id]['message'] = f'Export failed: {str(e)}'
+        job['status'] = 'failed'
+        job['error'] = str(e)
+        job['message'] = f'Export failed: {str(e)}'
+    finally:
+        job['processor'] = None
+
+
+# Persistent job queue: bounded render workers, survives restarts (started in __main__)
+job_queue = ExportQueue(os.path.join(EXPORT_DIR, 'export_queue.db'), process_video,
+                        workers=EXPORT_QUEUE_WORKERS, transient_fields=('processor',))
+
+
+@app.route('/api/export/profiles', methods=['GET'])
+def list_encode_profiles():
+    """Named encode profiles with measured encode fps"""
+    return jsonify(get_encode_profiles())
+
+
+@app.route('/api/export/cache', methods=['GET'])
+def export_cache_stats():
+    """Scene clip cache size and hit/miss statistics"""
+    cache = get_clip_cache()
+    if cache is None:
+        return jsonify({'enabled': False})
+    return jsonify({'enabled': True, **cache.stats()})
+
+
+@app.route('/api/export/cache', methods=['DELETE'])
+def clear_export_cache():
+    """Drop all cached scene clips (clips in use by running exports are kept)"""
+    cache = get_clip_cache()
+    if cache is None:
+        return jsonify({'enabled': False, 'removed': 0})
+    removed = cache.clear()
+    return jsonify({'enabled': True, 'removed': removed})
+
+
+@app.route('/api/export/queue', methods=['GET'])
+def export_queue_metrics():
+    """Export queue depth, running jobs and recent wait/run times"""
+    return jsonify(job_queue.metrics())
 
 
 @app.route('/api/export/<job_id>/status', methods=['GET'])
 def get_export_status(job_id):
     """Get status of an export job"""
-    if job_id not in jobs:
+    job = job_queue.get(job_id)
+    if job is None:
         return jsonify({'error': 'Job not found'}), 404
-
-    job = jobs[job_id]
     return jsonify({
         'job_id': job_id,
         'status': job['status'],
         'progress': job['progress'],
         'message': job['message'],
-        'error': job['error']
+        'error': job['error'],
+        'encode_profile': job['encode_profile'],
+        'encode_stats': job['encode_stats'],
+        'proxy': job['proxy'],
+        'preview_ready': preview_ready(job),
+        'priority': job.get('priority', 0),
+        'queue_position': job_queue.position(job_id)
     })
 
 
 @app.route('/api/export/<job_id>/download', methods=['GET'])
 def download_export(job_id):
     """Download completed export"""
-    if job_id not in jobs:
+    job = job_queue.get(job_id)
+    if job is None:
         return jsonify({'error': 'Job not found'}), 404
 
-    job = jobs[job_id]
-
     if job['status'] != 'completed':
         return jsonify({'error': 'Export not completed yet'}), 400
 
@@ -198,13 +263,72 @@ def download_export(job_id):
     )
 
 
+def preview_ready(job):
+    """True once the preview endpoint has something playable to serve"""
+    if job['status'] == 'completed':
+        return True
+    # Proxy exports are fragmented MP4: playable once the first fragment lands
+    return (job['proxy'] and job['status'] == 'processing'
+            and os.path.exists(job['output_path'])
+            and os.path.getsize(job['output_path']) > 0)
+
+
+def tail_export(job, chunk_size=64 * 1024, poll=0.25):
+    """Stream a proxy export file as ffmpeg appends fragments to it"""
+    path = job['output_path']
+    while not os.path.exists(path):
+        if job['status'] not in ('queued', 'processing'):
+            return
+        time.sleep(poll)
+
+    with open(path, 'rb') as f:
+        while True:
+            data = f.read(chunk_size)
+            if data:
+                yield data
+                continue
+            if job['status'] not in ('queued', 'processing'):
+                rest = f.read()
+                if rest:
+                    yield rest
+                return
+            time.sleep(poll)
+
+
+@app.route('/api/export/<job_id>/preview', methods=['GET'])
+def preview_export(job_id):
+    """Preview export in browser (proxy exports stream while encoding)"""
+    job = job_queue.get(job_id)
+    if job is None:
+        return jsonify({'error': 'Job not found'}), 404
+
+    if job['proxy'] and job['status'] in ('queued', 'processing'):
+        return Response(
+            stream_with_context(tail_export(job)),
+            mimetype='video/mp4',
+            headers={'Cache-Control': 'no-cache'}
+        )
+
+    if job['status'] != 'completed':
+        return jsonify({'error': 'Export not completed yet'}), 400
+
+    if not os.path.exists(job['output_path']):
+        return jsonify({'error': 'Output file not found'}), 404
+
+    return send_file(job['output_path'], mimetype='video/mp4', as_attachment=False)
+
+
 @app.route('/api/export/<job_id>', methods=['DELETE'])
 def cancel_export(job_id):
     """Cancel/cleanup an export job"""
-    if job_id not in jobs:
+    job = job_queue.get(job_id)
+    if job is None:
         return jsonify({'error': 'Job not found'}), 404
 
-    job = jobs[job_id]
+    # Stop a running export (kills its in-flight ffmpeg processes)
+    job['cancelled'] = True
+    if job.get('processor') is not None:
+        job['processor'].cancel()
 
     # Clean up file if it exists
     if os.path.exists(job['output_path']):
@@ -213,17 +337,16 @@ def cancel_export(job_id):
         except:
             pass
 
-    del jobs[job_id]
+    job_queue.remove(job_id)
     return jsonify({'message': 'Job cancelled and cleaned up'})
 
 
 @app.route('/api/export/<job_id>/open-folder', methods=['POST'])
 def open_export_folder(job_id):
     """Open the folder containing the exported video and select it."""
-    if job_id not in jobs:
+    job = job_queue.get(job_id)
+    if job is None:
         return jsonify({'error': 'Job not found'}), 404
-
-    job = jobs[job_id]
     output_path = os.path.abspath(job.get('output_path', ''))
 
     if not os.path.exists(output_path):
@@ -255,4 +378,7 @@ def open_export_folder(job_id):
 if __name__ == '__main__':
     print("Starting Video Export Server...")
     print(f"Export directory: {EXPORT_DIR}")
-    app.run(host='0.0.0.0', port=5000, debug=True)
+    job_queue.start()
+    # No reloader: its watcher process would import this module too and
+    # render every restored job a second time
+    app.run(host='0.0.0.0', port=5000, debug=True, use_reloader=False)
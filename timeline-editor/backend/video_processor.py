@@ -3,12 +3,18 @@ Video Processor
 FFmpeg-based video processing for scene assembly and effects
 """
 
+import json
+import math
 import os
 import re
 import subprocess
 import tempfile
 import shutil
-from PIL import Image, ImageDraw, ImageFont
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from PIL import Image, ImageColor, ImageDraw, ImageFont, ImageOps
 import platform
 import sys
 from loguru import logger
@@ -18,6 +24,8 @@ _project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '.
 if _project_root not in sys.path:
     sys.path.insert(0, _project_root)
 
+from studio.assets.derivatives import IMAGE_EXTS, find_derivative
+from studio.cache import DiskLRUCache, file_digest, hash_key
 from studio.fonts import get_font_path as _custom_font_path
 
 # Check if ffmpeg-python is available, fallback to subprocess
@@ -48,6 +56,129 @@ def _find_ffmpeg():
 FFMPEG_BIN = _find_ffmpeg() or "ffmpeg"
 
 
+def _find_ffprobe():
+    """ffprobe next to the ffmpeg binary, then on PATH (None if missing)."""
+    exe = "ffprobe.exe" if os.name == "nt" else "ffprobe"
+    local = os.path.join(os.path.dirname(FFMPEG_BIN), exe)
+    if os.path.isfile(local):
+        return local
+    return shutil.which("ffprobe")
+
+
+FFPROBE_BIN = _find_ffprobe()
+
+
+class ExportCancelled(RuntimeError):
+    """Raised when an export is cancelled while it is still running."""
+
+
+def _default_max_workers():
+    """Scene render workers: EXPORT_MAX_WORKERS, or half the cores (max 4)."""
+    from config import EXPORT_MAX_WORKERS
+    if EXPORT_MAX_WORKERS > 0:
+        return EXPORT_MAX_WORKERS
+    return max(1, min(4, (os.cpu_count() or 2) // 2))
+
+
+# Bump when clip rendering changes in a way that invalidates cached clips
+CLIP_CACHE_VERSION = 4
+
+# Scene clips share these so the concat demuxer can stream-copy them:
+# constant frame rate, fixed closed GOP (no scene-cut keyframes), one
+# mp4 timescale (divisible by 24/25/30/60 fps) and square pixels.
+CLIP_GOP_SECONDS = 2
+CLIP_TIMESCALE = 90000
+
+# Ken Burns effects and the engines that can render them (output.kenburns_engine):
+# zoompan: ffmpeg zoompan filter (default; 25 fps internally, integer crop offsets)
+# pillow: source pre-scaled once, per-frame sub-pixel crop+resize at the output
+#         fps, raw frames piped to ffmpeg — smoother motion, but 0.55-0.87x
+#         zoompan's speed, so opt-in
+KENBURNS_EFFECTS = ('zoom_in', 'zoom_out', 'pan_left', 'pan_right')
+KENBURNS_ENGINES = ('zoompan', 'pillow')
+
+# Clip stream parameters, memoised on (path, size, mtime_ns) — cached clips are probed once
+_probe_cache = {}
+_probe_cache_lock = threading.Lock()
+
+# multi_pass: per-scene clips -> concat -> caption burn-in (cacheable clips)
+# single_graph: one filter_complex over all inputs, encoded once
+# proxy: single graph with the 'proxy' profile, written as fragmented MP4 so
+#        the file is playable while it is still being encoded
+EXPORT_MODES = ('multi_pass', 'single_graph', 'proxy')
+
+VIDEO_EXTENSIONS = ('.mp4', '.webm', '.mov', '.avi', '.mkv')
+
+# Named speed/quality trade-offs, selected with output.encode_profile.
+#   scale   — multiplier on the requested resolution
+#   fps     — None keeps the requested fps
+#   crf     — None keeps the requested crf
+#   threads — None = auto (cores split across parallel scene renders)
+ENCODE_PROFILES = {
+    'draft': {
+        'label': 'Draft', 'preset': 'ultrafast', 'crf': 30, 'scale': 0.5,
+        'fps': 24, 'threads': None, 'tune': 'fastdecode',
+    },
+    'review': {
+        'label': 'Review', 'preset': 'veryfast', 'crf': 26, 'scale': 0.75,
+        'fps': None, 'threads': None, 'tune': None,
+    },
+    'final': {
+        'label': 'Final', 'preset': 'medium', 'crf': None, 'scale': 1.0,
+        'fps': None, 'threads': None, 'tune': None,
+    },
+    # Used by export_mode='proxy': quarter pixel count, no lookahead/B-frame delay
+    'proxy': {
+        'label': 'Proxy preview', 'preset': 'ultrafast', 'crf': 32, 'scale': 0.5,
+        'fps': 15, 'threads': None, 'tune': 'zerolatency',
+    },
+}
+
+# Used when no encode_profile is requested (matches the historical clip/caption encodes)
+_LEGACY_PROFILE = {
+    'label': 'Default', 'preset': 'fast', 'crf': None, 'scale': 1.0,
+    'fps': None, 'threads': None, 'tune': None,
+}
+
+# Measured encode fps per profile (exponential moving average across exports)
+_profile_fps = {}
+_profile_fps_lock = threading.Lock()
+
+
+def get_encode_profiles():
+    """Encode profiles with the encode fps measured on this machine so far."""
+    with _profile_fps_lock:
+        measured = dict(_profile_fps)
+    return {
+        name: {**profile, 'measured_fps': measured.get(name)}
+        for name, profile in ENCODE_PROFILES.items()
+    }
+
+
+def _record_profile_fps(name, fps):
+    with _profile_fps_lock:
+        prev = _profile_fps.get(name)
+        _profile_fps[name] = round(fps if prev is None else prev * 0.7 + fps * 0.3, 2)
+
+
+_clip_cache = None
+_clip_cache_lock = threading.Lock()
+
+
+def get_clip_cache():
+    """Shared scene clip cache, or None when EXPORT_CLIP_CACHE_MAX_MB is 0."""
+    global _clip_cache
+    from config import EXPORT_CLIP_CACHE_DIR, EXPORT_CLIP_CACHE_MAX_MB
+    if EXPORT_CLIP_CACHE_MAX_MB <= 0:
+        return None
+    with _clip_cache_lock:
+        if _clip_cache is None:
+            _clip_cache = DiskLRUCache(EXPORT_CLIP_CACHE_DIR,
+                                       EXPORT_CLIP_CACHE_MAX_MB * 1024 * 1024,
+                                       suffix='.mp4', name='Clip')
+    return _clip_cache
+
+
 # Font family mapping: frontend name -> system font paths by OS
 # These match the fonts available in the frontend preview.js
 FONT_MAP = {
@@ -163,8 +294,58 @@ class VideoProcessor:
         self.fps = output.get('fps', 30)
         self.codec = output.get('codec', 'libx264')
         self.pixel_format = output.get('pixel_format', 'yuv420p')
-        self.preset = output.get('preset', 'medium')
         self.crf = output.get('crf', 23)
+        self.max_workers = max(1, int(output.get('max_workers') or _default_max_workers()))
+
+        self.export_mode = output.get('export_mode', 'multi_pass')
+        if self.export_mode not in EXPORT_MODES:
+            logger.warning("Unknown export_mode '{}', falling back to multi_pass", self.export_mode)
+            self.export_mode = 'multi_pass'
+
+        # Pre-scaled image derivatives from studio.assets (output.use_derivatives=false reads originals)
+        self.use_derivatives = output.get('use_derivatives', True)
+        self.kenburns_engine = output.get('kenburns_engine', 'zoompan')
+        if self.kenburns_engine not in KENBURNS_ENGINES:
+            logger.warning("Unknown kenburns_engine '{}', falling back to zoompan", self.kenburns_engine)
+            self.kenburns_engine = 'zoompan'
+
+        # Encode profile: one preset/crf/tune/threads for every encode in this export
+        self.encode_profile = output.get('encode_profile') or None
+        if self.export_mode == 'proxy':
+            self.encode_profile = 'proxy'
+        if self.encode_profile and self.encode_profile not in ENCODE_PROFILES:
+            raise ValueError(f"Unknown encode_profile: {self.encode_profile}")
+        profile = ENCODE_PROFILES[self.encode_profile] if self.encode_profile else _LEGACY_PROFILE
+        self.preset = profile['preset']
+        self.tune = profile['tune']
+        self.threads = profile['threads']
+        if profile['crf'] is not None:
+            self.crf = profile['crf']
+        if profile['fps']:
+            self.fps = profile['fps']
+        if profile['scale'] != 1.0:
+            # Keep dimensions even for yuv420p
+            self.width = max(2, int(round(self.width * profile['scale'] / 2)) * 2)
+            self.height = max(2, int(round(self.height * profile['scale'] / 2)) * 2)
+
+        # Encode throughput (frames / seconds spent inside encoding ffmpeg runs)
+        self._encoded_frames = 0
+        self._encode_seconds = 0.0
+        self._stats_lock = threading.Lock()
+        self.wall_seconds = None
+        self.concat_saved_seconds = None
+
+        # In-flight ffmpeg children, killed by cancel()
+        self._cancel_event = threading.Event()
+        self._procs = set()
+        self._procs_lock = threading.Lock()
+
+        # Scene clip cache (output.use_cache=false forces a full re-render)
+        self.clip_cache = get_clip_cache() if output.get('use_cache', True) else None
+        self.cache_hits = 0
+        self.cache_misses = 0
+        self._pinned_keys = []
+        self._cache_lock = threading.Lock()
 
         # Base path for media files (relative to backend folder)
         self.media_base_path = export_data.get('media_base_path', '')
@@ -174,8 +355,9 @@ class VideoProcessor:
         self.project_root = os.path.dirname(self.backend_dir)
         self.frontend_dir = os.path.join(self.project_root, 'frontend')
 
-        logger.info("VideoProcessor init: {}x{} {}fps crf={} codec={} preset={}",
-                     self.width, self.height, self.fps, self.crf, self.codec, self.preset)
+        logger.info("VideoProcessor init: {}x{} {}fps crf={} codec={} preset={} tune={} profile={} mode={} workers={}",
+                     self.width, self.height, self.fps, self.crf, self.codec, self.preset, self.tune,
+                     self.encode_profile or 'default', self.export_mode, self.max_workers)
         logger.debug("VideoProcessor paths: backend={} root={} frontend={}",
                       self.backend_dir, self.project_root, self.frontend_dir)
         logger.debug("VideoProcessor ffmpeg: {} (lib={})", FFMPEG_BIN, USE_FFMPEG_PYTHON)
@@ -184,15 +366,222 @@ class VideoProcessor:
         """Update progress callback"""
         self.progress_callback(progress, message)
 
-    def _get_media_path(self, relative_path):
-        """Resolve media path from working-assets folder"""
+    @property
+    def cancelled(self):
+        return self._cancel_event.is_set()
+
+    def cancel(self):
+        """Cancel the export and kill every in-flight ffmpeg child."""
+        if self._cancel_event.is_set():
+            return
+        self._cancel_event.set()
+        killed = self._kill_children()
+        logger.warning("Export cancelled — killed {} ffmpeg process(es)", killed)
+
+    def _kill_children(self):
+        """Kill all tracked ffmpeg children, returns how many were signalled."""
+        with self._procs_lock:
+            procs = list(self._procs)
+        for proc in procs:
+            try:
+                proc.kill()
+            except OSError:
+                pass
+        return len(procs)
+
+    def _run_ffmpeg(self, cmd, on_progress=None, frames=None, stdin_chunks=None):
+        """Run an ffmpeg command as a tracked child process.
+
+        Behaves like subprocess.run(cmd, capture_output=True, text=True), but
+        the child can be killed from another thread via cancel(). With
+        *on_progress*, ffmpeg's -progress report is parsed and the callback
+        receives {'out_time': seconds, 'fps': float, 'speed': float} updates.
+        *frames* (frames this run encodes) feeds the export's encode fps stats.
+        *stdin_chunks* is an iterable of bytes written to the child's stdin.
+        """
+        if self._cancel_event.is_set():
+            raise ExportCancelled("Export cancelled")
+
+        if on_progress:
+            cmd = [cmd[0], '-progress', 'pipe:1', '-nostats'] + list(cmd[1:])
+
+        started = time.perf_counter()
+        proc = subprocess.Popen(cmd, stdin=subprocess.PIPE if stdin_chunks is not None else None,
+                                stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
+        with self._procs_lock:
+            self._procs.add(proc)
+        try:
+            # cancel() may have run between Popen and registration
+            if self._cancel_event.is_set():
+                proc.kill()
+            if on_progress:
+                # Drain stderr on a side thread so a chatty encoder can't block on a full pipe
+                stderr_buf = []
+                drain = threading.Thread(target=lambda: stderr_buf.append(proc.stderr.read()), daemon=True)
+                drain.start()
+                stdout = self._read_ffmpeg_progress(proc.stdout, on_progress)
+                proc.wait()
+                drain.join()
+                stderr = ''.join(stderr_buf)
+            elif stdin_chunks is not None:
+                stdout, stderr = self._feed_ffmpeg(proc, stdin_chunks)
+            else:
+                stdout, stderr = proc.communicate()
+        finally:
+            with self._procs_lock:
+                self._procs.discard(proc)
+
+        if self._cancel_event.is_set():
+            raise ExportCancelled("Export cancelled")
+        if frames and proc.returncode == 0:
+            with self._stats_lock:
+                self._encoded_frames += int(frames)
+                self._encode_seconds += time.perf_counter() - started
+        return subprocess.CompletedProcess(cmd, proc.returncode, stdout, stderr)
+
+    def _feed_ffmpeg(self, proc, chunks):
+        """Write *chunks* to proc's stdin while draining its output; returns (stdout, stderr)."""
+        out_buf, err_buf = [], []
+        drains = [threading.Thread(target=lambda: out_buf.append(proc.stdout.read()), daemon=True),
+                  threading.Thread(target=lambda: err_buf.append(proc.stderr.read()), daemon=True)]
+        for t in drains:
+            t.start()
+        try:
+            for chunk in chunks:
+                if self._cancel_event.is_set():
+                    break
+                proc.stdin.buffer.write(chunk)
+        except (BrokenPipeError, OSError):
+            # ffmpeg exited early; its stderr says why
+            pass
+        except BaseException:
+            # Frame source failed: don't leave ffmpeg encoding a truncated stream
+            proc.kill()
+            proc.wait()
+            raise
+        finally:
+            try:
+                proc.stdin.close()
+            except (BrokenPipeError, OSError):
+                pass
+        proc.wait()
+        for t in drains:
+            t.join()
+        return ''.join(out_buf), ''.join(err_buf)
+
+    def _encode_options(self, parallel=False):
+        """Video encoder options for the active profile, as an ordered dict.
+
+        *parallel* marks scene renders that share the CPU with other workers;
+        their x264 thread count is split accordingly when threads is auto.
+        """
+        threads = self.threads
+        if threads is None and parallel and self.max_workers > 1:
+            threads = max(1, (os.cpu_count() or 2) // self.max_workers)
+        options = {
+            'c:v': self.codec,
+            'preset': self.preset,
+            'crf': str(self.crf),
+            'pix_fmt': self.pixel_format,
+        }
+        if self.tune:
+            options['tune'] = self.tune
+        if threads:
+            options['threads'] = str(threads)
+        return options
+
+    def _encode_args(self, parallel=False):
+        """_encode_options() as ffmpeg command-line arguments."""
+        return self._options_to_args(self._encode_options(parallel))
+
+    def _clip_options(self):
+        """Encoder options for scene clips: the profile plus concat-safe stream layout."""
+        gop = str(max(1, int(self.fps * CLIP_GOP_SECONDS)))
+        options = self._encode_options(parallel=True)
+        options.update({
+            'r': str(self.fps),
+            'g': gop,
+            'keyint_min': gop,
+            'sc_threshold': '0',
+            'video_track_timescale': str(CLIP_TIMESCALE),
+            'an': None,
+        })
+        return options
+
+    def _clip_args(self):
+        """_clip_options() as ffmpeg command-line arguments."""
+        return self._options_to_args(self._clip_options())
+
+    @staticmethod
+    def _options_to_args(options):
+        args = []
+        for key, value in options.items():
+            args.append(f'-{key}')
+            if value is not None:
+                args.append(value)
+        return args
+
+    def encode_stats(self):
+        """Encode throughput for this export (job status / profile stats)."""
+        with self._stats_lock:
+            frames, seconds = self._encoded_frames, self._encode_seconds
+        timeline_frames = int(sum(s.get('duration', 3) for s in self.export_data.get('scenes', [])) * self.fps)
+        return {
+            'profile': self.encode_profile or 'default',
+            'resolution': f"{self.width}x{self.height}",
+            'fps': self.fps,
+            'preset': self.preset,
+            'crf': self.crf,
+            'encoded_frames': frames,
+            'encode_seconds': round(seconds, 2),
+            # Per-encoder speed: frames pushed through x264 per second of encode time
+            'encode_fps': round(frames / seconds, 2) if seconds else None,
+            # End-to-end: output frames per second of wall time (includes parallelism)
+            'throughput_fps': round(timeline_frames / self.wall_seconds, 2) if self.wall_seconds else None,
+            'wall_seconds': round(self.wall_seconds, 2) if self.wall_seconds else None,
+            # Estimated encode time avoided by stream-copying video at concat (multi_pass)
+            'concat_saved_seconds': (round(self.concat_saved_seconds, 2)
+                                     if self.concat_saved_seconds is not None else None),
+        }
+
+    @staticmethod
+    def _read_ffmpeg_progress(stream, on_progress):
+        """Parse `-progress pipe:1` key=value blocks, calling on_progress per block."""
+        block = {}
+        for line in stream:
+            key, _, value = line.strip().partition('=')
+            if key != 'progress':
+                block[key] = value
+                continue
+            try:
+                out_time = int(block.get('out_time_us') or block.get('out_time_ms') or 0) / 1_000_000
+            except ValueError:
+                out_time = 0.0
+            try:
+                fps = float(block.get('fps') or 0)
+            except ValueError:
+                fps = 0.0
+            try:
+                speed = float((block.get('speed') or '0').rstrip('x') or 0)
+            except ValueError:
+                speed = 0.0
+            on_progress({'out_time': out_time, 'fps': fps, 'speed': speed})
+            block = {}
+        return ''
+
+    def _get_media_path(self, relative_path, image=False):
+        """Resolve media path from working-assets folder
+
+        *image*: the caller expects a picture, so an image file may be swapped
+        for its export derivative.
+        """
         if not relative_path:
             logger.warning("Empty media path provided")
             return None
 
         if os.path.isabs(relative_path):
             if os.path.exists(relative_path):
-                return relative_path
+                return self._prefer_derivative(relative_path) if image else relative_path
             logger.error("Absolute media path does not exist: {}", relative_path)
             raise FileNotFoundError(f"Media file not found: {relative_path}")
 
@@ -207,11 +596,21 @@ class VideoProcessor:
             if os.path.exists(path):
                 resolved = os.path.abspath(path)
                 logger.debug("Resolved media: {} -> {}", relative_path, resolved)
-                return resolved
+                return self._prefer_derivative(resolved) if image else resolved
 
         logger.error("Media not found. Tried: {}", paths_to_try)
         raise FileNotFoundError(f"Media file not found: {relative_path}")
 
+    def _prefer_derivative(self, path):
+        """Swap an image for its pre-scaled export derivative when one fits this export."""
+        if not self.use_derivatives or not path.lower().endswith(IMAGE_EXTS):
+            return path
+        derived = find_derivative(path, self.width, self.height)
+        if derived:
+            logger.debug("Using derivative for {}: {}", os.path.basename(path), derived)
+            return derived
+        return path
+
     def _create_text_scene(self, scene, temp_dir, index):
         """Create a video clip for a text scene"""
         text_config = scene.get('text', {})
@@ -310,7 +709,7 @@ class VideoProcessor:
         bg_image_path = background.get('image_path')
         if bg_image_path:
             try:
-                full_path = self._get_media_path(bg_image_path)
+                full_path = self._get_media_path(bg_image_path, image=True)
                 bg_image = Image.open(full_path).convert('RGB')
                 bg_image = bg_image.resize((self.width, self.height), Image.Resampling.LANCZOS)
                 logger.debug("Text background image: {}", bg_image_path)
@@ -389,7 +788,59 @@ class VideoProcessor:
 
         return lines
 
+    def _clip_params(self):
+        """Encode settings that change the bytes of a rendered scene clip."""
+        return (self.width, self.height, self.fps, self.codec, self.crf,
+                self.pixel_format, self.preset, self.tune, self.kenburns_engine,
+                USE_FFMPEG_PYTHON)
+
+    def _clip_key(self, scene):
+        """Cache key: media content hash + scene timing/effect + encode settings."""
+        media = scene.get('media', {})
+        media_type = media.get('type', 'image')
+        if media_type == 'text':
+            source = json.dumps(scene.get('text', {}), sort_keys=True)
+        else:
+            source = file_digest(self._get_media_path(media.get('path'), image=True))
+        return hash_key(CLIP_CACHE_VERSION, media_type, source,
+                        scene.get('duration', 3),
+                        json.dumps(scene.get('effect', {}), sort_keys=True),
+                        self._clip_params())
+
     def _create_scene_clip(self, scene, temp_dir, index):
+        """Create a scene clip, reusing a cached render when nothing changed."""
+        cache = self.clip_cache
+        if cache is None:
+            return self._render_scene_clip(scene, temp_dir, index)
+
+        try:
+            key = self._clip_key(scene)
+        except (OSError, TypeError, ValueError):
+            # Unresolvable media — let the renderer raise its usual error
+            return self._render_scene_clip(scene, temp_dir, index)
+
+        # Pinned until process() finishes so eviction can't pull it from under concat
+        cache.pin(key)
+        with self._cache_lock:
+            self._pinned_keys.append(key)
+
+        cached = cache.get(key)
+        if cached:
+            with self._cache_lock:
+                self.cache_hits += 1
+            logger.info("Scene {}: clip cache hit ({})", scene.get('id', index + 1), key[:12])
+            return cached
+
+        with self._cache_lock:
+            self.cache_misses += 1
+        clip = self._render_scene_clip(scene, temp_dir, index)
+        try:
+            return cache.put(key, clip)
+        except OSError as e:
+            logger.warning("Scene {}: could not store clip in cache: {}", scene.get('id', index + 1), e)
+            return clip
+
+    def _render_scene_clip(self, scene, temp_dir, index):
         """Create a video clip for a single scene"""
         media = scene.get('media', {})
         media_type = media.get('type', 'image')
@@ -411,7 +862,7 @@ class VideoProcessor:
         logger.debug("Scene {}: looking for media: {}", scene_id, media_path)
 
         try:
-            full_media_path = self._get_media_path(media_path)
+            full_media_path = self._get_media_path(media_path, image=True)
             logger.debug("Scene {}: resolved media: {}", scene_id, full_media_path)
         except FileNotFoundError as e:
             logger.error("Scene {}: media not found: {}", scene_id, e)
@@ -427,7 +878,7 @@ class VideoProcessor:
         output_path = os.path.join(temp_dir, f"scene_{index:03d}.mp4")
 
         # Detect video source files
-        is_video_source = full_media_path.lower().endswith(('.mp4', '.webm', '.mov', '.avi', '.mkv'))
+        is_video_source = full_media_path.lower().endswith(VIDEO_EXTENSIONS)
 
         if is_video_source:
             self._create_scene_from_video(full_media_path, output_path, duration, effect)
@@ -445,24 +896,88 @@ class VideoProcessor:
 
         return output_path
 
+    # ------------------------------------------------------------------
+    # Shared filter builders (used by per-scene clips and the single graph)
+    # ------------------------------------------------------------------
+
+    def _cover_filters(self, zoom=1.0):
+        """Scale + crop so the source fills the output frame (object-fit: cover).
+
+        *zoom* > 1 covers a frame that much larger, keeping detail for zoompan.
+        """
+        w, h = self.width, self.height
+        if zoom > 1:
+            w, h = math.ceil(w * zoom / 2) * 2, math.ceil(h * zoom / 2) * 2
+        return [
+            f"scale='if(gte(iw/ih,{w}/{h}),-2,{w})':'if(gte(iw/ih,{w}/{h}),{h},-2)'",
+            f"crop={w}:{h}",
+        ]
+
+    @staticmethod
+    def _fade_filters(duration, fade_dur=0.5):
+        return [
+            f"fade=t=in:st=0:d={fade_dur}",
+            f"fade=t=out:st={duration - fade_dur}:d={fade_dur}",
+        ]
+
+    def _zoompan_filter(self, effect, duration):
+        """Cover + zoompan filter (incl. trailing fps) for motion effects, None otherwise.
+
+        The source is cover-cropped to the frame aspect first, so it frames
+        the same as the Pillow engine and image derivatives instead of being
+        stretched by zoompan's output size.
+        """
+        effect_type = effect.get('type', 'static')
+        frames = int(duration * self.fps)
+
+        if effect_type == 'zoom_in':
+            start_scale = effect.get('start_scale', 1.0)
+            end_scale = effect.get('end_scale', 1.2)
+            z_expr = f"'min({start_scale}+on*{(end_scale-start_scale)/frames},{end_scale})'"
+            x_expr = "'iw/2-(iw/zoom/2)'"
+            y_expr = "'ih/2-(ih/zoom/2)'"
+        elif effect_type == 'zoom_out':
+            start_scale = effect.get('start_scale', 1.2)
+            end_scale = effect.get('end_scale', 1.0)
+            z_expr = f"'max({start_scale}-on*{(start_scale-end_scale)/frames},{end_scale})'"
+            x_expr = "'iw/2-(iw/zoom/2)'"
+            y_expr = "'ih/2-(ih/zoom/2)'"
+        elif effect_type == 'pan_left':
+            pan_amount = effect.get('pan_amount', 0.2)
+            z_expr = "'1.1'"
+            x_expr = f"'iw*{pan_amount}*(1-on/{frames})'"
+            y_expr = "'(ih-oh)/2'"
+        elif effect_type == 'pan_right':
+            pan_amount = effect.get('pan_amount', 0.2)
+            z_expr = "'1.1'"
+            x_expr = f"'iw*{pan_amount}*on/{frames}'"
+            y_expr = "'(ih-oh)/2'"
+        else:
+            return None
+
+        zoompan_fps = 25
+        zoompan_frames = int(duration * zoompan_fps)
+        _, _, max_zoom = max((self._kenburns_window(effect, p) for p in (0, 1)), key=lambda w: w[2])
+        return ','.join(self._cover_filters(max_zoom) + [
+            f"zoompan=z={z_expr}:x={x_expr}:y={y_expr}:d={zoompan_frames}"
+            f":s={self.width}x{self.height}:fps={zoompan_fps}", f"fps={self.fps}"])
+
     def _create_video_from_image_ffmpeg(self, image_path, output_path, duration):
         """Create video from static image using ffmpeg-python"""
         logger.debug("ffmpeg-python: image->video {}s {}", duration, image_path)
-        (
+        cmd = (
             ffmpeg
             .input(image_path, loop=1, t=duration)
             .filter('scale', w=self.width, h=self.height)
-            .output(
-                output_path,
-                vcodec=self.codec,
-                pix_fmt=self.pixel_format,
-                r=self.fps,
-                crf=self.crf,
-                preset=self.preset
-            )
+            .filter('setsar', 1)
+            .output(output_path, **self._clip_options())
             .overwrite_output()
-            .run(cmd=FFMPEG_BIN, quiet=True)
+            .compile(cmd=FFMPEG_BIN)
         )
+        result = self._run_ffmpeg(cmd, frames=duration * self.fps)
+        if result.returncode != 0:
+            logger.error("FFmpeg image->video failed: {}", result.stderr[-500:] if result.stderr else "")
+            raise RuntimeError(f"FFmpeg failed: {result.stderr[-200:] if result.stderr else ''}")
 
     def _create_video_from_image_subprocess(self, image_path, output_path, duration):
         """Create video from static image using subprocess"""
@@ -471,16 +986,10 @@ class VideoProcessor:
             '-loop', '1',
             '-i', image_path,
             '-t', str(duration),
-            '-vf', f'scale={self.width}:{self.height}',
-            '-c:v', self.codec,
-            '-pix_fmt', self.pixel_format,
-            '-r', str(self.fps),
-            '-crf', str(self.crf),
-            '-preset', self.preset,
-            output_path
-        ]
+            '-vf', f'scale={self.width}:{self.height},setsar=1',
+        ] + self._clip_args() + [output_path]
         logger.debug("subprocess: image->video cmd={}", ' '.join(cmd[:8]) + '...')
-        result = subprocess.run(cmd, capture_output=True, text=True)
+        result = self._run_ffmpeg(cmd, frames=duration * self.fps)
         if result.returncode != 0:
             logger.error("FFmpeg image->video failed: {}", result.stderr[:500])
             raise RuntimeError(f"FFmpeg failed: {result.stderr[:200]}")
@@ -499,18 +1008,12 @@ class VideoProcessor:
 
     def _create_simple_scene(self, media_path, output_path, duration, effect_type):
         """Fast method for static/fade scenes without zoompan"""
-        filters = [
-            f"scale='if(gte(iw/ih,{self.width}/{self.height}),-2,{self.width})':'if(gte(iw/ih,{self.width}/{self.height}),{self.height},-2)'",
-            f"crop={self.width}:{self.height}",
-            f"fps={self.fps}"
-        ]
+        filters = self._cover_filters() + [f"fps={self.fps}"]
 
         if effect_type == 'fade':
-            fade_dur = 0.5
-            filters.append(f"fade=t=in:st=0:d={fade_dur}")
-            filters.append(f"fade=t=out:st={duration - fade_dur}:d={fade_dur}")
+            filters += self._fade_filters(duration)
 
-        vf = ','.join(filters)
+        vf = ','.join(filters + ['setsar=1'])
 
         cmd = [
             FFMPEG_BIN, '-y',
@@ -518,110 +1021,143 @@ class VideoProcessor:
             '-i', media_path,
             '-t', str(duration),
             '-vf', vf,
-            '-c:v', self.codec,
-            '-pix_fmt', self.pixel_format,
-            '-preset', 'fast',
-            '-crf', str(self.crf),
-            output_path
-        ]
+        ] + self._clip_args() + [output_path]
 
         logger.debug("Simple scene cmd: {}", ' '.join(cmd[:10]) + '...')
-        result = subprocess.run(cmd, capture_output=True, text=True)
+        result = self._run_ffmpeg(cmd, frames=duration * self.fps)
         if result.returncode != 0:
             logger.error("FFmpeg simple scene failed:\nstdout: {}\nstderr: {}",
                           result.stdout[:300], result.stderr[-1000:] if result.stderr else "")
             raise RuntimeError(f"FFmpeg failed: {result.stderr[-500:] if result.stderr else ''}")
 
     def _create_effect_scene(self, media_path, output_path, duration, effect):
-        """Create scene with zoom/pan effects using zoompan filter"""
+        """Create scene with zoom/pan effects (engine per output.kenburns_engine)"""
         effect_type = effect.get('type', 'static')
-        frames = int(duration * self.fps)
+        if self.kenburns_engine == 'pillow' and effect_type in KENBURNS_EFFECTS:
+            self._create_kenburns_scene(media_path, output_path, duration, effect)
+            return
 
-        if effect_type == 'zoom_in':
-            start_scale = effect.get('start_scale', 1.0)
-            end_scale = effect.get('end_scale', 1.2)
-            z_expr = f"'min({start_scale}+on*{(end_scale-start_scale)/frames},{end_scale})'"
-            x_expr = "'iw/2-(iw/zoom/2)'"
-            y_expr = "'ih/2-(ih/zoom/2)'"
-        elif effect_type == 'zoom_out':
-            start_scale = effect.get('start_scale', 1.2)
-            end_scale = effect.get('end_scale', 1.0)
-            z_expr = f"'max({start_scale}-on*{(start_scale-end_scale)/frames},{end_scale})'"
-            x_expr = "'iw/2-(iw/zoom/2)'"
-            y_expr = "'ih/2-(ih/zoom/2)'"
-        elif effect_type == 'pan_left':
-            pan_amount = effect.get('pan_amount', 0.2)
-            z_expr = "'1.1'"
-            x_expr = f"'iw*{pan_amount}*(1-on/{frames})'"
-            y_expr = "'(ih-oh)/2'"
-        elif effect_type == 'pan_right':
-            pan_amount = effect.get('pan_amount', 0.2)
-            z_expr = "'1.1'"
-            x_expr = f"'iw*{pan_amount}*on/{frames}'"
-            y_expr = "'(ih-oh)/2'"
-        else:
+        vf = self._zoompan_filter(effect, duration)
+        if vf is None:
             self._create_simple_scene(media_path, output_path, duration, 'static')
             return
 
-        zoompan_fps = 25
-        zoompan_frames = int(duration * zoompan_fps)
-
-        vf = f"zoompan=z={z_expr}:x={x_expr}:y={y_expr}:d={zoompan_frames}:s={self.width}x{self.height}:fps={zoompan_fps},fps={self.fps}"
-
         cmd = [
             FFMPEG_BIN, '-y',
             '-i', media_path,
-            '-vf', vf,
+            '-vf', vf + ',setsar=1',
             '-t', str(duration),
-            '-c:v', self.codec,
-            '-pix_fmt', self.pixel_format,
-            '-preset', 'fast',
-            '-crf', str(self.crf),
-            output_path
-        ]
+        ] + self._clip_args() + [output_path]
 
         logger.info("Zoompan effect: {} {}s", effect_type, duration)
         logger.debug("Zoompan cmd: {}", ' '.join(cmd))
-        result = subprocess.run(cmd, capture_output=True, text=True)
+        result = self._run_ffmpeg(cmd, frames=duration * self.fps)
         if result.returncode != 0:
             logger.error("FFmpeg zoompan failed:\nstdout: {}\nstderr: {}",
                           result.stdout[:300], result.stderr[-1000:] if result.stderr else "")
             raise RuntimeError(f"FFmpeg failed: {result.stderr[-500:] if result.stderr else ''}")
 
+    # ------------------------------------------------------------------
+    # Ken Burns engine: pre-scaled source, sub-pixel window per output frame
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _kenburns_window(effect, progress):
+        """Visible window at *progress* (0..1) as (left, top, zoom).
+
+        left/top are fractions of the source; the window spans 1/zoom of it.
+        Defaults mirror the zoompan expressions (zoom 1.0 <-> 1.2, pans at 1.1x).
+        """
+        effect_type = effect.get('type', 'static')
+        if effect_type == 'zoom_in':
+            start, end = effect.get('start_scale', 1.0), effect.get('end_scale', 1.2)
+        elif effect_type == 'zoom_out':
+            start, end = effect.get('start_scale', 1.2), effect.get('end_scale', 1.0)
+        else:
+            start = end = 1.1 if effect_type in ('pan_left', 'pan_right') else 1.0
+
+        zoom = max(1.0, start + (end - start) * progress)
+        slack = 1 - 1 / zoom
+        left = top = slack / 2
+        if effect_type in ('pan_left', 'pan_right'):
+            # Travel at most the slack the zoom leaves, centred in it
+            travel = min(effect.get('pan_amount', 0.2), slack)
+            offset = travel * (1 - progress if effect_type == 'pan_left' else progress)
+            left = (slack - travel) / 2 + offset
+        return left, top, zoom
+
+    def _kenburns_frames(self, media_path, effect, duration):
+        """Yield rgb24 frames for a Ken Burns effect at the output fps."""
+        frames = max(1, int(round(duration * self.fps)))
+        windows = [self._kenburns_window(effect, n / max(1, frames - 1)) for n in range(frames)]
+
+        # Pre-scale once (cover fit) to the output size times the deepest zoom,
+        # so every frame is a light resample of a working image, never the source
+        max_zoom = max(zoom for _, _, zoom in windows)
+        work_size = (math.ceil(self.width * max_zoom), math.ceil(self.height * max_zoom))
+        with Image.open(media_path) as src:
+            src.draft('RGB', work_size)     # JPEG: decode at reduced scale
+            work = ImageOps.fit(src.convert('RGB'), work_size, Image.LANCZOS)
+        ww, wh = work.size
+        size = (self.width, self.height)
+
+        def render(window):
+            left, top, zoom = window
+            box = (left * ww, top * wh, (left + 1 / zoom) * ww, (top + 1 / zoom) * wh)
+            return work.resize(size, Image.BILINEAR, box=box).tobytes()
+
+        # Pillow releases the GIL while resampling: keep a few frames in flight
+        threads = max(1, (os.cpu_count() or 2) // self.max_workers)
+        with ThreadPoolExecutor(max_workers=threads, thread_name_prefix='kenburns') as pool:
+            pending = deque()
+            for window in windows:
+                pending.append(pool.submit(render, window))
+                if len(pending) > threads * 2:
+                    yield pending.popleft().result()
+            while pending:
+                yield pending.popleft().result()
+
+    def _create_kenburns_scene(self, media_path, output_path, duration, effect):
+        """Render a zoom/pan scene from Pillow frames piped into the clip encoder."""
+        frames = max(1, int(round(duration * self.fps)))
+        cmd = [
+            FFMPEG_BIN, '-y',
+            '-f', 'rawvideo', '-pix_fmt', 'rgb24',
+            '-s', f'{self.width}x{self.height}', '-framerate', str(self.fps),
+            '-i', 'pipe:0',
+            '-vf', 'setsar=1',
+        ] + self._clip_args() + [output_path]
+
+        logger.info("Ken Burns effect: {} {}s ({} frames)", effect.get('type'), duration, frames)
+        result = self._run_ffmpeg(cmd, frames=frames,
+                                  stdin_chunks=self._kenburns_frames(media_path, effect, duration))
+        if result.returncode != 0:
+            logger.error("FFmpeg Ken Burns encode failed:\nstderr: {}",
+                          result.stderr[-1000:] if result.stderr else "")
+            raise RuntimeError(f"FFmpeg failed: {result.stderr[-500:] if result.stderr else ''}")
+
     def _create_scene_from_video(self, video_path, output_path, duration, effect):
         """Create a scene clip from a video source — trim, scale, and re-encode."""
         effect_type = effect.get('type', 'static')
 
-        filters = [
-            f"scale='if(gte(iw/ih,{self.width}/{self.height}),-2,{self.width})':'if(gte(iw/ih,{self.width}/{self.height}),{self.height},-2)'",
-            f"crop={self.width}:{self.height}",
-            f"fps={self.fps}",
-        ]
+        filters = self._cover_filters() + [f"fps={self.fps}"]
 
         if effect_type == 'fade':
-            fade_dur = 0.5
-            filters.append(f"fade=t=in:st=0:d={fade_dur}")
-            filters.append(f"fade=t=out:st={duration - fade_dur}:d={fade_dur}")
+            filters += self._fade_filters(duration)
 
-        vf = ','.join(filters)
+        vf = ','.join(filters + ['setsar=1'])
 
         cmd = [
             FFMPEG_BIN, '-y',
             '-i', video_path,
             '-t', str(duration),
             '-vf', vf,
-            '-c:v', self.codec,
-            '-pix_fmt', self.pixel_format,
-            '-an',
-            '-preset', 'fast',
-            '-crf', str(self.crf),
-            output_path,
-        ]
+        ] + self._clip_args() + [output_path]
 
         logger.info("Video source scene: {}s effect={} src={}",
                      duration, effect_type, os.path.basename(video_path))
         logger.debug("Video scene cmd: {}", ' '.join(cmd[:12]) + '...')
-        result = subprocess.run(cmd, capture_output=True, text=True)
+        result = self._run_ffmpeg(cmd, frames=duration * self.fps)
         if result.returncode != 0:
             logger.error("FFmpeg video scene failed:\nstdout: {}\nstderr: {}",
                           result.stdout[:300], result.stderr[-1000:] if result.stderr else "")
@@ -630,18 +1166,16 @@ class VideoProcessor:
     def _create_scene_subprocess(self, media_path, output_path, duration, effect):
         """Create scene video with effects using subprocess (fallback)"""
         effect_type = effect.get('type', 'static')
+        if effect_type in KENBURNS_EFFECTS:
+            self._create_effect_scene(media_path, output_path, duration, effect)
+            return
 
-        vf_filters = [
-            f"scale='if(gte(iw/ih,{self.width}/{self.height}),-2,{self.width})':'if(gte(iw/ih,{self.width}/{self.height}),{self.height},-2)'",
-            f"crop={self.width}:{self.height}"
-        ]
+        vf_filters = self._cover_filters()
 
         if effect_type == 'fade':
-            fade_duration = effect.get('fade_duration', 0.5)
-            vf_filters.append(f"fade=t=in:st=0:d={fade_duration}")
-            vf_filters.append(f"fade=t=out:st={duration-fade_duration}:d={fade_duration}")
+            vf_filters += self._fade_filters(duration, effect.get('fade_duration', 0.5))
 
-        vf = ','.join(vf_filters)
+        vf = ','.join(vf_filters + ['setsar=1'])
 
         cmd = [
             FFMPEG_BIN, '-y',
@@ -649,23 +1183,121 @@ class VideoProcessor:
             '-i', media_path,
             '-t', str(duration),
             '-vf', vf,
-            '-c:v', self.codec,
-            '-pix_fmt', self.pixel_format,
-            '-r', str(self.fps),
-            '-crf', str(self.crf),
-            '-preset', self.preset,
-            output_path
-        ]
+        ] + self._clip_args() + [output_path]
         logger.debug("Subprocess scene cmd: {}", ' '.join(cmd[:10]) + '...')
-        result = subprocess.run(cmd, capture_output=True, text=True)
+        result = self._run_ffmpeg(cmd, frames=duration * self.fps)
         if result.returncode != 0:
             logger.error("FFmpeg subprocess scene failed:\nstdout: {}\nstderr: {}",
                           result.stdout[:300], result.stderr[-1000:] if result.stderr else "")
             raise RuntimeError(f"FFmpeg failed: {result.stderr[-500:] if result.stderr else ''}")
 
-    def _concat_scenes(self, scene_clips, output_path):
-        """Concatenate scene clips into final video"""
-        concat_list_path = os.path.join(os.path.dirname(scene_clips[0]), 'concat_list.txt')
+    # ------------------------------------------------------------------
+    # Concat fast path: clips are stream-copied, only odd ones re-encoded
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _probe_clip(path):
+        """Video stream layout of a clip: codec, profile, pix_fmt, size, SAR, fps, timescale.
+
+        Uses ffprobe when available, otherwise parses the `ffmpeg -i` banner.
+        """
+        st = os.stat(path)
+        sig = (os.path.abspath(path), st.st_size, st.st_mtime_ns)
+        with _probe_cache_lock:
+            cached = _probe_cache.get(sig)
+        if cached:
+            return cached
+
+        info = None
+        if FFPROBE_BIN:
+            result = subprocess.run(
+                [FFPROBE_BIN, '-v', 'error', '-select_streams', 'v:0', '-show_entries',
+                 'stream=codec_name,profile,pix_fmt,width,height,sample_aspect_ratio,r_frame_rate,time_base',
+                 '-of', 'json', path],
+                capture_output=True, text=True)
+            streams = json.loads(result.stdout or '{}').get('streams') if result.returncode == 0 else None
+            if streams:
+                st0 = streams[0]
+                num, _, den = st0.get('r_frame_rate', '0/1').partition('/')
+                info = {
+                    'codec': st0.get('codec_name'),
+                    'profile': st0.get('profile'),
+                    'pix_fmt': st0.get('pix_fmt'),
+                    'width': st0.get('width'),
+                    'height': st0.get('height'),
+                    'sar': st0.get('sample_aspect_ratio', '1:1'),
+                    'fps': round(int(num) / int(den or 1), 3) if int(den or 1) else 0.0,
+                    'timescale': int(st0.get('time_base', '1/0').partition('/')[2] or 0),
+                }
+        if info is None:
+            stderr = subprocess.run([FFMPEG_BIN, '-hide_banner', '-i', path],
+                                    capture_output=True, text=True).stderr
+            m = re.search(r"Video: (\w+)(?: \(([^)]*)\))?.*?, (\w+)(?:\([^)]*\))?, (\d+)x(\d+)"
+                          r"(?: \[SAR (\d+:\d+))?.*?, ([\d.]+) fps.*?, ([\d.]+)(k?) tbn", stderr)
+            if not m:
+                return None
+            timescale = float(m.group(8)) * (1000 if m.group(9) else 1)
+            info = {
+                'codec': m.group(1),
+                'profile': m.group(2),
+                'pix_fmt': m.group(3),
+                'width': int(m.group(4)),
+                'height': int(m.group(5)),
+                'sar': m.group(6) or '1:1',
+                'fps': round(float(m.group(7)), 3),
+                'timescale': int(timescale),
+            }
+
+        with _probe_cache_lock:
+            _probe_cache[sig] = info
+        return info
+
+    def _conform_clips(self, scene_clips, temp_dir):
+        """Re-encode only the clips whose stream layout differs from the rest.
+
+        The reference layout is the most common one among the clips (all of
+        them, normally); returns the clip list with odd clips replaced.
+        """
+        workers = min(self.max_workers, len(scene_clips)) or 1
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix='probe') as pool:
+            probes = list(pool.map(self._probe_clip, scene_clips))
+
+        layouts = [tuple(sorted(p.items())) if p else None for p in probes]
+        counts = {}
+        for layout in layouts:
+            if layout is not None:
+                counts[layout] = counts.get(layout, 0) + 1
+        reference = max(counts, key=counts.get) if counts else None
+
+        odd = [i for i, layout in enumerate(layouts) if layout is None or layout != reference]
+        if not odd:
+            return scene_clips, 0
+
+        logger.warning("Concat: {} of {} clips differ in stream layout, re-encoding them: {}",
+                       len(odd), len(scene_clips), [i + 1 for i in odd])
+        conformed = list(scene_clips)
+        for i in odd:
+            logger.debug("  clip {}: {} (expected {})", i + 1, probes[i], dict(reference or ()))
+            conformed[i] = self._conform_clip(scene_clips[i], temp_dir, i)
+        return conformed, len(odd)
+
+    def _conform_clip(self, clip, temp_dir, index):
+        """Re-encode one clip to the export's clip layout."""
+        output_path = os.path.join(temp_dir, f"conform_{index:03d}.mp4")
+        vf = ','.join(self._cover_filters() + [f"fps={self.fps}", 'setsar=1',
+                                               f"format={self.pixel_format}"])
+        cmd = [FFMPEG_BIN, '-y', '-i', clip, '-vf', vf] + self._clip_args() + [output_path]
+        result = self._run_ffmpeg(cmd)
+        if result.returncode != 0:
+            logger.error("FFmpeg conform failed:\nstderr: {}", result.stderr[-1000:] if result.stderr else "")
+            raise RuntimeError(f"FFmpeg conform failed: {result.stderr[-500:] if result.stderr else ''}")
+        return output_path
+
+    def _concat_scenes(self, scene_clips, output_path, temp_dir):
+        """Concatenate scene clips into final video (video stream-copied)."""
+        concat_list_path = os.path.join(temp_dir, 'concat_list.txt')
+
+        scene_clips, conformed = self._conform_clips(scene_clips, temp_dir)
 
         logger.info("Concatenating {} clips", len(scene_clips))
         with open(concat_list_path, 'w') as f:
@@ -676,10 +1308,26 @@ class VideoProcessor:
 
         audio_config = self.export_data.get('audio')
 
+        started = time.perf_counter()
         if USE_FFMPEG_PYTHON:
             self._concat_ffmpeg(concat_list_path, output_path, audio_config)
         else:
             self._concat_subprocess(concat_list_path, output_path, audio_config)
+        elapsed = time.perf_counter() - started
+
+        # What a video re-encode of the whole timeline would have cost at this export's encode speed
+        with self._stats_lock:
+            frames, seconds = self._encoded_frames, self._encode_seconds
+        total_frames = sum(s.get('duration', 3) for s in self.export_data.get('scenes', [])) * self.fps
+        if frames and seconds:
+            estimate = total_frames / (frames / seconds)
+            self.concat_saved_seconds = max(0.0, estimate - elapsed)
+            logger.info("Concat fast path: stream-copied {:.0f} frames in {:.2f}s "
+                        "(re-encode est. {:.1f}s, saved ~{:.1f}s; {} clip(s) conformed)",
+                        total_frames, elapsed, estimate, self.concat_saved_seconds, conformed)
+        else:
+            logger.info("Concat fast path: stream-copied {:.0f} frames in {:.2f}s ({} clip(s) conformed)",
+                        total_frames, elapsed, conformed)
 
     def _concat_ffmpeg(self, concat_list_path, output_path, audio_config):
         """Concatenate using ffmpeg-python (delegates to subprocess for bgMusic mixing)."""
@@ -712,7 +1360,7 @@ class VideoProcessor:
 
                 logger.debug("Audio: vol={} fade_out={}s total_dur={}s", volume, fade_out, total_duration)
 
-                (
+                cmd = (
                     ffmpeg
                     .output(
                         video, audio,
@@ -723,8 +1371,12 @@ class VideoProcessor:
                         shortest=None
                     )
                     .overwrite_output()
-                    .run(cmd=FFMPEG_BIN, quiet=True)
+                    .compile(cmd=FFMPEG_BIN)
                 )
+                result = self._run_ffmpeg(cmd)
+                if result.returncode != 0:
+                    logger.error("FFmpeg concat failed:\nstderr: {}", result.stderr[-1000:] if result.stderr else "")
+                    raise RuntimeError(f"FFmpeg concat failed: {result.stderr[-500:] if result.stderr else ''}")
                 logger.info("Concat with audio completed: {}", output_path)
             except FileNotFoundError as e:
                 logger.warning("Audio file not found, exporting without audio: {}", e)
@@ -736,12 +1388,16 @@ class VideoProcessor:
     def _concat_video_only(self, video_stream, output_path):
         """Concatenate video only (no audio)"""
         logger.debug("Concat video-only: {}", output_path)
-        (
+        cmd = (
             ffmpeg
             .output(video_stream, output_path, vcodec='copy', an=None)
             .overwrite_output()
-            .run(cmd=FFMPEG_BIN, quiet=True)
+            .compile(cmd=FFMPEG_BIN)
         )
+        result = self._run_ffmpeg(cmd)
+        if result.returncode != 0:
+            logger.error("FFmpeg concat (no audio) failed:\nstderr: {}", result.stderr[-1000:] if result.stderr else "")
+            raise RuntimeError(f"FFmpeg concat failed: {result.stderr[-500:] if result.stderr else ''}")
 
     def _resolve_music_path(self, bg_music):
         """Resolve background music file path."""
@@ -765,8 +1421,11 @@ class VideoProcessor:
             logger.warning("BgMusic not found anywhere: {}", music_path)
             return None
 
-    def _build_audio_filter(self, audio_config, bg_music, total_duration):
-        """Build FFmpeg audio filter complex for narration + bgMusic mixing."""
+    def _build_audio_filter(self, audio_config, bg_music, total_duration, first_input=1):
+        """Build FFmpeg audio filter complex for narration + bgMusic mixing.
+
+        Narration is expected at input *first_input*, bgMusic right after it.
+        """
         has_narration = audio_config and audio_config.get('path')
         has_bgmusic = bg_music is not None and self._resolve_music_path(bg_music) is not None
 
@@ -782,12 +1441,12 @@ class VideoProcessor:
             vol = audio_config.get('volume', 1.0)
             fade_out = audio_config.get('fade_out', 0.5)
             fade_start = max(0, total_duration - fade_out)
-            filters.append(f"[1:a]volume={vol},afade=t=out:st={fade_start}:d={fade_out}[narration]")
+            filters.append(f"[{first_input}:a]volume={vol},afade=t=out:st={fade_start}:d={fade_out}[narration]")
             narration_label = '[narration]'
             logger.debug("Audio filter: narration vol={} fade_out={}s", vol, fade_out)
 
         if has_bgmusic:
-            bgm_input_idx = 2 if has_narration else 1
+            bgm_input_idx = first_input + 1 if has_narration else first_input
             vol = bg_music.get('volume', 0.15)
             fade_in = bg_music.get('fade_in', 2.0)
             fade_out = bg_music.get('fade_out', 3.0)
@@ -822,10 +1481,9 @@ class VideoProcessor:
         logger.debug("Audio filter_complex: {}", filter_str)
         return filter_str, out_label
 
-    def _concat_subprocess(self, concat_list_path, output_path, audio_config):
-        """Concatenate using subprocess with optional bgMusic mixing."""
+    def _resolve_audio_inputs(self, audio_config):
+        """Resolve narration + bgMusic files, returns (narration_path, bgmusic_path, bg_music)."""
         bg_music = self.export_data.get('bgMusic')
-        total_duration = self.export_data.get('timeline', {}).get('total_duration', 60)
 
         narration_path = None
         if audio_config and audio_config.get('path'):
@@ -837,6 +1495,25 @@ class VideoProcessor:
                 narration_path = None
 
         bgmusic_path = self._resolve_music_path(bg_music) if bg_music else None
+        return narration_path, bgmusic_path, bg_music
+
+    def _audio_input_args(self, narration_path, bgmusic_path, bg_music):
+        """ffmpeg -i arguments for narration and (optionally looped) bgMusic."""
+        args = []
+        if narration_path:
+            args += ['-i', narration_path]
+        if bgmusic_path:
+            loop_flag = bg_music.get('loop', True)
+            if loop_flag:
+                args += ['-stream_loop', '-1']
+            args += ['-i', bgmusic_path]
+            logger.info("BgMusic input: {} (loop={})", bgmusic_path, loop_flag)
+        return args
+
+    def _concat_subprocess(self, concat_list_path, output_path, audio_config):
+        """Concatenate using subprocess with optional bgMusic mixing."""
+        total_duration = self.export_data.get('timeline', {}).get('total_duration', 60)
+        narration_path, bgmusic_path, bg_music = self._resolve_audio_inputs(audio_config)
 
         if not narration_path and not bgmusic_path:
             logger.info("Concat: no audio, video-only")
@@ -847,7 +1524,7 @@ class VideoProcessor:
                 output_path
             ]
             logger.debug("Concat cmd: {}", ' '.join(cmd))
-            result = subprocess.run(cmd, capture_output=True, text=True)
+            result = self._run_ffmpeg(cmd)
             if result.returncode != 0:
                 logger.error("FFmpeg concat (no audio) failed:\nstderr: {}", result.stderr[-1000:] if result.stderr else "")
                 raise RuntimeError(f"FFmpeg concat failed: {result.stderr[-500:] if result.stderr else ''}")
@@ -855,14 +1532,7 @@ class VideoProcessor:
 
         # Build input list
         cmd = [FFMPEG_BIN, '-y', '-f', 'concat', '-safe', '0', '-i', concat_list_path]
-        if narration_path:
-            cmd += ['-i', narration_path]
-        if bgmusic_path:
-            loop_flag = bg_music.get('loop', True)
-            if loop_flag:
-                cmd += ['-stream_loop', '-1']
-            cmd += ['-i', bgmusic_path]
-            logger.info("BgMusic input: {} (loop={})", bgmusic_path, loop_flag)
+        cmd += self._audio_input_args(narration_path, bgmusic_path, bg_music)
 
         # Build filter complex
         filter_str, out_label = self._build_audio_filter(
@@ -881,7 +1551,7 @@ class VideoProcessor:
         logger.info("Concat with audio: {} inputs, filter_complex={}",
                      2 + (1 if bgmusic_path else 0), bool(filter_str))
         logger.debug("Full concat cmd: {}", ' '.join(cmd))
-        result = subprocess.run(cmd, capture_output=True, text=True)
+        result = self._run_ffmpeg(cmd)
         if result.returncode != 0:
             logger.error("FFmpeg concat failed:\nstdout: {}\nstderr: {}",
                           result.stdout[:300], result.stderr[-1000:] if result.stderr else "")
@@ -987,17 +1657,27 @@ class VideoProcessor:
 
         return lines if lines else [text]
 
-    def _burn_captions(self, video_path, output_path):
-        """Burn caption overlays into the video using FFmpeg drawtext filter."""
+    # ------------------------------------------------------------------
+    # Captions: layout -> timed draw ops -> drawtext filters or Pillow track
+    # ------------------------------------------------------------------
+
+    def _caption_layout(self):
+        """Resolve caption style and lay every caption out as timed draw ops.
+
+        Returns (cs, ops), or (None, []) when there is nothing to draw. An op
+        is a dict with kind 'text' or 'box', pixel geometry, an ffmpeg colour
+        and its [start, end] window. Both caption renderers consume the same
+        ops, so drawtext and the pre-rendered overlay produce the same layout.
+        """
         captions = self.export_data.get('captions')
         if not captions:
             logger.debug("No captions to burn")
-            return video_path
+            return None, []
 
         entries = captions.get('entries', [])
         if not entries:
             logger.debug("Captions present but no entries")
-            return video_path
+            return None, []
 
         style = captions.get('style', {})
         # Support both camelCase and snake_case keys from frontend
@@ -1032,7 +1712,6 @@ class VideoProcessor:
         highlight_color_hex = highlight_color_raw.lstrip('#') if highlight_color_raw.startswith('#') else '4ECDC4'
 
         font_path = self._resolve_font_path(font_family, font_weight)
-        font_path_esc = font_path.replace('\\', '/').replace(':', '\\:')
 
         # Pillow font for word width measurement (used by highlight box mode)
         pil_font = None
@@ -1046,29 +1725,37 @@ class VideoProcessor:
         max_text_width = int(self.width * 0.85)
         line_height = int(font_size * 1.25)
 
-        logger.info("Burning {} captions: font={} {}px color=#{} stroke={}px pos_y={}% max_w={} highlight={}",
+        shadow = None
+        if shadow_color and shadow_color not in ('none', 'transparent'):
+            sc = shadow_color.lstrip('#')
+            if sc.startswith('rgba') or sc.startswith('rgb'):
+                sc = '000000'
+            shadow = (sc, shadow_x, shadow_y)
+
+        stroke = None
+        if stroke_width and stroke_color and stroke_color != 'none':
+            stroke = (stroke_width, stroke_color)
+
+        line_box = None
+        if bg_color and bg_color not in ('transparent', 'none'):
+            line_box = (bg_color.lstrip('#'), max(box_padding_x, box_padding_y, 8))
+
+        cs = {
+            'font_path': font_path,
+            'font_size': font_size,
+            'font_color': font_color,
+            'stroke': stroke,
+            'shadow': shadow,
+            'blend_mode': blend_mode,
+            'diff_strength': float(style.get('diff_strength', style.get('diffStrength', 1.0))),
+            'overlay_strength': float(style.get('overlay_strength', style.get('overlayStrength', 0.0))),
+            'renderer': captions.get('renderer', 'overlay'),
+        }
+
+        logger.info("Laying out {} captions: font={} {}px color=#{} stroke={}px pos_y={}% max_w={} highlight={}",
                      len(entries), font_family, font_size, font_color, stroke_width, position_y, max_text_width,
                      f"{highlight_mode}({highlight_color_hex})" if do_highlight else "off")
 
-        def _escape_text(t):
-            return (t.replace("\\", "\\\\")
-                     .replace("'", "\u2019")
-                     .replace(":", "\\:")
-                     .replace("%", "%%"))
-
-        def _shadow_suffix():
-            if shadow_color and shadow_color not in ('none', 'transparent'):
-                sc = shadow_color.lstrip('#')
-                if sc.startswith('rgba') or sc.startswith('rgb'):
-                    sc = '000000'
-                return f":shadowcolor=#{sc}:shadowx={shadow_x}:shadowy={shadow_y}"
-            return ''
-
-        def _stroke_suffix():
-            if stroke_width and stroke_color and stroke_color != 'none':
-                return f":borderw={stroke_width}:bordercolor=#{stroke_color}"
-            return ''
-
         def _measure_text(text):
             """Measure text width in pixels using Pillow."""
             if pil_font:
@@ -1076,7 +1763,11 @@ class VideoProcessor:
                 return bbox[2] - bbox[0] if bbox else int(len(text) * font_size * 0.6)
             return int(len(text) * font_size * 0.6)
 
-        drawtext_parts = []
+        def _text_op(text, x, y, color, start, end, stroke=True, shadow=True, box=None):
+            return {'kind': 'text', 'text': text, 'x': x, 'y': y, 'color': color,
+                    'start': start, 'end': end, 'stroke': stroke, 'shadow': shadow, 'box': box}
+
+        ops = []
         for i, entry in enumerate(entries):
             text = entry.get('text', '')
             if not text:
@@ -1129,24 +1820,9 @@ class VideoProcessor:
                             break
                         wt = word_timings[word_idx]
                         word_w = _measure_text(wt['text'])
-                        escaped_word = _escape_text(wt['text'])
-
-                        # For each word, render in dim color for full caption duration
-                        # then overlay in highlight color during its active window
-                        dim_color = font_color  # base color (may be dim for single_line_highlight)
 
                         # Dim pass: show word in base color for entire caption
-                        dt_dim = (
-                            f"drawtext=fontfile='{font_path_esc}'"
-                            f":text='{escaped_word}'"
-                            f":fontsize={font_size}"
-                            f":fontcolor=#{dim_color}"
-                            f":x={word_x}"
-                            f":y={line_y}"
-                            f":enable='between(t,{start},{end})'"
-                        )
-                        dt_dim += _stroke_suffix() + _shadow_suffix()
-                        drawtext_parts.append(dt_dim)
+                        ops.append(_text_op(wt['text'], word_x, line_y, font_color, start, end))
 
                         # Highlight pass: override with highlight color during this word's time
                         w_begin = wt['begin']
@@ -1159,93 +1835,115 @@ class VideoProcessor:
                         if highlight_mode == 'box':
                             # Draw colored box behind word, then white text on top
                             box_pad = int(font_size * 0.15)
-                            box_x = word_x - box_pad
-                            box_y = line_y - int(font_size * 0.1) - box_pad
-                            box_w = word_w + box_pad * 2
-                            box_h = int(font_size * 1.1) + box_pad * 2
-
-                            dt_box = (
-                                f"drawbox=x={box_x}:y={box_y}:w={box_w}:h={box_h}"
-                                f":color=#{highlight_color_hex}:t=fill"
-                                f":enable='between(t,{w_begin},{w_active_end})'"
-                            )
-                            drawtext_parts.append(dt_box)
-
-                            # Redraw word in white on top of box
-                            dt_active = (
-                                f"drawtext=fontfile='{font_path_esc}'"
-                                f":text='{escaped_word}'"
-                                f":fontsize={font_size}"
-                                f":fontcolor=#FFFFFF"
-                                f":x={word_x}"
-                                f":y={line_y}"
-                                f":enable='between(t,{w_begin},{w_active_end})'"
-                            )
-                            drawtext_parts.append(dt_active)
+                            ops.append({
+                                'kind': 'box',
+                                'x': word_x - box_pad,
+                                'y': line_y - int(font_size * 0.1) - box_pad,
+                                'w': word_w + box_pad * 2,
+                                'h': int(font_size * 1.1) + box_pad * 2,
+                                'color': highlight_color_hex,
+                                'start': w_begin, 'end': w_active_end,
+                            })
+                            ops.append(_text_op(wt['text'], word_x, line_y, 'FFFFFF', w_begin, w_active_end,
+                                                stroke=False, shadow=False))
                         else:
                             # Text highlight: redraw word in highlight color
-                            dt_active = (
-                                f"drawtext=fontfile='{font_path_esc}'"
-                                f":text='{escaped_word}'"
-                                f":fontsize={font_size}"
-                                f":fontcolor=#{highlight_color_hex}"
-                                f":x={word_x}"
-                                f":y={line_y}"
-                                f":enable='between(t,{w_begin},{w_active_end})'"
-                            )
-                            drawtext_parts.append(dt_active)
+                            ops.append(_text_op(wt['text'], word_x, line_y, highlight_color_hex,
+                                                w_begin, w_active_end, stroke=False, shadow=False))
 
                         word_x += word_w + space_w
                         word_idx += 1
             else:
-                # --- Standard mode: render full lines ---
+                # --- Standard mode: render full lines (x=None -> centered) ---
                 for line_idx, line_text in enumerate(lines):
-                    escaped = _escape_text(line_text)
                     line_y = base_y_px + line_idx * line_height
-
-                    dt = (
-                        f"drawtext=fontfile='{font_path_esc}'"
-                        f":text='{escaped}'"
-                        f":fontsize={font_size}"
-                        f":fontcolor=#{font_color}"
-                        f":x=(w-text_w)/2"
-                        f":y={line_y}"
-                        f":enable='between(t,{start},{end})'"
-                    )
-                    dt += _stroke_suffix()
-
-                    if bg_color and bg_color not in ('transparent', 'none'):
-                        bg_hex = bg_color.lstrip('#')
-                        pad = max(box_padding_x, box_padding_y, 8)
-                        dt += f":box=1:boxcolor=#{bg_hex}:boxborderw={pad}"
-
-                    dt += _shadow_suffix()
-                    drawtext_parts.append(dt)
+                    ops.append(_text_op(line_text, None, line_y, font_color, start, end, box=line_box))
 
             logger.debug("  Caption {}: [{:.1f}s-{:.1f}s] {} line(s) '{}'{}", i + 1, start, end, num_lines, text[:40],
                          f" [highlight {highlight_mode}]" if do_highlight and words else "")
 
-        if not drawtext_parts:
+        if not ops:
             logger.debug("No valid caption entries after filtering")
-            return video_path
-
-        vf_drawtext = ','.join(drawtext_parts)
-        if blend_mode == 'difference':
-            # Read tuned strength values from style config
-            diff_strength = float(style.get('diff_strength', style.get('diffStrength', 1.0)))
-            overlay_strength = float(style.get('overlay_strength', style.get('overlayStrength', 0.0)))
+            return None, []
+        return cs, ops
+
+    @staticmethod
+    def _caption_pass_ops(cs, ops, pass_name):
+        """Derive the ops for one compositing pass of the caption look.
+
+        'main'  — ops as laid out (normal blend mode)
+        'mask'  — difference mask: base colour swapped for diff_strength gray
+        'boost' — overlay_strength brightness pass: white@alpha, no stroke/shadow
+        """
+        if pass_name == 'main':
+            return ops
+        font_color = cs['font_color']
+        if pass_name == 'mask':
+            gray_val = int(cs['diff_strength'] * 255)
+            replacement = f"{gray_val:02x}" * 3  # e.g. 0.59 -> '969696'
+        else:
+            replacement = f"white@{cs['overlay_strength']:.2f}"
+        derived = []
+        for op in ops:
+            op = dict(op)
+            if op['kind'] == 'text':
+                if op['color'] == font_color:
+                    op['color'] = replacement
+                if pass_name == 'boost':
+                    op['stroke'] = op['shadow'] = False
+            derived.append(op)
+        return derived
+
+    # -- drawtext renderer ------------------------------------------------
+
+    def _build_drawtext_filter(self):
+        """Build the caption drawtext filter.
+
+        Returns (vf, is_complex): a plain filter chain, or a filter_complex
+        fragment (difference blend) with one unlabeled input and output.
+        (None, False) when there is nothing to draw.
+        """
+        cs, ops = self._caption_layout()
+        if not ops:
+            return None, False
+
+        font_path_esc = cs['font_path'].replace('\\', '/').replace(':', '\\:')
+        font_size = cs['font_size']
 
-            # Convert diff_strength (0-1) to a gray hex for drawtext fontcolor
-            gray_val = int(diff_strength * 255)
-            diff_hex = f"{gray_val:02x}" * 3  # e.g. 0.59 -> '969696'
+        def _escape_text(t):
+            return (t.replace("\\", "\\\\")
+                     .replace("'", "’")
+                     .replace(":", "\\:")
+                     .replace("%", "%%"))
 
-            # Build drawtext filters with gray font for controlled diff strength
-            # Include shadow on the mask — it gets inverted along with text
-            diff_drawtext_parts = []
-            for dt in drawtext_parts:
-                dt_diff = dt.replace(f":fontcolor=#{font_color}", f":fontcolor=#{diff_hex}")
-                diff_drawtext_parts.append(dt_diff)
-            vf_diff_drawtext = ','.join(diff_drawtext_parts)
+        def _drawtext(op):
+            enable = f":enable='between(t,{op['start']},{op['end']})'"
+            if op['kind'] == 'box':
+                return (f"drawbox=x={op['x']}:y={op['y']}:w={op['w']}:h={op['h']}"
+                        f":color=#{op['color']}:t=fill" + enable)
+            # Hex colours get '#', named ones (boost pass 'white@0.30') don't
+            color = f"#{op['color']}" if re.match(r'[0-9a-fA-F]{6}', op['color']) else op['color']
+            x = op['x'] if op['x'] is not None else '(w-text_w)/2'
+            dt = (
+                f"drawtext=fontfile='{font_path_esc}'"
+                f":text='{_escape_text(op['text'])}'"
+                f":fontsize={font_size}"
+                f":fontcolor={color}"
+                f":x={x}"
+                f":y={op['y']}"
+            ) + enable
+            if op['stroke'] and cs['stroke']:
+                dt += f":borderw={cs['stroke'][0]}:bordercolor=#{cs['stroke'][1]}"
+            if op['box']:
+                dt += f":box=1:boxcolor=#{op['box'][0]}:boxborderw={op['box'][1]}"
+            if op['shadow'] and cs['shadow']:
+                sc, sx, sy = cs['shadow']
+                dt += f":shadowcolor=#{sc}:shadowx={sx}:shadowy={sy}"
+            return dt
+
+        vf_drawtext = ','.join(_drawtext(op) for op in ops)
+        if cs['blend_mode'] == 'difference':
+            vf_diff_drawtext = ','.join(_drawtext(op) for op in self._caption_pass_ops(cs, ops, 'mask'))
 
             # Difference blend: gray text on black → blend with original
             # NOTE: format=gbrp (planar rgb) BEFORE drawbox ensures black is true (0,0,0)
@@ -1258,77 +1956,540 @@ class VideoProcessor:
                   f"[base_rgb][mask]blend=all_mode=difference,format={self.pixel_format}")
 
             # Overlay brightness boost: draw text again with low-alpha white on top
-            if overlay_strength > 0:
-                overlay_dt_parts = []
-                for dt in drawtext_parts:
-                    # White text with controlled alpha, no shadow/stroke
-                    # Supported alpha notation: color@0.X
-                    dt_ov = dt.replace(f":fontcolor=#{font_color}",
-                                       f":fontcolor=white@{overlay_strength:.2f}")
-                    if ':shadowcolor=' in dt_ov:
-                        dt_ov = re.sub(r':shadowcolor=[^:]*:shadowx=[^:]*:shadowy=[^:]*', '', dt_ov)
-                    if ':borderw=' in dt_ov:
-                        dt_ov = re.sub(r':borderw=[^:]*:bordercolor=[^:]*', '', dt_ov)
-                    overlay_dt_parts.append(dt_ov)
-                vf_overlay = ','.join(overlay_dt_parts)
-                vf += f",{vf_overlay}"
+            if cs['overlay_strength'] > 0:
+                vf += ',' + ','.join(_drawtext(op) for op in self._caption_pass_ops(cs, ops, 'boost'))
         else:
             vf = vf_drawtext
 
-        is_complex = blend_mode == 'difference'
-        logger.info("Running caption burn-in ({} drawtext filters, vf len={}, complex={})...",
-                     len(drawtext_parts), len(vf), is_complex)
+        is_complex = cs['blend_mode'] == 'difference'
+        logger.info("Caption filter: {} drawtext filters, vf len={}, complex={}",
+                     len(ops), len(vf), is_complex)
+        return vf, is_complex
+
+    # -- pre-rendered overlay renderer --------------------------------------
 
-        # Write filter to a temp file to avoid Windows command-line length limits
-        vf_file = None
+    @staticmethod
+    def _caption_rgba(color):
+        """ffmpeg colour ('rrggbb', 'rrggbb@0.5', 'white@0.30') -> RGBA tuple."""
+        name, _, alpha = str(color).partition('@')
+        if re.fullmatch(r'[0-9a-fA-F]{6}|[0-9a-fA-F]{8}', name):
+            name = '#' + name
         try:
-            vf_fd, vf_file = tempfile.mkstemp(suffix='.txt', prefix='caption_vf_')
-            with os.fdopen(vf_fd, 'w', encoding='utf-8') as f:
-                f.write(vf)
-
-            if is_complex:
-                # Complex filter graph (split/blend) needs -filter_complex_script
-                cmd = [
-                    FFMPEG_BIN, '-y',
-                    '-i', video_path,
-                    '-filter_complex_script', vf_file,
-                    '-c:v', self.codec,
-                    '-crf', str(self.crf),
-                    '-preset', 'fast',
-                    '-pix_fmt', self.pixel_format,
-                    '-c:a', 'copy',
-                    output_path
-                ]
+            rgba = ImageColor.getrgb(name)
+        except ValueError:
+            logger.warning("Unparseable caption colour '{}', using white", color)
+            rgba = (255, 255, 255)
+        if len(rgba) == 3:
+            rgba = rgba + (255,)
+        if alpha:
+            try:
+                rgba = rgba[:3] + (int(round(float(alpha) * rgba[3])),)
+            except ValueError:
+                pass
+        return rgba
+
+    def _caption_tile(self, op, cs, font):
+        """Rasterise one op into a tight RGBA tile, returns (tile, (x, y)) or None.
+
+        Glyphs are drawn as L masks and coloured afterwards, so antialiased
+        edges composite without dark fringes.
+        """
+        if op['kind'] == 'box':
+            x0, y0 = op['x'], op['y']
+            tile = Image.new('RGBA', (max(1, op['w']), max(1, op['h'])), self._caption_rgba(op['color']))
+            return tile, (x0, y0)
+
+        text = op['text']
+        stroke_w = cs['stroke'][0] if (op['stroke'] and cs['stroke']) else 0
+        bbox = font.getbbox(text)
+        text_w = bbox[2] - bbox[0] if bbox else 0
+        # drawtext x=(w-text_w)/2 for centered lines
+        x = op['x'] if op['x'] is not None else (self.width - text_w) // 2
+        y = op['y']
+        ascent, descent = font.getmetrics()
+
+        # Collect every layer's extent in frame coordinates
+        rects = []
+        tb = font.getbbox(text, anchor='la', stroke_width=stroke_w)
+        rects.append((x + tb[0], y + tb[1], x + tb[2], y + tb[3]))
+        shadow = cs['shadow'] if op['shadow'] else None
+        if shadow:
+            _, sx, sy = shadow
+            rects.append((rects[0][0] + sx, rects[0][1] + sy, rects[0][2] + sx, rects[0][3] + sy))
+        if op['box']:
+            pad = op['box'][1]
+            rects.append((x - pad, y - pad, x + text_w + pad, y + ascent + descent + pad))
+
+        left = int(min(r[0] for r in rects))
+        top = int(min(r[1] for r in rects))
+        right = int(max(r[2] for r in rects)) + 1
+        bottom = int(max(r[3] for r in rects)) + 1
+        size = (max(1, right - left), max(1, bottom - top))
+        ox, oy = x - left, y - top
+
+        def _layer(rgba, mask):
+            if rgba[3] < 255:
+                mask = mask.point(lambda v, a=rgba[3]: v * a // 255)
+            layer = Image.new('RGBA', size, rgba[:3] + (0,))
+            layer.putalpha(mask)
+            return layer
+
+        tile = Image.new('RGBA', size, (0, 0, 0, 0))
+        if op['box']:
+            tile.paste(self._caption_rgba(op['box'][0]),
+                       (ox - op['box'][1], oy - op['box'][1],
+                        ox + text_w + op['box'][1], oy + ascent + descent + op['box'][1]))
+        if shadow:
+            mask = Image.new('L', size, 0)
+            ImageDraw.Draw(mask).text((ox + shadow[1], oy + shadow[2]), text, font=font, fill=255, anchor='la')
+            tile.alpha_composite(_layer(self._caption_rgba(shadow[0]), mask))
+        if stroke_w:
+            mask = Image.new('L', size, 0)
+            ImageDraw.Draw(mask).text((ox, oy), text, font=font, fill=255, anchor='la',
+                                      stroke_width=stroke_w, stroke_fill=255)
+            tile.alpha_composite(_layer(self._caption_rgba(cs['stroke'][1]), mask))
+        mask = Image.new('L', size, 0)
+        ImageDraw.Draw(mask).text((ox, oy), text, font=font, fill=255, anchor='la')
+        tile.alpha_composite(_layer(self._caption_rgba(op['color']), mask))
+        return tile, (left, top)
+
+    @staticmethod
+    def _caption_states(ops):
+        """Split the timeline into intervals where the set of visible ops is constant.
+
+        Returns [(start, end, active_op_indices), ...] covering 0..last op end.
+        One sweep over the start/end events, so the cost follows the number
+        of captions rather than its square.
+        """
+        starts = [float(op['start']) for op in ops]
+        ends = [float(op['end']) for op in ops]
+        bounds = sorted({0.0} | set(starts) | set(ends))
+        # Ops with no duration are never visible
+        shown = [i for i in range(len(ops)) if ends[i] > starts[i]]
+        by_start = sorted(shown, key=starts.__getitem__)
+        by_end = sorted(shown, key=ends.__getitem__)
+        active_set = set()
+        si = ei = 0
+        states = []
+        for a, b in zip(bounds, bounds[1:]):
+            # Visible on (a, b): started at or before a and not yet ended
+            while si < len(by_start) and starts[by_start[si]] <= a:
+                active_set.add(by_start[si])
+                si += 1
+            while ei < len(by_end) and ends[by_end[ei]] <= a:
+                active_set.discard(by_end[ei])
+                ei += 1
+            active = tuple(sorted(active_set))
+            if states and states[-1][2] == active:
+                states[-1] = (states[-1][0], b, active)
             else:
-                # Simple filter chain uses -filter_script:v
-                cmd = [
-                    FFMPEG_BIN, '-y',
-                    '-i', video_path,
-                    '-filter_script:v', vf_file,
-                    '-c:v', self.codec,
-                    '-crf', str(self.crf),
-                    '-preset', 'fast',
-                    '-pix_fmt', self.pixel_format,
-                    '-c:a', 'copy',
-                    output_path
-                ]
-
-            logger.debug("Caption cmd: {} ... (vf file={})", ' '.join(cmd[:6]), vf_file)
-            result = subprocess.run(cmd, capture_output=True, text=True)
-            if result.returncode != 0:
-                logger.error("Caption burn-in failed:\nstdout: {}\nstderr: {}",
-                              result.stdout[:300], result.stderr[-1000:] if result.stderr else "")
-                raise RuntimeError(f"Caption burn-in failed: {result.stderr[-500:] if result.stderr else ''}")
-        finally:
-            if vf_file and os.path.exists(vf_file):
-                try:
-                    os.unlink(vf_file)
-                except OSError:
-                    pass
+                states.append((a, b, active))
+        return states
+
+    def _caption_tiles(self, cs, ops, memo):
+        """Tile per op (None if empty); identical ops are rasterised once via *memo*."""
+        font = memo.get('font')
+        if font is None:
+            try:
+                font = ImageFont.truetype(cs['font_path'], cs['font_size'])
+            except (OSError, IOError):
+                logger.warning("Caption font not loadable by Pillow ({}), using default", cs['font_path'])
+                font = ImageFont.load_default()
+            memo['font'] = font
+
+        tiles = []
+        for op in ops:
+            key = tuple(sorted((k, v) for k, v in op.items() if k not in ('start', 'end')))
+            if key not in memo:
+                memo[key] = self._caption_tile(op, cs, font)
+            tiles.append(memo[key])
+        return tiles
+
+    def _caption_band(self, tiles):
+        """Smallest even-aligned frame region containing every caption tile."""
+        left, top, right, bottom = self.width, self.height, 0, 0
+        for tile in tiles:
+            if tile is None:
+                continue
+            img, (tx, ty) = tile
+            left, top = min(left, tx), min(top, ty)
+            right, bottom = max(right, tx + img.width), max(bottom, ty + img.height)
+        left, top = max(0, left) & ~1, max(0, top) & ~1
+        right, bottom = min(self.width, right), min(self.height, bottom)
+        if right <= left or bottom <= top:
+            return None
+        width = min(self.width - left, (right - left + 1) & ~1)
+        height = min(self.height - top, (bottom - top + 1) & ~1)
+        return left, top, width, height
+
+    def _render_caption_track(self, tiles, states, band, temp_dir, name, opaque=False):
+        """Composite each caption state once and write an ffconcat track.
+
+        Identical states share one PNG; the concat list carries each state's
+        duration, so ffmpeg decodes one image per change instead of redrawing
+        text on every frame. *opaque* renders on black (difference mask).
+        """
+        bx, by, bw, bh = band
+        placed = {}
+        for i, tile in enumerate(tiles):
+            if tile is None:
+                continue
+            img, (tx, ty) = tile
+            # Clip to the band so alpha_composite never gets a negative offset
+            crop = (max(0, bx - tx), max(0, by - ty),
+                    min(img.width, bx + bw - tx), min(img.height, by + bh - ty))
+            if crop[2] <= crop[0] or crop[3] <= crop[1]:
+                continue
+            placed[i] = (img.crop(crop), (tx + crop[0] - bx, ty + crop[1] - by))
+
+        track_dir = os.path.join(temp_dir, f"captions_{name}")
+        os.makedirs(track_dir, exist_ok=True)
+        background = (0, 0, 0, 255) if opaque else (0, 0, 0, 0)
+
+        images = {}
+        for _, _, active in states:
+            if active not in images:
+                images[active] = os.path.join(track_dir, f"state_{len(images):04d}.png")
+
+        def _write_state(active, path):
+            frame = Image.new('RGBA', (bw, bh), background)
+            for i in active:
+                if i in placed:
+                    frame.alpha_composite(placed[i][0], dest=placed[i][1])
+            if opaque:
+                frame = frame.convert('RGB')
+            frame.save(path, compress_level=1)
+
+        # Pillow releases the GIL while drawing/encoding, so states render in parallel
+        with ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix='caption') as pool:
+            for future in [pool.submit(_write_state, active, path) for active, path in images.items()]:
+                future.result()
+
+        lines = ['ffconcat version 1.0']
+        for start, end, active in states:
+            lines.append(f"file '{os.path.basename(images[active])}'")
+            lines.append(f"duration {end - start:.6f}")
+        # concat demuxer ignores the last entry's duration unless the file is repeated
+        lines.append(lines[-2])
+
+        list_path = os.path.join(track_dir, 'track.ffconcat')
+        with open(list_path, 'w', encoding='utf-8') as f:
+            f.write('\n'.join(lines) + '\n')
+        return list_path, len(images)
+
+    def _build_overlay_captions(self, temp_dir, first_input, in_label, out_label):
+        """Pre-render caption tracks and build their compositing graph.
+
+        Returns (input_args, graph) or (None, None) when there is nothing to draw.
+        """
+        cs, ops = self._caption_layout()
+        if not ops:
+            return None, None
+
+        t0 = time.perf_counter()
+        memo = {}
+        band = self._caption_band(self._caption_tiles(cs, ops, memo))
+        if band is None:
+            logger.warning("Captions fall entirely outside the frame, skipping")
+            return None, None
+        bx, by, bw, bh = band
+        states = self._caption_states(ops)
+        difference = cs['blend_mode'] == 'difference'
+
+        tracks = []
+        if difference:
+            tracks.append(('mask', True))
+            if cs['overlay_strength'] > 0:
+                tracks.append(('boost', False))
+        else:
+            tracks.append(('main', False))
+
+        input_args = []
+        unique = 0
+        for name, opaque in tracks:
+            pass_ops = self._caption_pass_ops(cs, ops, name)
+            tiles = self._caption_tiles(cs, pass_ops, memo)
+            list_path, n_images = self._render_caption_track(tiles, states, band, temp_dir, name, opaque)
+            input_args += ['-f', 'concat', '-safe', '0', '-i', list_path]
+            unique += n_images
+
+        if difference:
+            # Difference blend against the band mask padded back to full frame
+            # (blending only the band leaves a visible yuv/rgb seam)
+            graph = [
+                f"{in_label}format=gbrp[cap_base]",
+                f"[{first_input}:v]fps={self.fps},pad={self.width}:{self.height}:{bx}:{by}:black,"
+                f"format=gbrp[cap_mask]",
+            ]
+            # The mask track ends with the last caption; pass the base through after it
+            last = "[cap_base][cap_mask]blend=all_mode=difference:eof_action=pass"
+            if len(tracks) > 1:
+                graph.append(last + "[cap_blended]")
+                last = f"[cap_blended][{first_input + 1}:v]overlay=x={bx}:y={by}:eof_action=pass"
+            graph.append(f"{last},format={self.pixel_format}{out_label}")
+        else:
+            graph = [f"{in_label}[{first_input}:v]overlay=x={bx}:y={by}:eof_action=pass,"
+                     f"format={self.pixel_format}{out_label}"]
+
+        logger.info("Caption overlay: {} ops, {} states, {} images in {}x{} band, rendered in {:.2f}s",
+                    len(ops), len(states), unique, bw, bh, time.perf_counter() - t0)
+        return input_args, ';'.join(graph)
+
+    def _build_caption_graph(self, temp_dir, first_input, in_label, out_label):
+        """Caption compositing for a filter_complex.
+
+        Returns (input_args, graph) with the extra inputs numbered from
+        *first_input*, or (None, None) when there are no captions.
+        """
+        captions = self.export_data.get('captions') or {}
+        if captions.get('renderer', 'overlay') == 'drawtext':
+            vf, _ = self._build_drawtext_filter()
+            if not vf:
+                return None, None
+            # Works for both the plain chain and the split/blend fragment
+            return [], f"{in_label}{vf}{out_label}"
+        return self._build_overlay_captions(temp_dir, first_input, in_label, out_label)
+
+    def _burn_captions(self, video_path, output_path, temp_dir):
+        """Burn captions into the video (pre-rendered overlay, or drawtext)."""
+        input_args, graph = self._build_caption_graph(temp_dir, 1, '[0:v]', '[vout]')
+        if not graph:
+            return video_path
+
+        graph_file = os.path.join(temp_dir, 'caption_graph.txt')
+        with open(graph_file, 'w', encoding='utf-8') as f:
+            f.write(graph)
+
+        cmd = [FFMPEG_BIN, '-y', '-i', video_path] + input_args + [
+            '-filter_complex_script', graph_file,
+            '-map', '[vout]',
+            '-map', '0:a?',
+        ] + self._encode_args() + [
+            '-c:a', 'copy',
+            output_path
+        ]
+        frames = sum(s.get('duration', 3) for s in self.export_data.get('scenes', [])) * self.fps
+
+        logger.info("Running caption burn-in (graph len={})...", len(graph))
+        logger.debug("Caption cmd: {} ... (graph file={})", ' '.join(cmd[:6]), graph_file)
+        result = self._run_ffmpeg(cmd, frames=frames)
+        if result.returncode != 0:
+            logger.error("Caption burn-in failed:\nstdout: {}\nstderr: {}",
+                          result.stdout[:300], result.stderr[-1000:] if result.stderr else "")
+            raise RuntimeError(f"Caption burn-in failed: {result.stderr[-500:] if result.stderr else ''}")
 
         logger.success("Caption burn-in complete: {}", output_path)
         return output_path
 
+    def _release_cached_clips(self):
+        """Unpin this export's cache entries and log its hit/miss counts."""
+        if self.clip_cache is None:
+            return
+        with self._cache_lock:
+            keys, self._pinned_keys = self._pinned_keys, []
+        for key in keys:
+            self.clip_cache.unpin(key)
+        if self.cache_hits or self.cache_misses:
+            logger.info("Clip cache: {} reused, {} rendered", self.cache_hits, self.cache_misses)
+
+    def _render_scenes(self, scenes, temp_dir):
+        """Render scene clips on a bounded worker pool.
+
+        Progress is reported as scenes finish (in any order); the returned
+        clip list keeps the original scene order for the concat list.
+        """
+        total_scenes = len(scenes)
+        workers = min(self.max_workers, total_scenes)
+        scene_clips = [None] * total_scenes
+        completed = 0
+
+        logger.info("Rendering {} scenes with {} worker(s)", total_scenes, workers)
+        self._update_progress(0, f"Rendering {total_scenes} scenes ({workers} in parallel)")
+
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix='scene') as pool:
+            futures = {
+                pool.submit(self._create_scene_clip, scene, temp_dir, i): i
+                for i, scene in enumerate(scenes)
+            }
+            try:
+                for future in as_completed(futures):
+                    i = futures[future]
+                    scene = scenes[i]
+                    scene_type = scene.get('media', {}).get('type', 'image')
+                    try:
+                        scene_clips[i] = future.result()
+                    except ExportCancelled:
+                        raise
+                    except Exception as e:
+                        logger.error("Scene {}/{} FAILED: {}", i + 1, total_scenes, e)
+                        raise
+
+                    completed += 1
+                    logger.info("Scene {}/{} done ({}/{} complete): {}", i + 1, total_scenes,
+                                completed, total_scenes, os.path.basename(scene_clips[i]))
+                    self._update_progress(int((completed / total_scenes) * 80),
+                                          f"Rendered scene {completed}/{total_scenes} ({scene_type})")
+            except BaseException:
+                # Stop queued scenes and kill the ones already running
+                for future in futures:
+                    future.cancel()
+                self._kill_children()
+                raise
+
+        return scene_clips
+
+    # ------------------------------------------------------------------
+    # Single-graph export: every input in one filter_complex, one encode
+    # ------------------------------------------------------------------
+
+    def _graph_scene_input(self, scene, index, temp_dir):
+        """Input args and filter chain for one scene inside the single graph."""
+        media = scene.get('media', {})
+        media_type = media.get('type', 'image')
+        scene_id = scene.get('id', index + 1)
+        duration = scene.get('duration', 3)
+        effect = scene.get('effect', {})
+        effect_type = effect.get('type', 'static')
+
+        if media_type == 'text':
+            text_image_path = os.path.join(temp_dir, f"text_{index:03d}.png")
+            self._render_text_image(scene.get('text', {}), text_image_path)
+            return (['-loop', '1', '-t', str(duration), '-i', text_image_path],
+                    [f"scale={self.width}:{self.height}", f"fps={self.fps}"])
+
+        media_path = media.get('path')
+        if not media_path:
+            logger.error("Scene {} has no media path", scene_id)
+            raise ValueError(f"Scene {scene_id} has no media path")
+        full_media_path = self._get_media_path(media_path, image=True)
+
+        if full_media_path.lower().endswith(VIDEO_EXTENSIONS):
+            chain = self._cover_filters() + [f"fps={self.fps}"]
+            if effect_type == 'fade':
+                chain += self._fade_filters(duration)
+            return ['-t', str(duration), '-i', full_media_path], chain
+
+        zoompan = self._zoompan_filter(effect, duration)
+        if zoompan:
+            # zoompan generates its own frames from a single decoded image
+            return ['-i', full_media_path], [zoompan]
+
+        chain = self._cover_filters() + [f"fps={self.fps}"]
+        if effect_type == 'fade':
+            chain += self._fade_filters(duration)
+        return ['-loop', '1', '-t', str(duration), '-i', full_media_path], chain
+
+    def _build_single_graph(self, scenes, temp_dir):
+        """Build inputs + filter_complex for the whole export.
+
+        Returns (input_args, graph, video_label, audio_label); audio_label is
+        None when there is no narration or bgMusic.
+        """
+        input_args = []
+        graph = []
+        for i, scene in enumerate(scenes):
+            args, chain = self._graph_scene_input(scene, i, temp_dir)
+            duration = scene.get('duration', 3)
+            # Pad short sources (zoompan rounding, short videos) with their last
+            # frame, then cut every segment to its exact slot for concat
+            chain += [f"tpad=stop_mode=clone:stop_duration={duration}",
+                      f"trim=duration={duration}", "setpts=PTS-STARTPTS",
+                      "setsar=1", f"format={self.pixel_format}"]
+            input_args += args
+            graph.append(f"[{i}:v]{','.join(chain)}[v{i}]")
+
+        n = len(scenes)
+        graph.append(''.join(f"[v{i}]" for i in range(n)) + f"concat=n={n}:v=1:a=0[vcat]")
+
+        video_label = '[vcat]'
+        next_input = n
+        caption_inputs, caption_graph = self._build_caption_graph(temp_dir, next_input, '[vcat]', '[vout]')
+        if caption_graph:
+            input_args += caption_inputs
+            next_input += caption_inputs.count('-i')
+            graph.append(caption_graph)
+            video_label = '[vout]'
+
+        audio_label = None
+        audio_config = self.export_data.get('audio')
+        narration_path, bgmusic_path, bg_music = self._resolve_audio_inputs(audio_config)
+        if narration_path or bgmusic_path:
+            total_duration = self.export_data.get('timeline', {}).get('total_duration', 60)
+            input_args += self._audio_input_args(narration_path, bgmusic_path, bg_music)
+            audio_filter, audio_label = self._build_audio_filter(
+                audio_config if narration_path else None,
+                bg_music if bgmusic_path else None,
+                total_duration,
+                first_input=next_input,
+            )
+            if audio_filter:
+                graph.append(audio_filter)
+
+        return input_args, ';'.join(graph), video_label, audio_label
+
+    def _process_single_graph(self, scenes, output_path, temp_dir):
+        """Render the whole export with a single ffmpeg invocation."""
+        self._update_progress(2, "Building filter graph")
+        input_args, graph, video_label, audio_label = self._build_single_graph(scenes, temp_dir)
+
+        graph_file = os.path.join(temp_dir, 'filter_graph.txt')
+        with open(graph_file, 'w', encoding='utf-8') as f:
+            f.write(graph)
+
+        cmd = [FFMPEG_BIN, '-y'] + input_args + [
+            '-filter_complex_script', graph_file,
+            '-map', video_label,
+        ]
+        if audio_label:
+            cmd += ['-map', audio_label, '-c:a', 'aac', '-b:a', '192k', '-shortest']
+        else:
+            cmd += ['-an']
+        cmd += self._encode_args() + ['-r', str(self.fps)]
+        if self.export_mode == 'proxy':
+            # One-second keyframe-aligned fragments behind an empty moov, so a
+            # reader tailing the file can start playback after the first fragment
+            cmd += ['-g', str(self.fps), '-keyint_min', str(self.fps), '-sc_threshold', '0',
+                    '-movflags', 'frag_keyframe+empty_moov+default_base_moof', '-f', 'mp4']
+        cmd.append(output_path)
+
+        video_duration = sum(scene.get('duration', 3) for scene in scenes) or 1
+
+        def on_progress(stats):
+            pct = min(99, 5 + int(stats['out_time'] / video_duration * 94))
+            self._update_progress(pct, f"Encoding {stats['out_time']:.1f}/{video_duration:.1f}s"
+                                       f" ({stats['speed']:.2f}x)")
+
+        logger.info("Single-graph export: {} inputs, graph len={}, audio={}",
+                    len(scenes), len(graph), bool(audio_label))
+        logger.debug("Single-graph cmd: {} (graph file={})", ' '.join(cmd[:8]) + '...', graph_file)
+        self._update_progress(5, f"Encoding {len(scenes)} scenes in one pass")
+        result = self._run_ffmpeg(cmd, on_progress=on_progress, frames=video_duration * self.fps)
+        if result.returncode != 0:
+            logger.error("Single-graph export failed:\nstderr: {}",
+                          result.stderr[-1500:] if result.stderr else "")
+            raise RuntimeError(f"Single-graph export failed: {result.stderr[-500:] if result.stderr else ''}")
+
+    def _process_multi_pass(self, scenes, output_path, temp_dir):
+        """Render scene clips, concat them, then burn captions in a second encode."""
+        scene_clips = self._render_scenes(scenes, temp_dir)
+
+        logger.info("All scenes rendered, concatenating {} clips...", len(scene_clips))
+        self._update_progress(82, "Concatenating scenes and adding audio")
+
+        has_captions = bool(self.export_data.get('captions', {}).get('entries'))
+        if has_captions:
+            concat_output = os.path.join(temp_dir, 'concat_output.mp4')
+            logger.debug("Captions detected — concat to temp before burn-in")
+        else:
+            concat_output = output_path
+
+        self._concat_scenes(scene_clips, concat_output, temp_dir)
+
+        if has_captions:
+            logger.info("Starting caption burn-in...")
+            self._update_progress(90, "Burning captions into video")
+            self._burn_captions(concat_output, output_path, temp_dir)
+
     def process(self, output_path):
         """Process all scenes into a final video"""
         scenes = self.export_data.get('scenes', [])
@@ -1336,60 +2497,38 @@ class VideoProcessor:
             logger.error("No scenes to process")
             raise ValueError("No scenes to process")
 
-        logger.info("=== Export started: {} scenes -> {} ===", len(scenes), output_path)
+        logger.info("=== Export started: {} scenes -> {} ({}) ===", len(scenes), output_path, self.export_mode)
         logger.debug("Frontend dir: {}", self.frontend_dir)
 
         self._update_progress(0, "Starting video processing")
 
         temp_dir = tempfile.mkdtemp(prefix='video_export_')
         logger.debug("Temp directory: {}", temp_dir)
+        started = time.perf_counter()
 
         try:
-            scene_clips = []
-            total_scenes = len(scenes)
-
-            for i, scene in enumerate(scenes):
-                progress = int((i / total_scenes) * 80)
-                scene_type = scene.get('media', {}).get('type', 'image')
-                scene_id = scene.get('id', i + 1)
-                logger.info("Processing scene {}/{} (id={} type={})",
-                            i + 1, total_scenes, scene_id, scene_type)
-                self._update_progress(progress, f"Processing scene {i + 1}/{total_scenes} ({scene_type})")
-
-                try:
-                    clip_path = self._create_scene_clip(scene, temp_dir, i)
-                    scene_clips.append(clip_path)
-                    logger.info("Scene {}/{} done: {}", i + 1, total_scenes, os.path.basename(clip_path))
-                except Exception as e:
-                    logger.error("Scene {}/{} FAILED: {}", i + 1, total_scenes, e)
-                    raise
-
-            logger.info("All scenes rendered, concatenating {} clips...", len(scene_clips))
-            self._update_progress(82, "Concatenating scenes and adding audio")
-
-            has_captions = bool(self.export_data.get('captions', {}).get('entries'))
-            if has_captions:
-                concat_output = os.path.join(temp_dir, 'concat_output.mp4')
-                logger.debug("Captions detected — concat to temp before burn-in")
+            if self.export_mode in ('single_graph', 'proxy'):
+                self._process_single_graph(scenes, output_path, temp_dir)
             else:
-                concat_output = output_path
-
-            self._concat_scenes(scene_clips, concat_output)
+                self._process_multi_pass(scenes, output_path, temp_dir)
 
-            if has_captions:
-                logger.info("Starting caption burn-in...")
-                self._update_progress(90, "Burning captions into video")
-                self._burn_captions(concat_output, output_path)
+            self.wall_seconds = time.perf_counter() - started
+            stats = self.encode_stats()
+            if stats['encode_fps']:
+                _record_profile_fps(self.encode_profile or 'default', stats['encode_fps'])
 
             if os.path.exists(output_path):
                 size = os.path.getsize(output_path)
-                logger.success("=== Export completed: {} ({:.1f} MB) ===", output_path, size / (1024 * 1024))
+                logger.success("=== Export completed: {} ({:.1f} MB) in {:.1f}s, encode {} fps ({}) ===",
+                               output_path, size / (1024 * 1024), self.wall_seconds,
+                               stats['encode_fps'], stats['profile'])
             else:
                 logger.error("=== Export output file missing: {} ===", output_path)
 
             self._update_progress(100, "Export completed")
 
         finally:
+            self._release_cached_clips()
             logger.debug("Cleaning up temp directory: {}", temp_dir)
             shutil.rmtree(temp_dir, ignore_errors=True)
 
@@ -97,8 +97,10 @@ export class ExportAPI {
 
     /**
      * Start a video export job
+     * onPreviewReady(url) fires once for proxy exports, as soon as the
+     * partially encoded file is playable (before the job completes).
      */
-    async startExport(exportData, onProgress, onComplete) {
+    async startExport(exportData, onProgress, onComplete, onPreviewReady = null) {
         console.log('[ExportAPI] Starting export...');
         console.log('[ExportAPI] Project:', exportData.project_id);
         console.log('[ExportAPI] Scenes:', exportData.scenes?.length);
@@ -163,7 +165,7 @@ export class ExportAPI {
             backendLog.info('Export job created', `job=${result.job_id} scenes=${exportData.scenes?.length}`);
 
             // Start polling for status
-            this.startPolling(onProgress, onComplete);
+            this.startPolling(onProgress, onComplete, onPreviewReady);
 
             return result.job_id;
         } catch (error) {
@@ -177,7 +179,7 @@ export class ExportAPI {
     /**
      * Start polling for export status
      */
-    startPolling(onProgress, onComplete) {
+    startPolling(onProgress, onComplete, onPreviewReady = null) {
         if (this.pollInterval) {
             clearInterval(this.pollInterval);
         }
@@ -187,6 +189,7 @@ export class ExportAPI {
         let consecutiveFailures = 0;
         const maxFailures = 5;
         let pollCount = 0;
+        let previewAnnounced = false;
 
         const poll = async () => {
             pollCount++;
@@ -209,6 +212,11 @@ export class ExportAPI {
 
             onProgress(status.progress, status.message);
 
+            if (onPreviewReady && status.proxy && status.preview_ready && !previewAnnounced) {
+                previewAnnounced = true;
+                onPreviewReady(this.getPreviewUrl(this.currentJobId));
+            }
+
             if (status.status === 'completed') {
                 console.log('[ExportAPI] Export completed!');
                 backendLog.info('Export completed', `job=${this.currentJobId}`);
@@ -272,6 +280,20 @@ export class ExportAPI {
         }
     }
 
+    /**
+     * Fetch the named encode profiles (draft / review / final) with measured encode fps
+     */
+    async getEncodeProfiles() {
+        try {
+            const resp = await fetch(`${this.baseUrl}/api/export/profiles`);
+            if (!resp.ok) return {};
+            return await resp.json();
+        } catch (error) {
+            console.error('[ExportAPI] Failed to load encode profiles:', error);
+            return {};
+        }
+    }
+
     /**
      * Cancel current export job
      */
@@ -293,6 +315,13 @@ export class ExportAPI {
         this.currentJobId = null;
     }
 
+    /**
+     * Preview URL (proxy exports stream from here while still encoding)
+     */
+    getPreviewUrl(jobId) {
+        return `${this.baseUrl}/api/export/${jobId || this.currentJobId}/preview`;
+    }
+
     /**
      * Download completed export
      */
@@ -306,7 +335,7 @@ export class ExportAPI {
 /**
  * Prepare comprehensive export data for Python backend
  */
-export function prepareExportData(project, scenes, mediaFolder, audioConfig = null, captionData = null, profile = null, bgMusicConfig = null) {
+export function prepareExportData(project, scenes, mediaFolder, audioConfig = null, captionData = null, profile = null, bgMusicConfig = null, encodeProfile = null) {
     console.log('[prepareExportData] Building export payload...');
     console.log('[prepareExportData] Project:', project?.id, project?.name);
     console.log('[prepareExportData] Scenes:', scenes?.length);
@@ -355,7 +384,11 @@ export function prepareExportData(project, scenes, mediaFolder, audioConfig = nu
             preset: p.preset,
             crf: p.crf,
             format: 'mp4',
-            profile_id: p.id
+            profile_id: p.id,
+            // 'draft' | 'review' | 'final' — null keeps the default encode settings.
+            // 'proxy' selects the progressive low-res preview export instead.
+            encode_profile: encodeProfile,
+            ...(encodeProfile === 'proxy' ? { export_mode: 'proxy' } : {})
         },
 
         // Audio configuration
@@ -161,6 +161,7 @@ const EditorState = {
     captionData: null,      // Caption data { captions: [], style: {} }
     captionsEnabled: false, // Whether caption track is visible
     selectedExportProfile: 'yt_shorts',  // Export profile ID
+    selectedEncodeProfile: null,  // Encode profile: null (default) | 'draft' | 'review' | 'final' | 'proxy'
     bgMusic: null,          // DEPRECATED — use audioTracks (type: 'music')
     bgMusicElement: null,   // DEPRECATED — use audioTracks[].element
     disabledTracks: new Set(), // Keep track of which tracks are disabled
@@ -993,7 +994,8 @@ const elements = {
     cancelExportBtn: document.getElementById('cancel-export'),
     previewExportBtn: document.getElementById('preview-export'),
     openExportFolderBtn: document.getElementById('open-export-folder'),
-    downloadExportBtn: document.getElementById('download-export')
+    downloadExportBtn: document.getElementById('download-export'),
+    exportPreviewPlayer: document.getElementById('export-preview-player')
 };
 
 // ---------------------------------------------------------------------------
@@ -4433,6 +4435,7 @@ function getExportData() {
     console.log('[Editor] Project:', EditorState.project?.id, EditorState.project?.name);
     console.log('[Editor] Scenes:', EditorState.scenes?.length);
     console.log('[Editor] Selected profile:', EditorState.selectedExportProfile);
+    console.log('[Editor] Encode profile:', EditorState.selectedEncodeProfile || 'default');
 
     // Prepare audio config from voice track
     const voiceTrack = getVoiceTrack();
@@ -4479,7 +4482,8 @@ function getExportData() {
         audioConfig,
         EditorState.captionsEnabled && !EditorState.disabledTracks.has('caption') ? EditorState.captionData : null,
         profile,
-        firstMusicTrack || null
+        firstMusicTrack || null,
+        EditorState.selectedEncodeProfile
     );
 
     console.log('[Editor] Export data prepared:', data.scenes?.length, 'scenes,', data.timeline?.total_duration + 's total');
@@ -4528,6 +4532,7 @@ async function exportMp4() {
         stepProgress.style.display = 'none';
         modal.classList.add('active');
     }
+    refreshEncodeProfiles();
     return; // Wait for user to click "Export" button
 }
 
@@ -4587,6 +4592,11 @@ async function startExportWithProfile() {
                 console.error('[Editor] Export failed:', result.error);
                 showExportError(result.error);
             }
+        },
+        // Proxy exports: start playback while the rest is still encoding
+        (previewUrl) => {
+            console.log('[Editor] Proxy preview ready:', previewUrl);
+            showExportPreview(previewUrl);
         }
     );
 
@@ -4618,6 +4628,7 @@ function showExportProgress() {
     if (elements.exportProgressMessage) {
         elements.exportProgressMessage.textContent = 'Starting export...';
     }
+    hideExportPreview();
     if (elements.cancelExportBtn) {
         elements.cancelExportBtn.classList.remove('hidden');
     }
@@ -4632,6 +4643,29 @@ function showExportProgress() {
     }
 }
 
+/**
+ * Play a proxy export in the progress modal while it is still encoding
+ */
+function showExportPreview(url) {
+    const player = elements.exportPreviewPlayer;
+    if (!player) return;
+    player.src = url;
+    player.classList.remove('hidden');
+    player.play().catch(() => {});  // Autoplay may be blocked; controls are shown
+}
+
+/**
+ * Stop and hide the proxy preview player
+ */
+function hideExportPreview() {
+    const player = elements.exportPreviewPlayer;
+    if (!player) return;
+    player.pause();
+    player.removeAttribute('src');
+    player.load();
+    player.classList.add('hidden');
+}
+
 /**
  * Update export progress
  */
@@ -4722,6 +4756,7 @@ function hideExportProgress() {
     if (elements.exportProgressModal) {
         elements.exportProgressModal.classList.remove('active', 'export-complete', 'export-error');
     }
+    hideExportPreview();
     // Reset cancel button text
     if (elements.cancelExportBtn) {
         elements.cancelExportBtn.textContent = 'Cancel';
@@ -4789,6 +4824,16 @@ function setupExportProfileSelector() {
         });
     });
 
+    // Encode quality card click
+    const qualityGrid = document.getElementById('export-quality-grid');
+    qualityGrid?.querySelectorAll('.export-profile-card').forEach(card => {
+        card.addEventListener('click', () => {
+            qualityGrid.querySelectorAll('.export-profile-card').forEach(c => c.classList.remove('active'));
+            card.classList.add('active');
+            EditorState.selectedEncodeProfile = card.dataset.encode || null;
+        });
+    });
+
     // Start export button
     document.getElementById('start-export-btn')?.addEventListener('click', () => {
         startExportWithProfile();
@@ -4800,6 +4845,20 @@ function setupExportProfileSelector() {
     });
 }
 
+/**
+ * Show each encode profile's measured speed on its quality card
+ */
+async function refreshEncodeProfiles() {
+    const grid = document.getElementById('export-quality-grid');
+    if (!grid) return;
+    const profiles = await exportAPI.getEncodeProfiles();
+    grid.querySelectorAll('.export-profile-card[data-encode]').forEach(card => {
+        const profile = profiles[card.dataset.encode];
+        if (!profile) return;
+        card.title = profile.label + (profile.measured_fps ? ` — about ${profile.measured_fps} fps encode on this machine` : '');
+    });
+}
+
 // ---- Background Music ----
 
 function showMusicPicker() {